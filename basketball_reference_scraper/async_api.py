@@ -0,0 +1,195 @@
+import asyncio
+
+import pandas as pd
+
+try:
+    from box_scores import (_page_teams, _parse_box_scores,
+                            _parse_game_box_scores, get_box_score_url,
+                            get_game_id_url)
+    from drafts import _parse_draft_class
+    from lookup import lookup
+    from page import Page, remember_page
+    from pbp import _parse_pbp_table, classify_events, format_df
+    from players import _get_game_logs_url, _parse_game_logs
+    from request_utils import get_wrapper_async
+    from seasons import (_format_schedule, _get_schedule_urls,
+                         _parse_schedule_month)
+    from shot_charts import _parse_shot_chart, _shot_chart_teams
+    from teams import _parse_roster, get_team_url
+    from utils import (_get_stored_scoreboard_index,
+                       _remember_scoreboard_index, find_game_suffix,
+                       game_teams, get_player_suffix, get_scoreboard_url,
+                       parse_game_id, parse_scoreboard_index)
+except:
+    from basketball_reference_scraper.box_scores import (
+        _page_teams, _parse_box_scores, _parse_game_box_scores,
+        get_box_score_url, get_game_id_url)
+    from basketball_reference_scraper.drafts import _parse_draft_class
+    from basketball_reference_scraper.lookup import lookup
+    from basketball_reference_scraper.page import Page, remember_page
+    from basketball_reference_scraper.pbp import (_parse_pbp_table,
+                                                  classify_events, format_df)
+    from basketball_reference_scraper.players import (_get_game_logs_url,
+                                                      _parse_game_logs)
+    from basketball_reference_scraper.request_utils import get_wrapper_async
+    from basketball_reference_scraper.seasons import (_format_schedule,
+                                                      _get_schedule_urls,
+                                                      _parse_schedule_month)
+    from basketball_reference_scraper.shot_charts import (_parse_shot_chart,
+                                                          _shot_chart_teams)
+    from basketball_reference_scraper.teams import _parse_roster, get_team_url
+    from basketball_reference_scraper.utils import (
+        _get_stored_scoreboard_index, _remember_scoreboard_index,
+        find_game_suffix, game_teams, get_player_suffix, get_scoreboard_url,
+        parse_game_id, parse_scoreboard_index)
+
+"""
+    Asyncio versions of the main getters.
+
+    Requests go through get_wrapper_async, so they share the package-wide rate
+    limiter, response cache and connection pool with the blocking getters.
+    Waiting on the rate limiter happens on the event loop while HTML parsing is
+    pushed to the default executor, so other coroutines keep running.
+"""
+
+BASE_URL = "https://www.basketball-reference.com"
+
+
+async def _get_content(url):
+    r = await get_wrapper_async(url)
+    if r.status_code != 200:
+        raise ConnectionError(f"Request to basketball reference failed for {url}")
+    return r.content
+
+
+async def _get_game_suffix(date, team1, team2):
+    index = _get_stored_scoreboard_index(date)
+    if index is None:
+        content = await _get_content(get_scoreboard_url(date))
+        index = await asyncio.to_thread(parse_scoreboard_index, content)
+        _remember_scoreboard_index(date, index, persist=True)
+    return find_game_suffix(index, team1, team2)
+
+
+async def _get_box_score_page(date, team1, team2):
+    url = get_box_score_url(await _get_game_suffix(date, team1, team2))
+    content = await _get_content(url)
+    return remember_page(Page(url, content))
+
+
+async def get_box_scores(date, team1, team2, period="GAME", stat_type="BASIC"):
+    """Async version of box_scores.get_box_scores."""
+    if stat_type not in ["BASIC", "ADVANCED"]:
+        raise ValueError('stat_type must be "BASIC" or "ADVANCED"')
+    date = pd.to_datetime(date)
+    page = await _get_box_score_page(date, team1, team2)
+    return await asyncio.to_thread(
+        _parse_box_scores, page, date, team1, team2, period, stat_type
+    )
+
+
+async def get_game_box_scores(date, team1, team2):
+    """Async version of box_scores.get_game_box_scores."""
+    date = pd.to_datetime(date)
+    page = await _get_box_score_page(date, team1, team2)
+    return await asyncio.to_thread(_parse_game_box_scores, page, date)
+
+
+async def get_box_scores_by_id(game_id, period="GAME", stat_type="BASIC"):
+    """Async version of box_scores.get_box_scores_by_id."""
+    if stat_type not in ["BASIC", "ADVANCED"]:
+        raise ValueError('stat_type must be "BASIC" or "ADVANCED"')
+    date, _ = parse_game_id(game_id)
+    url = get_game_id_url(game_id)
+    page = remember_page(Page(url, await _get_content(url)))
+
+    def parse():
+        away, home = game_teams(_page_teams(page), game_id)
+        return _parse_box_scores(page, date, away, home, period, stat_type)
+
+    return await asyncio.to_thread(parse)
+
+
+async def _get_pbp(suffix, classify):
+    content = await _get_content(f"{BASE_URL}/boxscores/pbp{suffix}")
+
+    def parse():
+        df = format_df(_parse_pbp_table(content))
+        return classify_events(df) if classify else df
+
+    return await asyncio.to_thread(parse)
+
+
+async def get_pbp(date, team1, team2, classify=False):
+    """Async version of pbp.get_pbp."""
+    date = pd.to_datetime(date)
+    suffix = (await _get_game_suffix(date, team1, team2)).replace("/boxscores", "")
+    return await _get_pbp(suffix, classify)
+
+
+async def get_pbp_by_id(game_id, classify=False):
+    """Async version of pbp.get_pbp_by_id."""
+    parse_game_id(game_id)
+    return await _get_pbp(f"/{game_id}.html", classify)
+
+
+async def get_shot_chart(date, team1, team2):
+    """Async version of shot_charts.get_shot_chart."""
+    date = pd.to_datetime(date)
+    suffix = (await _get_game_suffix(date, team1, team2)).replace("/boxscores", "")
+    content = await _get_content(f"{BASE_URL}/boxscores/shot-chart{suffix}")
+    return await asyncio.to_thread(_parse_shot_chart, content, team1, team2)
+
+
+async def get_shot_chart_by_id(game_id):
+    """Async version of shot_charts.get_shot_chart_by_id."""
+    parse_game_id(game_id)
+    content = await _get_content(f"{BASE_URL}/boxscores/shot-chart/{game_id}.html")
+
+    def parse():
+        away, home = game_teams(_shot_chart_teams(content), game_id)
+        return _parse_shot_chart(content, away, home)
+
+    return await asyncio.to_thread(parse)
+
+
+async def get_schedule(season, playoffs=False):
+    """Async version of seasons.get_schedule; month pages are requested concurrently."""
+    responses = await asyncio.gather(
+        *[get_wrapper_async(url) for url in _get_schedule_urls(season)]
+    )
+    months = await asyncio.gather(
+        *[
+            asyncio.to_thread(_parse_schedule_month, r.content)
+            for r in responses
+            if r.status_code == 200
+        ]
+    )
+    df = pd.concat([pd.DataFrame()] + [m for m in months if m is not None])
+    return await asyncio.to_thread(_format_schedule, df, season, playoffs)
+
+
+async def get_roster(team, season_end_year):
+    """Async version of teams.get_roster."""
+    url = get_team_url(team, season_end_year)
+    r = await get_wrapper_async(url)
+    if r.status_code != 200:
+        return None
+    page = remember_page(Page(url, r.content, r.status_code))
+    return await asyncio.to_thread(_parse_roster, page, team, season_end_year)
+
+
+async def get_game_logs(_name, year, playoffs=False, ask_matches=True):
+    """Async version of players.get_game_logs."""
+    name = await asyncio.to_thread(lookup, _name, ask_matches)
+    suffix = (await asyncio.to_thread(get_player_suffix, name, year)).replace(
+        ".html", ""
+    )
+    content = await _get_content(_get_game_logs_url(suffix, year, playoffs))
+    return await asyncio.to_thread(_parse_game_logs, content, playoffs)
+
+
+async def get_draft_class(year):
+    """Async version of drafts.get_draft_class."""
+    content = await _get_content(f"{BASE_URL}/draft/NBA_{year}.html")
+    return await asyncio.to_thread(_parse_draft_class, content)
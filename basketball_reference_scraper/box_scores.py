@@ -3,20 +3,24 @@ from datetime import datetime
 from typing import Dict
 
 import pandas as pd
-from bs4 import BeautifulSoup
-from requests import get
 from unidecode import unidecode
 
 try:
+    from page import PLAYER_LINKS, get_page, link_ids, parse_html, table_to_df
     from players import get_stats
     from request_utils import get_wrapper
-    from utils import format_html, get_game_suffix, remove_accents
+    from utils import (game_teams, get_game_suffix, normalize_player_names,
+                       parse_game_id)
 except:
+    from basketball_reference_scraper.page import (PLAYER_LINKS, get_page,
+                                                   link_ids, parse_html,
+                                                   table_to_df)
     from basketball_reference_scraper.players import get_stats
     from basketball_reference_scraper.request_utils import get_wrapper
-    from basketball_reference_scraper.utils import (format_html,
+    from basketball_reference_scraper.utils import (game_teams,
                                                     get_game_suffix,
-                                                    remove_accents)
+                                                    normalize_player_names,
+                                                    parse_game_id)
 
 
 def get_box_scores(date, team1, team2, period="GAME", stat_type="BASIC"):
@@ -36,40 +40,142 @@ def get_box_scores(date, team1, team2, period="GAME", stat_type="BASIC"):
     if stat_type not in ["BASIC", "ADVANCED"]:
         raise ValueError('stat_type must be "BASIC" or "ADVANCED"')
     date = pd.to_datetime(date)
-    suffix = get_game_suffix(date, team1, team2)
-    url = f"https://www.basketball-reference.com/{suffix}"
-    r = get_wrapper(url)
+    page = _get_box_score_page(date, team1, team2)
+    return _parse_box_scores(page, date, team1, team2, period, stat_type)
 
-    if r.status_code == 200:
-        dfs = []
-        if period == "GAME":
-            if stat_type == "ADVANCED":
-                selectors = [f"box-{team1}-game-advanced", f"box-{team2}-game-advanced"]
-            else:
-                selectors = [f"box-{team1}-game-basic", f"box-{team2}-game-basic"]
-        else:
-            selectors = [
-                f"box-{team1}-{period.lower()}-basic",
-                f"box-{period.lower()}-game-basic",
-            ]
-        soup = BeautifulSoup(r.content, "html.parser")
-        for selector in selectors:
-            table = soup.find("table", {"id": selector})
-            raw_df = pd.read_html(format_html(table))[0]
-            df = _process_box(raw_df)
-            end_year = date.year + 1 if date.month > 9 else date.year
-            if team1 in selector:
-                df["PLAYER"] = df["PLAYER"].apply(
-                    lambda name: remove_accents(name, team1, end_year)
-                )
-            if team2 in selector:
-                df["PLAYER"] = df["PLAYER"].apply(
-                    lambda name: remove_accents(name, team2, end_year)
-                )
-            dfs.append(df)
-        return {team1: dfs[0], team2: dfs[1]}
-    else:
+
+def get_box_score_url(suffix):
+    return f"https://www.basketball-reference.com/{suffix}"
+
+
+def _get_box_score_page(date, team1, team2):
+    return _get_page(get_box_score_url(get_game_suffix(date, team1, team2)))
+
+
+def get_game_id_url(game_id):
+    return get_box_score_url(f"/boxscores/{game_id}.html")
+
+
+def _get_page(url):
+    page = get_page(url)
+    if not page.ok:
         raise ConnectionError(f"Request to basketball reference failed for {url}")
+    return page
+
+
+def _season_end_year(date):
+    return date.year + 1 if date.month > 9 else date.year
+
+
+def _parse_box_table(page, table_id, team, end_year, normalize=True):
+    df = page.get_df(table_id, links=PLAYER_LINKS)
+    if df is None:
+        raise ValueError(f"{page.url} has no table {table_id}")
+    df = _process_box(df)
+    player_ids = link_ids(df.pop("PLAYER_HREF"))
+    if normalize:
+        # names with accents are matched to the roster, which costs a team page fetch
+        df["PLAYER"] = normalize_player_names(df["PLAYER"], team, end_year, player_ids)
+    else:
+        df.insert(0, "PLAYER_ID", player_ids)
+    return df
+
+
+def _parse_box_scores(page, date, team1, team2, period, stat_type):
+    # advanced stats only exist for the whole game
+    stat_type = stat_type if period == "GAME" else "BASIC"
+    end_year = _season_end_year(date)
+    return {
+        team: _parse_box_table(
+            page, f"box-{team}-{period.lower()}-{stat_type.lower()}", team, end_year
+        )
+        for team in (team1, team2)
+    }
+
+
+"""
+    Everything on a box score page at once: basic and advanced box scores of
+    both teams for every period the page has, the line score and the four
+    factors. The page is fetched and parsed once, so a game costs the
+    scoreboard lookup and a single box score request.
+"""
+
+BOX_TABLE_RE = re.compile(r"^box-(\w+)-(game|q\d|h\d|ot\d+)-(basic|advanced)$")
+
+
+def _parse_team_table(page, table_id):
+    df = page.get_df(table_id)
+    if df is None:
+        return None
+    return df.rename(columns={df.columns[0]: "TEAM"})
+
+
+def _parse_game_box_scores(page, date):
+    # names are kept as shown on the page, with the player IDs from the row links
+    end_year = _season_end_year(date)
+    box_scores = {"BASIC": {}, "ADVANCED": {}}
+    for table_id in page.table_ids():
+        match = BOX_TABLE_RE.match(table_id)
+        if match is None:
+            continue
+        team, period, stat_type = match.groups()
+        periods = box_scores[stat_type.upper()]
+        periods.setdefault(period.upper(), {})[team] = _parse_box_table(
+            page, table_id, team, end_year, normalize=False
+        )
+    box_scores["LINE_SCORE"] = _parse_team_table(page, "line_score")
+    box_scores["FOUR_FACTORS"] = _parse_team_table(page, "four_factors")
+    return box_scores
+
+
+def get_game_box_scores(date, team1, team2):
+    """Every box score of a game, plus its line score and four factors, from one page fetch.
+
+    Args:
+        date (str): The date of the game in 'YYYY-MM-DD' format.
+        team1 (str): The abbreviation of one team.
+        team2 (str): The abbreviation of the other team.
+
+    Returns:
+        dict: 'BASIC' and 'ADVANCED' map each period on the page ('GAME', 'Q1'-'Q4', 'H1',
+        'H2', 'OT1', ...) to a dictionary of team -> box score, shaped as get_box_scores returns
+        them plus a leading PLAYER_ID column. Names are kept as shown on the page, so no roster
+        is fetched. 'LINE_SCORE' and 'FOUR_FACTORS' are DataFrames with one row per team, or
+        None if the page does not have them.
+    """
+    date = pd.to_datetime(date)
+    page = _get_box_score_page(date, team1, team2)
+    return _parse_game_box_scores(page, date)
+
+
+def _page_teams(page):
+    # box score tables come visitor first
+    teams = []
+    for table_id in page.table_ids():
+        match = BOX_TABLE_RE.match(table_id)
+        if match and match.group(1) not in teams:
+            teams.append(match.group(1))
+    return teams
+
+
+def get_box_scores_by_id(game_id, period="GAME", stat_type="BASIC"):
+    """
+    Get the box scores of a game by its ID, without looking the game up on the scoreboard.
+
+    Args:
+        game_id (str): The game ID, e.g. '202001060DEN' from the GAME_ID column of get_schedule.
+        period (str, optional): The period of the game to retrieve stats for. Defaults to 'GAME'.
+        stat_type (str, optional): The type of stats to retrieve. Must be 'BASIC' or 'ADVANCED'. Defaults to 'BASIC'.
+
+    Returns:
+        dict: A dictionary containing the box scores of the visitor and the home team.
+    """
+    if stat_type not in ["BASIC", "ADVANCED"]:
+        raise ValueError('stat_type must be "BASIC" or "ADVANCED"')
+    date, _ = parse_game_id(game_id)
+    page = _get_page(get_game_id_url(game_id))
+    away, home = game_teams(_page_teams(page), game_id)
+    return _parse_box_scores(page, date, away, home, period, stat_type)
 
 
 def _process_box(df):
@@ -81,12 +187,29 @@ def _process_box(df):
     Returns:
         DataFrame: processed box score
     """
-    df.columns = list(map(lambda x: x[1], list(df.columns)))
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(1)
     df.rename(columns={"Starters": "PLAYER"}, inplace=True)
     if "Tm" in df:
         df.rename(columns={"Tm": "TEAM"}, inplace=True)
-    reserve_index = df[df["PLAYER"] == "Reserves"].index[0]
-    df = df.drop(reserve_index).reset_index().drop("index", axis=1)
+    # the 'Reserves' header row is only there when table_to_df keeps header rows
+    df = df[df["PLAYER"] != "Reserves"].reset_index(drop=True)
+    return df
+
+
+def _parse_all_star_table(table):
+    # header rows are kept so the rows line up with what read_html produced
+    df = _process_box(table_to_df(table, skip_headers=False))
+    # drop team totals row (always last), totals row
+    totals_index = df[df["MP"] == "Totals"].index[0]
+    df = df.drop(totals_index).reset_index().drop("index", axis=1)
+    df = df.drop(df.tail(1).index).reset_index().drop("index", axis=1)
+    df["PLAYER"] = df["PLAYER"].apply(lambda x: unidecode(x))
+    # the header and totals rows kept every stat column as text
+    for column in df.columns.drop(["PLAYER", "TEAM"], errors="ignore"):
+        values = pd.to_numeric(df[column], errors="coerce")
+        if values.notna().sum() == df[column].notna().sum():
+            df[column] = values
     return df
 
 
@@ -108,19 +231,12 @@ def get_all_star_box_score(year: int):
     r = get_wrapper(f"https://www.basketball-reference.com/allstar/NBA_{year}.html")
     if r.status_code == 200:
         dfs = []
-        soup = BeautifulSoup(r.content, "html.parser")
+        soup = parse_html(r.content)
         team_names = list(
             map(lambda el: el.text, soup.select("div.section_heading > h2")[1:3])
         )
         for table in soup.find_all("table")[1:3]:
-            raw_df = pd.read_html(format_html(table))[0]
-            df = _process_box(raw_df)
-            # drop team totals row (always last), totals row
-            totals_index = df[df["MP"] == "Totals"].index[0]
-            df = df.drop(totals_index).reset_index().drop("index", axis=1)
-            df = df.drop(df.tail(1).index).reset_index().drop("index", axis=1)
-            df["PLAYER"] = df["PLAYER"].apply(lambda x: unidecode(x))
-            dfs.append(df)
+            dfs.append(_parse_all_star_table(table))
         res: Dict[str, pd.DataFrame] = {team_names[0]: dfs[0], team_names[1]: dfs[1]}
         # add DNPs for all-star roster purposes
         # the all-star team each dnp is on is in parens. for some reasons this captures parens
@@ -0,0 +1,450 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from requests import RequestException
+
+try:
+    from box_scores import _page_teams, _process_box, get_game_id_url
+    from cache import current_season_end_year
+    from constants import TEAM_TO_TEAM_ABBR
+    from page import PLAYER_LINKS, Page, link_ids
+    from pbp import _parse_pbp_table, format_df
+    from request_utils import get_wrapper
+    from retry import CircuitOpenError
+    from seasons import _format_schedule, _get_schedule_months
+except:
+    from basketball_reference_scraper.box_scores import (_page_teams,
+                                                         _process_box,
+                                                         get_game_id_url)
+    from basketball_reference_scraper.cache import current_season_end_year
+    from basketball_reference_scraper.constants import TEAM_TO_TEAM_ABBR
+    from basketball_reference_scraper.page import PLAYER_LINKS, Page, link_ids
+    from basketball_reference_scraper.pbp import _parse_pbp_table, format_df
+    from basketball_reference_scraper.request_utils import get_wrapper
+    from basketball_reference_scraper.retry import CircuitOpenError
+    from basketball_reference_scraper.seasons import (_format_schedule,
+                                                      _get_schedule_months)
+
+"""
+    Season-scale harvesting into partitioned columnar datasets.
+
+    Games and their IDs are taken from the schedule. Each game is fetched on
+    the calling thread while the previous one is parsed and written on a
+    worker thread, so at most two games are held in memory at once. Every
+    game becomes its own file under a SEASON=... directory, written
+    atomically, and a checkpoint file records finished and failed games so an
+    interrupted harvest picks up where it stopped.
+"""
+
+BASE_URL = "https://www.basketball-reference.com"
+KEY_COLUMNS = ["GAME_ID", "DATE", "VISITOR", "HOME"]
+CHECKPOINT_FILE = "_checkpoint.json"
+FILE_FORMATS = {"parquet": ".parquet", "feather": ".arrow"}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "Bulk harvesting writes Parquet/Arrow files and requires pyarrow, "
+            "installed with the 'bulk' extra: "
+            "pip install 'basketball-reference-scraper[bulk]'"
+        )
+    return pyarrow
+
+
+def season_end_year(date):
+    return current_season_end_year(pd.to_datetime(date))
+
+
+def _schedule_games(schedule):
+    # games that have not been played yet have no box score link
+    schedule = schedule[schedule["GAME_ID"].notna()]
+    home = schedule["GAME_ID"].str[-3:]
+    # every team hosts games, so home game IDs give each team name its abbreviation
+    abbreviations = dict(zip(schedule["HOME"], home))
+    visitor = schedule["VISITOR"].map(abbreviations)
+    visitor = visitor.fillna(schedule["VISITOR"].str.upper().map(TEAM_TO_TEAM_ABBR))
+    return pd.DataFrame(
+        {
+            "GAME_ID": schedule["GAME_ID"],
+            "DATE": pd.to_datetime(schedule["DATE"]),
+            "VISITOR": visitor,
+            "HOME": home,
+        },
+        columns=KEY_COLUMNS,
+    )
+
+
+def _get_games(season=None, start_date=None, end_date=None, playoffs=False):
+    if season is not None:
+        months = _get_schedule_months(season)
+        return _schedule_games(_format_schedule(months, season, playoffs))
+    start_date = pd.to_datetime(start_date)
+    end_date = pd.to_datetime(end_date or start_date)
+    frames = []
+    for year in range(season_end_year(start_date), season_end_year(end_date) + 1):
+        # each month page is fetched once for both the regular season and the playoffs
+        months = _get_schedule_months(year)
+        for in_playoffs in (False, True):
+            frames.append(_schedule_games(_format_schedule(months, year, in_playoffs)))
+    games = pd.concat(frames)
+    games = games[(games["DATE"] >= start_date) & (games["DATE"] <= end_date)]
+    return games.sort_values(["DATE", "GAME_ID"], kind="stable")
+
+
+def iter_games(season=None, start_date=None, end_date=None, playoffs=False):
+    """Yield the games played in a season or date range.
+
+    Game IDs come straight from the schedule, so no scoreboard page is fetched.
+
+    Args:
+        season (int, optional): Season end year. Either season or start_date is required.
+        start_date (str | datetime, optional): First date of the range.
+        end_date (str | datetime, optional): Last date of the range (inclusive). Defaults to start_date.
+        playoffs (bool, optional): With season, harvest the playoffs instead of the regular season. Defaults to False.
+
+    Yields:
+        dict: GAME_ID (e.g. '202001060DEN'), DATE, VISITOR and HOME team abbreviations.
+    """
+    if season is None and start_date is None:
+        raise ValueError("Either season or start_date is required")
+    yield from _get_games(season, start_date, end_date, playoffs).to_dict("records")
+
+
+class Checkpoint:
+    def __init__(self, path):
+        self.path = path
+        self.done = set()
+        self.failed = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path) as f:
+                state = json.load(f)
+            self.done = set(state.get("done", []))
+            self.failed = state.get("failed", {})
+
+    def is_done(self, game_id):
+        return game_id in self.done
+
+    def mark_done(self, game_id):
+        with self._lock:
+            self.done.add(game_id)
+            self.failed.pop(game_id, None)
+            self._save()
+
+    def mark_failed(self, game_id, error):
+        with self._lock:
+            self.failed[game_id] = str(error)
+            self._save()
+
+    def _save(self):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"done": sorted(self.done), "failed": self.failed}, f)
+        os.replace(tmp, self.path)
+
+
+def _game_path(path, game, file_format):
+    season = season_end_year(game["DATE"])
+    directory = os.path.join(path, f"SEASON={season}")
+    return os.path.join(directory, f"{game['GAME_ID']}{FILE_FORMATS[file_format]}")
+
+
+def _write_game(df, game, path, file_format):
+    pa = _require_pyarrow()
+    for column in reversed(KEY_COLUMNS):
+        df.insert(0, column, game[column])
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    target = _game_path(path, game, file_format)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = f"{target}.tmp"
+    if file_format == "parquet":
+        pa.parquet.write_table(table, tmp)
+    else:
+        pa.feather.write_feather(table, tmp)
+    os.replace(tmp, target)
+
+
+def _fetch(url):
+    r = get_wrapper(url)
+    if r.status_code != 200:
+        raise ConnectionError(f"Request to basketball reference failed for {url}")
+    return r.content
+
+
+def _fetch_game(url):
+    """Fetch a game page for a harvest loop.
+
+    A failed request (bad status, dropped connection, timeout after the
+    retries) is returned so the loop can record the game and move on. An open
+    circuit breaker is raised, since every following request would fail too.
+
+    Returns:
+        tuple: the page content and None, or None and the error.
+    """
+    try:
+        return _fetch(url), None
+    except CircuitOpenError:
+        raise
+    except (ConnectionError, RequestException) as e:
+        return None, e
+
+
+def harvest(games, get_url, parse, path, file_format="parquet", resume=True):
+    """Fetch, parse and write one file per game, skipping checkpointed games.
+
+    Args:
+        games (iterable): Game dicts as yielded by iter_games.
+        get_url (callable): Maps a game dict to the URL to fetch.
+        parse (callable): Maps (content, game) to a DataFrame.
+        path (str): Root directory of the dataset.
+        file_format (str, optional): 'parquet' or 'feather'. Defaults to 'parquet'.
+        resume (bool, optional): Skip games recorded as done in the checkpoint. Defaults to True.
+
+    Returns:
+        dict: counts of 'written' and 'skipped' games and the 'failed' games with their errors.
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"file_format must be one of {list(FILE_FORMATS)}")
+    _require_pyarrow()
+    os.makedirs(path, exist_ok=True)
+    checkpoint_path = os.path.join(path, CHECKPOINT_FILE)
+    if not resume and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    checkpoint = Checkpoint(checkpoint_path)
+    summary = {"written": 0, "skipped": 0}
+
+    def process(content, game):
+        try:
+            _write_game(parse(content, game), game, path, file_format)
+        except Exception as e:
+            checkpoint.mark_failed(game["GAME_ID"], e)
+        else:
+            checkpoint.mark_done(game["GAME_ID"])
+            summary["written"] += 1
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = None
+        for game in games:
+            if checkpoint.is_done(game["GAME_ID"]):
+                summary["skipped"] += 1
+                continue
+            content, error = _fetch_game(get_url(game))
+            if error is not None:
+                checkpoint.mark_failed(game["GAME_ID"], error)
+                continue
+            # keep at most one game waiting to be written
+            if pending is not None:
+                pending.result()
+            pending = executor.submit(process, content, game)
+        if pending is not None:
+            pending.result()
+    summary["failed"] = dict(checkpoint.failed)
+    return summary
+
+
+def load_dataset(path, columns=None, filters=None):
+    """Read a harvested dataset back into a single DataFrame.
+
+    Args:
+        path (str): Root directory of the dataset.
+        columns (list, optional): Columns to read. Defaults to all.
+        filters (list, optional): pyarrow filter expressions, e.g. [('HOME', '=', 'DEN')].
+
+    Returns:
+        DataFrame: the rows of every game, with the SEASON partition as a column.
+    """
+    pa = _require_pyarrow()
+    import pyarrow.dataset
+
+    file_format = "parquet"
+    for _, _, files in os.walk(path):
+        if any(f.endswith(FILE_FORMATS["feather"]) for f in files):
+            file_format = "feather"
+            break
+    dataset = pa.dataset.dataset(path, format=file_format, partitioning="hive")
+    if filters is not None:
+        filters = pa.parquet.filters_to_expression(filters)
+    return dataset.to_table(columns=columns, filter=filters).to_pandas()
+
+
+def _get_pbp_url(game):
+    return f"{BASE_URL}/boxscores/pbp/{game['GAME_ID']}.html"
+
+
+def _parse_pbp(content, game):
+    df = format_df(_parse_pbp_table(content))
+    # team-named columns differ per game; name them by side so every file shares a schema
+    df.columns = list(df.columns[:4]) + [
+        "VISITOR_ACTION",
+        "HOME_ACTION",
+        "VISITOR_SCORE",
+        "HOME_SCORE",
+    ]
+    return df
+
+
+def harvest_pbp(
+    path,
+    season=None,
+    start_date=None,
+    end_date=None,
+    playoffs=False,
+    file_format="parquet",
+    resume=True,
+):
+    """Harvest the play-by-play of every game in a season or date range.
+
+    Args:
+        path (str): Root directory of the dataset.
+        season (int, optional): Season end year. Either season or start_date is required.
+        start_date (str | datetime, optional): First date of the range.
+        end_date (str | datetime, optional): Last date of the range (inclusive). Defaults to start_date.
+        playoffs (bool, optional): With season, harvest the playoffs instead of the regular season. Defaults to False.
+        file_format (str, optional): 'parquet' or 'feather'. Defaults to 'parquet'.
+        resume (bool, optional): Skip games already harvested into path. Defaults to True.
+
+    Returns:
+        dict: counts of 'written' and 'skipped' games and the 'failed' games with their errors.
+    """
+    games = iter_games(season, start_date, end_date, playoffs)
+    return harvest(games, _get_pbp_url, _parse_pbp, path, file_format, resume)
+
+
+"""
+    Player-game fact table: one row per player and game with the basic and
+    advanced box score stats side by side. Player IDs come from the box score
+    links, so no roster pages are fetched to normalize names, and every stat
+    column gets the same type in every game so the files form one dataset.
+"""
+
+BOX_SCORE_COLUMNS = [
+    "TEAM",
+    "OPPONENT",
+    "PLAYER_ID",
+    "PLAYER",
+    "STARTER",
+    "STATUS",
+]
+COUNT_COLUMNS = [
+    "FG",
+    "FGA",
+    "3P",
+    "3PA",
+    "FT",
+    "FTA",
+    "ORB",
+    "DRB",
+    "TRB",
+    "AST",
+    "STL",
+    "BLK",
+    "TOV",
+    "PF",
+    "PTS",
+    "+/-",
+]
+
+
+def _minutes(mp):
+    parts = mp.str.extract(r"^(\d+)(?::(\d\d))?$").astype(float)
+    return parts[0] + parts[1].fillna(0) / 60
+
+
+def _count_starters(table):
+    # starters are the rows above the 'Reserves' header row
+    count = 0
+    for tr in table.find("tbody").find_all("tr", recursive=False):
+        if "thead" in tr.get("class", []):
+            break
+        count += 1
+    return count
+
+
+def _player_rows(page, team, stat_type):
+    df = page.get_df(f"box-{team}-game-{stat_type}", links=PLAYER_LINKS)
+    if df is None:
+        return None
+    df = _process_box(df)
+    df.insert(0, "PLAYER_ID", link_ids(df.pop("PLAYER_HREF")))
+    # the team totals row has no player link
+    return df[df["PLAYER_ID"].notna()].reset_index(drop=True)
+
+
+def _parse_box_score_game(content, game):
+    page = Page(_get_box_score_game_url(game), content)
+    teams = _page_teams(page)
+    frames = []
+    for team in teams:
+        df = _player_rows(page, team, "basic")
+        advanced = _player_rows(page, team, "advanced")
+        if advanced is not None:
+            extra = [c for c in advanced.columns if c not in df.columns]
+            df = df.merge(advanced[["PLAYER_ID"] + extra], on="PLAYER_ID", how="left")
+        df.insert(0, "TEAM", team)
+        df.insert(1, "OPPONENT", next((t for t in teams if t != team), None))
+        starters = _count_starters(page.get_table(f"box-{team}-game-basic"))
+        df.insert(4, "STARTER", df.index < starters)
+        # 'Did Not Play' and similar notes fill every stat column of the row
+        played = df["MP"].astype(str).str.match(r"^\d+(:\d\d)?$")
+        df.insert(5, "STATUS", df["MP"].where(~played).astype(object))
+        frames.append(df)
+    df = pd.concat(frames, ignore_index=True)
+    stats = [c for c in df.columns if c not in BOX_SCORE_COLUMNS]
+    played = df["STATUS"].isna()
+    df["MP"] = _minutes(df["MP"].where(played).astype(str))
+    for column in stats:
+        if column == "MP":
+            continue
+        values = pd.to_numeric(df[column].where(played), errors="coerce")
+        df[column] = values.astype("Int16" if column in COUNT_COLUMNS else float)
+    df["PLAYER_ID"] = df["PLAYER_ID"].astype(str)
+    df["PLAYER"] = df["PLAYER"].astype(str)
+    df["STATUS"] = df["STATUS"].astype("string")
+    return df
+
+
+def _get_box_score_game_url(game):
+    # the same URL get_box_scores and get_box_scores_by_id fetch
+    return get_game_id_url(game["GAME_ID"])
+
+
+def harvest_box_scores(
+    path,
+    season=None,
+    start_date=None,
+    end_date=None,
+    playoffs=False,
+    file_format="parquet",
+    resume=True,
+):
+    """Harvest a player-game fact table from the box scores of a season or date range.
+
+    Args:
+        path (str): Root directory of the dataset.
+        season (int, optional): Season end year. Either season or start_date is required.
+        start_date (str | datetime, optional): First date of the range.
+        end_date (str | datetime, optional): Last date of the range (inclusive). Defaults to start_date.
+        playoffs (bool, optional): With season, harvest the playoffs instead of the regular season. Defaults to False.
+        file_format (str, optional): 'parquet' or 'feather'. Defaults to 'parquet'.
+        resume (bool, optional): Skip games already harvested into path. Defaults to True.
+
+    Returns:
+        dict: counts of 'written' and 'skipped' games and the 'failed' games with their errors.
+    """
+    games = iter_games(season, start_date, end_date, playoffs)
+    return harvest(
+        games,
+        _get_box_score_game_url,
+        _parse_box_score_game,
+        path,
+        file_format,
+        resume,
+    )
@@ -0,0 +1,212 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from time import time
+
+"""
+    Persistent response cache used by request_utils.
+
+    Responses are stored in a small sqlite database keyed by URL. How long an
+    entry stays valid depends on the kind of page: completed seasons, drafts
+    and finished games never change, while injury reports, standings and
+    current-season pages are refreshed after a few minutes.
+"""
+
+NEVER_EXPIRES = None
+SHORT_TTL = 10 * 60
+DEFAULT_TTL = 24 * 60 * 60
+
+_GAME_PAGE_RE = re.compile(
+    r"/boxscores/(?:pbp/|shot-chart/|plus-minus/)?(\d{8})0\w{3}\.html"
+)
+_SCOREBOARD_RE = re.compile(r"/boxscores/\?month=(\d+)&year=(\d+)&day=(\d+)")
+_DRAFT_RE = re.compile(r"/(?:draft|allstar)/NBA_(\d{4})\.html")
+_SEASON_RE = re.compile(
+    r"/teams/\w+/(\d{4})\.html"
+    r"|/leagues/NBA_(\d{4})[\w-]*\.html"
+    r"|/players/\w/\w+/(?:gamelog|splits)/(\d{4})"
+)
+
+
+def default_cache_path():
+    cache_home = os.environ.get(
+        "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    return os.environ.get(
+        "BASKETBALL_REFERENCE_CACHE",
+        os.path.join(cache_home, "basketball_reference_scraper", "cache.sqlite"),
+    )
+
+
+def current_season_end_year(now=None):
+    now = now or datetime.now()
+    return now.year + 1 if now.month > 9 else now.year
+
+
+def get_ttl(url, now=None):
+    """Time-to-live for a cached page, based on the kind of page.
+
+    Args:
+        url (str): The requested URL.
+        now (datetime, optional): Reference time. Defaults to the current time.
+
+    Returns:
+        int or None: seconds the page stays valid, or None if it never expires.
+    """
+    now = now or datetime.now()
+    if "/friv/" in url:
+        return SHORT_TTL
+
+    match = _GAME_PAGE_RE.search(url)
+    if match:
+        game_date = datetime.strptime(match.group(1), "%Y%m%d")
+        return NEVER_EXPIRES if game_date < now - timedelta(days=1) else SHORT_TTL
+
+    match = _SCOREBOARD_RE.search(url)
+    if match:
+        month, year, day = (int(g) for g in match.groups())
+        game_date = datetime(year, month, day)
+        return NEVER_EXPIRES if game_date < now - timedelta(days=1) else SHORT_TTL
+
+    match = _DRAFT_RE.search(url)
+    if match:
+        return NEVER_EXPIRES if int(match.group(1)) < now.year else DEFAULT_TTL
+
+    match = _SEASON_RE.search(url)
+    if match:
+        season_end_year = int(next(g for g in match.groups() if g))
+        if season_end_year < current_season_end_year(now):
+            return NEVER_EXPIRES
+        return SHORT_TTL
+
+    return DEFAULT_TTL
+
+
+class ResponseCache:
+    """Thread-safe sqlite store of fetched pages with hit/miss counters."""
+
+    def __init__(self, path=None):
+        self.path = path or default_cache_path()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, status INTEGER, headers TEXT, "
+                "content BLOB, fetched_at REAL, expires_at REAL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, url):
+        """Return (status_code, headers, content) for a fresh entry, else None."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT status, headers, content, expires_at FROM responses WHERE url = ?",
+                    (url,),
+                )
+                .fetchone()
+            )
+            if row is None or (row[3] is not None and row[3] < time()):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0], json.loads(row[1]), row[2]
+
+    def set(self, url, status_code, headers, content, ttl=DEFAULT_TTL):
+        fetched_at = time()
+        expires_at = None if ttl is NEVER_EXPIRES else fetched_at + ttl
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    status_code,
+                    json.dumps(dict(headers)),
+                    content,
+                    fetched_at,
+                    expires_at,
+                ),
+            )
+            conn.commit()
+
+    def delete(self, url):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            conn.commit()
+
+    def clear(self, expired_only=False):
+        with self._lock:
+            conn = self._connect()
+            if expired_only:
+                conn.execute(
+                    "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at < ?",
+                    (time(),),
+                )
+            else:
+                conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    def info(self):
+        with self._lock:
+            size = (
+                self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            )
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": size,
+            "path": self.path,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache = ResponseCache()
+_enabled = os.environ.get("BASKETBALL_REFERENCE_CACHE_DISABLED") is None
+
+
+def get_cache():
+    """Return the shared ResponseCache, or None when caching is disabled."""
+    return _cache if _enabled else None
+
+
+def configure_cache(path=None, enabled=True):
+    """Point the shared cache at a different file or turn caching on/off.
+
+    Args:
+        path (str, optional): sqlite file to use. Defaults to the current path.
+        enabled (bool, optional): whether fetches read and write the cache. Defaults to True.
+    """
+    global _cache, _enabled
+    if path is not None and path != _cache.path:
+        _cache.close()
+        _cache = ResponseCache(path)
+    _enabled = enabled
+
+
+def cache_info():
+    """Hit/miss counters, entry count and location of the shared cache."""
+    return _cache.info()
+
+
+def clear_cache(expired_only=False):
+    _cache.clear(expired_only)
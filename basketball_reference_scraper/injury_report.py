@@ -1,23 +1,20 @@
 import pandas as pd
-from bs4 import BeautifulSoup
-from requests import get
 
 try:
     from constants import TEAM_TO_TEAM_ABBR
+    from page import get_first_table, table_to_df
     from request_utils import get_wrapper
-    from utils import format_html
 except:
     from basketball_reference_scraper.constants import TEAM_TO_TEAM_ABBR
+    from basketball_reference_scraper.page import get_first_table, table_to_df
     from basketball_reference_scraper.request_utils import get_wrapper
-    from basketball_reference_scraper.utils import format_html
 
 
 def get_injury_report():
     r = get_wrapper(f"https://www.basketball-reference.com/friv/injuries.fcgi")
     if r.status_code == 200:
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table")
-        df = pd.read_html(format_html(table))[0]
+        table = get_first_table(r.content)
+        df = table_to_df(table)
         df.rename(
             columns={
                 "Player": "PLAYER",
@@ -27,7 +24,6 @@ def get_injury_report():
             },
             inplace=True,
         )
-        df = df[df["PLAYER"] != "Player"]
         df["TEAM"] = df["TEAM"].apply(lambda x: TEAM_TO_TEAM_ABBR[x.upper()])
         df["DATE"] = df["DATE"].apply(lambda x: pd.to_datetime(x))
         df["STATUS"] = df["DESCRIPTION"].apply(lambda x: x[: x.index("(")].strip())
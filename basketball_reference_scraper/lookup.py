@@ -1,100 +1,183 @@
-import os
-import sys
-import unicodedata
-
-import unidecode
-
-"""
-    Bounded levenshtein algorithm credited to user amirouche on stackoverflow.
-    Implementation borrowed from https://stackoverflow.com/questions/59686989/levenshtein-distance-with-bound-limit
-"""
-
-
-def levenshtein(s1, s2, maximum):
-    if len(s1) > len(s2):
-        s1, s2 = s2, s1
-
-    distances = range(len(s1) + 1)
-    for i2, c2 in enumerate(s2):
-        distances_ = [i2 + 1]
-        for i1, c1 in enumerate(s1):
-            if c1 == c2:
-                distances_.append(distances[i1])
-            else:
-                distances_.append(
-                    1 + min((distances[i1], distances[i1 + 1], distances_[-1]))
-                )
-        if all((x >= maximum for x in distances_)):
-            return -1
-        distances = distances_
-    return distances[-1]
-
-
-"""
-    User input is normalized/anglicized, then assigned a levenshtein score to 
-    find the closest matches. If an identical and unique match is found, it is 
-    returned. If many matches are found, either identical or distanced, all
-    are returned for final user approval.
-"""
-
-
-def lookup(player, ask_matches=True):
-    path = os.path.join(os.path.dirname(__file__), "br_names.txt")
-    normalized = unidecode.unidecode(player)
-    matches = []
-
-    with open(path) as file:
-        Lines = file.readlines()
-        for line in Lines:
-            """
-            A bound of 5 units of levenshtein distance is selected to
-            account for possible misspellings or lingering non-unidecoded
-            characters.
-            """
-            dist = levenshtein(normalized.lower(), line[:-1].lower(), 5)
-            if dist >= 0:
-                matches += [(line[:-1], dist)]
-
-    """
-        If one match is found, return that one;
-        otherwise, return list of likely candidates and allow
-        the user to confirm specifiy their selection.
-    """
-    if len(matches) == 1 or ask_matches == False:
-        matches.sort(key=lambda tup: tup[1])
-        if ask_matches:
-            print(
-                'You searched for "{}"\n{} result found.\n{}'.format(
-                    player, len(matches), matches[0][0]
-                )
-            )
-            print("Results for {}:\n".format(matches[0][0]))
-        return matches[0][0]
-
-    elif len(matches) > 1:
-        print('You searched for "{}"\n{} results found.'.format(player, len(matches)))
-        matches.sort(key=lambda tup: tup[1])
-        i = 0
-        return matches[0][0]
-        for match in matches:
-            print("{}: {}".format(i, match[0]))
-            i += 1
-
-        selection = int(input("Pick one: "))
-        print("Results for {}:\n".format(matches[selection][0]))
-        return matches[selection][0]
-
-    elif len(matches) < 1:
-        print('You searched for "{}"\n{} results found.'.format(player, len(matches)))
-        return ""
-
-    else:
-        print(
-            'You searched for "{}"\n{} result found.\n{}'.format(
-                player, len(matches), matches[0][0]
-            )
-        )
-        print("Results for {}:\n".format(matches[0][0]))
-        return matches[0][0]
-
-    return ""
+import os
+import sys
+import threading
+import unicodedata
+from functools import lru_cache
+
+import unidecode
+
+"""
+    Bounded levenshtein algorithm credited to user amirouche on stackoverflow.
+    Implementation borrowed from https://stackoverflow.com/questions/59686989/levenshtein-distance-with-bound-limit
+"""
+
+
+def levenshtein(s1, s2, maximum):
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+
+    distances = range(len(s1) + 1)
+    for i2, c2 in enumerate(s2):
+        distances_ = [i2 + 1]
+        for i1, c1 in enumerate(s1):
+            if c1 == c2:
+                distances_.append(distances[i1])
+            else:
+                distances_.append(
+                    1 + min((distances[i1], distances[i1 + 1], distances_[-1]))
+                )
+        if all((x >= maximum for x in distances_)):
+            return -1
+        distances = distances_
+    return distances[-1]
+
+
+"""
+    The names in br_names.txt are loaded once and indexed by their character
+    bigrams. An edit changes at most two bigrams, so a name within distance k
+    of the query shares all but 2k of the query's distinct bigrams; only names
+    passing that count and a length check are scored with the bounded
+    levenshtein.
+"""
+
+NAMES_PATH = os.path.join(os.path.dirname(__file__), "br_names.txt")
+MAX_DISTANCE = 4
+
+
+def _bigrams(s):
+    s = f" {s} "
+    return {s[i : i + 2] for i in range(len(s) - 1)}
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def _load_index():
+    global _index
+    with _index_lock:
+        if _index is None:
+            with open(NAMES_PATH) as file:
+                names = [line.rstrip("\n") for line in file if line.strip()]
+            keys = [name.lower() for name in names]
+            exact = {}
+            postings = {}
+            for position, key in enumerate(keys):
+                exact.setdefault(key, []).append(position)
+                for gram in _bigrams(key):
+                    postings.setdefault(gram, []).append(position)
+            _index = (names, keys, exact, postings)
+        return _index
+
+
+@lru_cache(maxsize=4096)
+def _search(normalized, max_distance):
+    names, keys, exact, postings = _load_index()
+    if max_distance == 0:
+        return tuple((names[position], 0) for position in exact.get(normalized, []))
+    grams = _bigrams(normalized)
+    threshold = len(grams) - 2 * max_distance
+    if threshold > 0:
+        shared = {}
+        for gram in grams:
+            for position in postings.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+        candidates = [p for p, count in shared.items() if count >= threshold]
+    else:
+        candidates = range(len(keys))
+    matches = []
+    for position in candidates:
+        key = keys[position]
+        if abs(len(key) - len(normalized)) > max_distance:
+            continue
+        d = levenshtein(normalized, key, max_distance + 1)
+        if 0 <= d <= max_distance:
+            matches.append((d, position))
+    # ties keep the order of br_names.txt
+    matches.sort()
+    return tuple((names[position], d) for d, position in matches)
+
+
+def search(player, k=5, max_distance=MAX_DISTANCE):
+    """Find the names closest to player in br_names.txt.
+
+    Args:
+        player (str): The name to search for, accents allowed.
+        k (int, optional): Number of results to return, or None for all of them. Defaults to 5.
+        max_distance (int, optional): Largest edit distance to accept. Defaults to 4.
+
+    Returns:
+        list: (name, distance) tuples, closest first.
+    """
+    normalized = unidecode.unidecode(player).lower()
+    matches = _search(normalized, max_distance)
+    return list(matches if k is None else matches[:k])
+
+
+"""
+    User input is normalized/anglicized, then assigned a levenshtein score to 
+    find the closest matches. If an identical and unique match is found, it is 
+    returned. If many matches are found, either identical or distanced, all
+    are returned for final user approval.
+"""
+
+
+def lookup(player, ask_matches=True):
+    # duplicate names go through the normal path so every namesake is reported
+    exact = search(player, k=2, max_distance=0)
+    if len(exact) == 1:
+        if ask_matches:
+            print(
+                'You searched for "{}"\n1 result found.\n{}'.format(player, exact[0][0])
+            )
+            print("Results for {}:\n".format(exact[0][0]))
+        return exact[0][0]
+
+    """
+        A bound of 4 units of levenshtein distance is selected to
+        account for possible misspellings or lingering non-unidecoded
+        characters.
+    """
+    matches = search(player, k=None)
+
+    """
+        If one match is found, return that one;
+        otherwise, return list of likely candidates and allow
+        the user to confirm specifiy their selection.
+    """
+    if len(matches) == 1 or ask_matches == False:
+        if ask_matches:
+            print(
+                'You searched for "{}"\n{} result found.\n{}'.format(
+                    player, len(matches), matches[0][0]
+                )
+            )
+            print("Results for {}:\n".format(matches[0][0]))
+        return matches[0][0]
+
+    elif len(matches) > 1:
+        print('You searched for "{}"\n{} results found.'.format(player, len(matches)))
+        i = 0
+        return matches[0][0]
+        for match in matches:
+            print("{}: {}".format(i, match[0]))
+            i += 1
+
+        selection = int(input("Pick one: "))
+        print("Results for {}:\n".format(matches[selection][0]))
+        return matches[selection][0]
+
+    elif len(matches) < 1:
+        print('You searched for "{}"\n{} results found.'.format(player, len(matches)))
+        return ""
+
+    else:
+        print(
+            'You searched for "{}"\n{} result found.\n{}'.format(
+                player, len(matches), matches[0][0]
+            )
+        )
+        print("Results for {}:\n".format(matches[0][0]))
+        return matches[0][0]
+
+    return ""
@@ -0,0 +1,363 @@
+import re
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+import pandas as pd
+from bs4 import BeautifulSoup, Comment, SoupStrainer
+
+try:
+    from cache import get_ttl
+    from request_utils import get_wrapper
+except:
+    from basketball_reference_scraper.cache import get_ttl
+    from basketball_reference_scraper.request_utils import get_wrapper
+
+"""
+    Shared parsing layer. Pages are parsed with lxml, and when only some
+    elements are needed they are either cut out of the page text before
+    parsing (tables, which are never nested on Basketball Reference) or
+    selected with a SoupStrainer so the rest of the page never becomes a tree.
+"""
+
+PARSER = "lxml"
+
+
+def parse_html(content, parse_only=None):
+    """Parse HTML with lxml.
+
+    Args:
+        content (bytes | str): The HTML.
+        parse_only (SoupStrainer, optional): Only build the elements it matches.
+
+    Returns:
+        BeautifulSoup: the parsed document.
+    """
+    return BeautifulSoup(content, PARSER, parse_only=parse_only)
+
+
+def _page_text(content):
+    if isinstance(content, bytes):
+        return content.decode("utf-8", errors="replace")
+    return str(content)
+
+
+def _table_html(text, table_id):
+    position = text.find(f'id="{table_id}"')
+    if position < 0:
+        return None
+    start = text.rfind("<table", 0, position)
+    # the id has to belong to the <table> tag itself
+    if start < 0 or ">" in text[start:position]:
+        return None
+    end = text.find("</table>", position)
+    if end < 0:
+        return None
+    return text[start : end + len("</table>")]
+
+
+def get_table(content, table_id):
+    """Find a table by id in a page, including tables shipped inside HTML comments.
+
+    Basketball Reference comments out most secondary tables and uncomments them
+    with JavaScript, so they are invisible to a plain DOM search. Given the page
+    HTML, only the table itself is parsed.
+
+    Args:
+        content (bytes | str | BeautifulSoup): The page HTML or an already parsed page.
+        table_id (str): The id attribute of the table.
+
+    Returns:
+        Tag: the table element, or None if the page does not contain it.
+    """
+    if isinstance(content, BeautifulSoup):
+        soup = content
+    else:
+        text = _page_text(content)
+        html = _table_html(text, table_id)
+        if html is not None:
+            table = parse_html(html).find("table", {"id": table_id})
+            if table is not None:
+                return table
+        soup = parse_html(text)
+    table = soup.find("table", {"id": table_id})
+    if table is not None:
+        return table
+    marker = f'id="{table_id}"'
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        if marker in comment:
+            table = parse_html(comment).find("table", {"id": table_id})
+            if table is not None:
+                return table
+    return None
+
+
+def get_first_table(content):
+    """The first table in the page DOM (tables inside comments are not considered)."""
+    return parse_html(content, SoupStrainer("table")).find("table")
+
+
+"""
+    Tables are turned into DataFrames straight from the parsed tree. Every cell
+    on Basketball Reference carries a data-stat attribute naming its column, so
+    cells are placed by data-stat instead of re-serializing the table for
+    pd.read_html, and links inside cells are collected in the same pass.
+"""
+
+REPEATED_HEADER_CLASSES = {"thead", "over_header"}
+CELL_TAGS = ("th", "td")
+NUMBER_RE = re.compile(r"[+-]?(?:\d[\d,]*(?:\.\d*)?|\.\d+)")
+# newer pages name the player column name_display
+PLAYER_LINKS = {"player": "PLAYER_HREF", "name_display": "PLAYER_HREF"}
+
+
+def _header_names(cells, unique=True):
+    names = []
+    seen = {}
+    for i, cell in enumerate(cells):
+        name = cell.get_text().strip() or f"Unnamed: {i}"
+        if unique and name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen.setdefault(name, 0)
+        names.append(name)
+    return names
+
+
+def _to_numeric(values):
+    present = [value for value in values if value is not None]
+    if not present:
+        return pd.Series(values, dtype=float)
+    if all(NUMBER_RE.fullmatch(value) for value in present):
+        return pd.to_numeric(
+            pd.Series([v.replace(",", "") if v else v for v in values], dtype=object)
+        )
+    return pd.Series(values)
+
+
+def table_to_df(table, links=None, unique=True, use_data_stat=False, skip_headers=True):
+    """Build a DataFrame from a Basketball Reference table in a single pass.
+
+    Columns come from the last header row. Repeated header rows inside the body
+    (class "thead", e.g. the 'Rk' and 'Reserves' rows) are skipped, footer rows
+    are kept, empty cells become NaN and columns that are entirely numeric are
+    converted like pd.read_html would. A cell whose data-stat is not a column,
+    such as the 'Did Not Play' note, fills every column it spans.
+
+    Args:
+        table (Tag): The table element, e.g. as returned by get_table.
+        links (dict, optional): Maps a data-stat to the name of an extra column holding the href of the link in that cell.
+        unique (bool, optional): Suffix duplicate header names with .1, .2, ... Defaults to True.
+        use_data_stat (bool, optional): Name columns by data-stat instead of header text. Defaults to False.
+        skip_headers (bool, optional): Skip the header rows inside the body. Turned off to keep section rows like 'Playoffs'. Defaults to True.
+
+    Returns:
+        DataFrame: one row per body and footer row of the table.
+    """
+    links = links or {}
+    header_rows = [
+        tr
+        for tr in table.find("thead").find_all("tr")
+        if not REPEATED_HEADER_CLASSES.intersection(tr.get("class", []))
+    ]
+    header = header_rows[-1].find_all(CELL_TAGS, recursive=False)
+    stats = [cell.get("data-stat") for cell in header]
+    if use_data_stat:
+        names = [stat or f"Unnamed: {i}" for i, stat in enumerate(stats)]
+    else:
+        names = _header_names(header, unique)
+    positions = {stat: i for i, stat in enumerate(stats) if stat}
+    width = len(names)
+
+    rows = []
+    hrefs = {column: [] for column in links.values()}
+    for section in table.find_all(["tbody", "tfoot"], recursive=False):
+        for tr in section.children:
+            if tr.name != "tr" or (
+                skip_headers
+                and REPEATED_HEADER_CLASSES.intersection(tr.get("class", []))
+            ):
+                continue
+            row = [None] * width
+            found = dict.fromkeys(hrefs)
+            i = 0
+            for cell in tr.children:
+                if cell.name not in CELL_TAGS:
+                    continue
+                stat = cell.get("data-stat")
+                span = int(cell.get("colspan", 1))
+                text = cell.get_text().strip() or None
+                if stat in positions:
+                    i = positions[stat]
+                    row[i] = text
+                else:
+                    for j in range(i, min(i + span, width)):
+                        row[j] = text
+                i += span
+                if stat in links:
+                    anchor = cell.find("a", href=True)
+                    found[links[stat]] = anchor["href"] if anchor else None
+            rows.append(row)
+            for column, href in found.items():
+                hrefs[column].append(href)
+
+    columns = zip(*rows) if rows else [()] * width
+    df = pd.DataFrame(
+        {i: _to_numeric(list(values)) for i, values in enumerate(columns)}
+    )
+    df.columns = names
+    for column, values in hrefs.items():
+        df[column] = values
+    return df
+
+
+def link_ids(hrefs):
+    """Turn link hrefs such as '/players/j/jamesle01.html' into IDs ('jamesle01')."""
+    return pd.Series(hrefs, dtype=object).str.extract(r"/([^/]+)\.html$", expand=False)
+
+
+"""
+    A Page is one fetched URL whose tables are handed out on demand. The HTML
+    is decoded and parsed only when a table is first asked for, each table is
+    parsed once, and recently used pages are kept in a small in-memory LRU so
+    every getter that reads the same URL within a session shares one download
+    and one parse. Pages are dropped from the LRU when their response cache
+    TTL runs out.
+"""
+
+MAX_PAGES = 16
+TABLE_ID_RE = re.compile(r'<table[^>]*?\sid="([^"]+)"')
+
+_pages = OrderedDict()
+_pages_lock = threading.Lock()
+
+
+class Page:
+    def __init__(self, url, content, status_code=200):
+        """
+        Args:
+            url (str): The page URL.
+            content (bytes | str): The page HTML.
+            status_code (int, optional): HTTP status of the response. Defaults to 200.
+        """
+        self.url = url
+        self.content = content
+        self.status_code = status_code
+        self._text = None
+        self._soup = None
+        self._tables = {}
+        self._dfs = {}
+        self._lock = threading.RLock()
+
+    @property
+    def ok(self):
+        return self.status_code == 200
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = _page_text(self.content)
+        return self._text
+
+    @property
+    def soup(self):
+        """The whole page parsed, built only if some table cannot be cut out of the text."""
+        with self._lock:
+            if self._soup is None:
+                self._soup = parse_html(self.text)
+            return self._soup
+
+    def table_ids(self):
+        """Ids of every table on the page, including tables inside HTML comments."""
+        return list(dict.fromkeys(TABLE_ID_RE.findall(self.text)))
+
+    def get_table(self, table_id):
+        """Like get_table, but every table is parsed at most once.
+
+        Args:
+            table_id (str): The id attribute of the table.
+
+        Returns:
+            Tag: the table element, or None if the page does not contain it.
+        """
+        with self._lock:
+            if table_id not in self._tables:
+                table = None
+                html = _table_html(self.text, table_id)
+                if html is not None:
+                    table = parse_html(html).find("table", {"id": table_id})
+                if table is None and f'id="{table_id}"' in self.text:
+                    table = get_table(self.soup, table_id)
+                self._tables[table_id] = table
+            return self._tables[table_id]
+
+    def get_df(
+        self, table_id, links=None, unique=True, use_data_stat=False, skip_headers=True
+    ):
+        """A table of the page as a DataFrame, see table_to_df for the arguments.
+
+        Returns:
+            DataFrame: a copy the caller is free to modify, or None if the page does not contain the table.
+        """
+        key = (
+            table_id,
+            tuple(sorted((links or {}).items())),
+            unique,
+            use_data_stat,
+            skip_headers,
+        )
+        with self._lock:
+            if key not in self._dfs:
+                table = self.get_table(table_id)
+                self._dfs[key] = (
+                    None
+                    if table is None
+                    else table_to_df(table, links, unique, use_data_stat, skip_headers)
+                )
+            df = self._dfs[key]
+        return None if df is None else df.copy()
+
+
+def _expires_at(url):
+    ttl = get_ttl(url)
+    return None if ttl is None else monotonic() + ttl
+
+
+def remember_page(page):
+    """Keep a page fetched elsewhere (e.g. by the async getters) in the page LRU."""
+    if not page.ok:
+        return page
+    with _pages_lock:
+        _pages[page.url] = (page, _expires_at(page.url))
+        _pages.move_to_end(page.url)
+        while len(_pages) > MAX_PAGES:
+            _pages.popitem(last=False)
+    return page
+
+
+def get_page(url):
+    """Fetch a page, or reuse it if it was fetched recently in this session.
+
+    Args:
+        url (str): The page URL.
+
+    Returns:
+        Page: the page; check page.ok before reading tables from it.
+    """
+    with _pages_lock:
+        entry = _pages.get(url)
+        if entry is not None:
+            page, expires_at = entry
+            if expires_at is None or monotonic() < expires_at:
+                _pages.move_to_end(url)
+                return page
+            del _pages[url]
+    r = get_wrapper(url)
+    return remember_page(Page(url, r.content, r.status_code))
+
+
+def clear_pages():
+    """Forget every page kept in memory (the response cache is not touched)."""
+    with _pages_lock:
+        _pages.clear()
@@ -1,70 +1,242 @@
+import re
 from datetime import datetime
 
 import pandas as pd
-from bs4 import BeautifulSoup
-from requests import get
 
 try:
+    from page import get_table
     from request_utils import get_wrapper
-    from utils import format_html, get_game_suffix
+    from utils import format_html, get_game_suffix, parse_game_id
 except:
+    from basketball_reference_scraper.page import get_table
     from basketball_reference_scraper.request_utils import get_wrapper
-    from basketball_reference_scraper.utils import format_html, get_game_suffix
+    from basketball_reference_scraper.utils import (format_html,
+                                                    get_game_suffix,
+                                                    parse_game_id)
 
 
 def get_pbp_helper(suffix):
-    selector = f"#pbp"
     r = get_wrapper(f"https://www.basketball-reference.com/boxscores/pbp{suffix}")
     if r.status_code == 200:
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table", attrs={"id": "pbp"})
-        return pd.read_html(format_html(table))[0]
+        return _parse_pbp_table(r.content)
     else:
         raise ConnectionError("Request to basketball reference failed")
 
 
+def _parse_pbp_table(content):
+    table = get_table(content, "pbp")
+    return pd.read_html(format_html(table))[0]
+
+
+QUARTER_SECONDS = 12 * 60
+OVERTIME_SECONDS = 5 * 60
+PERIOD_RE = r"^(\d)(?:st|nd|rd|th) (Q|OT)$"
+
+
 def format_df(df1):
+    df1 = df1.copy()
     df1.columns = list(map(lambda x: x[1], list(df1.columns)))
     t1 = list(df1.columns)[1].upper()
     t2 = list(df1.columns)[5].upper()
-    q = 1
-    df = None
-    for index, row in df1.iterrows():
-        d = {
-            "QUARTER": float("nan"),
-            "TIME_REMAINING": float("nan"),
-            f"{t1}_ACTION": float("nan"),
-            f"{t2}_ACTION": float("nan"),
-            f"{t1}_SCORE": float("nan"),
-            f"{t2}_SCORE": float("nan"),
+    time = df1["Time"].astype(str)
+
+    # period header rows ("2nd Q", "1st OT") mark where each period starts
+    periods = time.str.extract(PERIOD_RE)
+    quarter = pd.to_numeric(periods[0])
+    quarter = quarter.where(periods[1] == "Q", quarter + 4)
+    quarter = quarter.ffill().fillna(1).astype("int8")
+
+    # rows spanning the table (jump balls, period starts) have no parsable score
+    scores = df1["Score"].astype(str).str.split("-", n=1, expand=True)
+    scores = scores.reindex(columns=[0, 1]).apply(pd.to_numeric, errors="coerce")
+    clock = time.str.split(":", n=1, expand=True).reindex(columns=[0, 1])
+    minutes = pd.to_numeric(clock[0], errors="coerce")
+    seconds = pd.to_numeric(clock[1], errors="coerce")
+    valid = scores.notna().all(axis=1) & minutes.notna() & seconds.notna()
+
+    quarter = quarter[valid]
+    remaining = (minutes * 60 + seconds)[valid].astype("float64")
+    period = quarter.astype("int64")
+    regulation = period <= 4
+    start = ((period - 1) * QUARTER_SECONDS).where(
+        regulation, 4 * QUARTER_SECONDS + (period - 5) * OVERTIME_SECONDS
+    )
+    length = regulation.map({True: QUARTER_SECONDS, False: OVERTIME_SECONDS})
+    df = pd.DataFrame(
+        {
+            "QUARTER": quarter,
+            "TIME_REMAINING": time[valid],
+            "SECONDS_REMAINING": remaining,
+            "SECONDS_ELAPSED": (start + length - remaining).astype("float64"),
+            f"{t1}_ACTION": df1.iloc[:, 1][valid],
+            f"{t2}_ACTION": df1.iloc[:, 5][valid],
+            f"{t1}_SCORE": scores[0][valid].astype("int16"),
+            f"{t2}_SCORE": scores[1][valid].astype("int16"),
         }
-        if row["Time"] == "2nd Q":
-            q = 2
-        elif row["Time"] == "3rd Q":
-            q = 3
-        elif row["Time"] == "4th Q":
-            q = 4
-        elif "OT" in row["Time"]:
-            q = row["Time"][0] + "OT"
-        try:
-            d["QUARTER"] = q
-            d["TIME_REMAINING"] = row["Time"]
-            scores = row["Score"].split("-")
-            d[f"{t1}_SCORE"] = int(scores[0])
-            d[f"{t2}_SCORE"] = int(scores[1])
-            d[f"{t1}_ACTION"] = row[list(df1.columns)[1]]
-            d[f"{t2}_ACTION"] = row[list(df1.columns)[5]]
-            if df is None:
-                df = pd.DataFrame(columns=list(d.keys()))
-            df = df.append(d, ignore_index=True)
-        except:
+    )
+    return df.reset_index(drop=True)
+
+
+"""
+    Event classification. Each pattern is compiled once and applied with
+    str.extract only to the rows that contain its keyword and were not
+    classified by an earlier pattern, so a whole season of actions is
+    classified in a handful of vectorized passes.
+"""
+
+EVENT_TYPES = [
+    "MADE_SHOT",
+    "MISSED_SHOT",
+    "MADE_FREE_THROW",
+    "MISSED_FREE_THROW",
+    "REBOUND",
+    "TURNOVER",
+    "FOUL",
+    "VIOLATION",
+    "SUBSTITUTION",
+    "TIMEOUT",
+    "OTHER",
+]
+
+EVENT_PATTERNS = [
+    (
+        "SHOT",
+        "-pt ",
+        re.compile(
+            r"^(?P<player>.+?) (?P<result>makes|misses) (?P<value>[23])-pt .*?"
+            r"(?: \((?:assist|block) by (?P<secondary>.+?)\))?$"
+        ),
+    ),
+    (
+        "FREE_THROW",
+        "free throw",
+        re.compile(r"^(?P<player>.+?) (?P<result>makes|misses) .*free throw"),
+    ),
+    (
+        "REBOUND",
+        "rebound by",
+        re.compile(r"^(?:Offensive|Defensive) rebound by (?P<player>.+)$"),
+    ),
+    (
+        "TURNOVER",
+        "Turnover by",
+        re.compile(
+            r"^Turnover by (?P<player>.+?) \(.*?(?:; steal by (?P<secondary>.+?))?\)$"
+        ),
+    ),
+    (
+        "FOUL",
+        "oul",
+        # flagrant fouls read 'Flagrant foul type 1 by ...'
+        re.compile(
+            r"^.*?[Ff]oul(?: type \d)? by (?P<player>.+?)"
+            r"(?: \(drawn by (?P<secondary>.+?)\))?$"
+        ),
+    ),
+    (
+        "VIOLATION",
+        "Violation by",
+        re.compile(r"^Violation by (?P<player>.+?)(?: \(.*\))?$"),
+    ),
+    (
+        "SUBSTITUTION",
+        "enters the game",
+        re.compile(r"^(?P<player>.+?) enters the game for (?P<secondary>.+)$"),
+    ),
+    (
+        "TIMEOUT",
+        "imeout",
+        # 'Official timeout' has no team in front; PLAYER is then 'Official'
+        re.compile(
+            r"^(?P<player>.+?)(?: (?:full|20 second|official))? timeout$",
+            re.IGNORECASE,
+        ),
+    ),
+]
+
+
+def classify_events(df):
+    """Classify the actions of a play-by-play DataFrame.
+
+    Args:
+        df (DataFrame): A play-by-play DataFrame as returned by get_pbp.
+
+    Returns:
+        DataFrame: df with EVENT_TEAM, EVENT_TYPE, PLAYER, SECONDARY_PLAYER, SHOT_VALUE and POINTS
+        columns added. PLAYER is the team name for team events such as timeouts.
+    """
+    first, second = [c for c in df.columns if c.endswith("_ACTION")][:2]
+    action = df[first].where(df[first].notna(), df[second])
+    team = pd.Series(first[: -len("_ACTION")], index=df.index).where(
+        df[first].notna(), second[: -len("_ACTION")]
+    )
+    event_type = pd.Series(None, index=df.index, dtype="object")
+    player = pd.Series(None, index=df.index, dtype="object")
+    secondary = pd.Series(None, index=df.index, dtype="object")
+    value = pd.Series(0, index=df.index, dtype="int8")
+    made = pd.Series(False, index=df.index)
+
+    for name, keyword, pattern in EVENT_PATTERNS:
+        pending = event_type.isna() & action.notna()
+        pending &= action.str.contains(keyword, regex=False).fillna(False)
+        if not pending.any():
+            continue
+        extracted = action[pending].str.extract(pattern)
+        extracted = extracted[extracted["player"].notna()]
+        if extracted.empty:
             continue
+        rows = extracted.index
+        player[rows] = extracted["player"]
+        if "secondary" in extracted:
+            secondary[rows] = extracted["secondary"]
+        if "result" in extracted:
+            makes = extracted["result"] == "makes"
+            event_type[rows] = makes.map(
+                {True: "MADE_" + name, False: "MISSED_" + name}
+            )
+            made[rows] = makes
+            if name == "SHOT":
+                value[rows] = extracted["value"].astype("int8")
+            else:
+                value[rows] = 1
+        else:
+            event_type[rows] = name
+
+    df = df.copy()
+    df["EVENT_TEAM"] = team.astype("category")
+    df["EVENT_TYPE"] = pd.Categorical(
+        event_type.where(event_type.notna() | action.isna(), "OTHER"),
+        categories=EVENT_TYPES,
+    )
+    df["PLAYER"] = player
+    df["SECONDARY_PLAYER"] = secondary
+    df["SHOT_VALUE"] = value
+    df["POINTS"] = value.where(made, 0).astype("int8")
     return df
 
 
-def get_pbp(date, team1, team2):
+def get_pbp(date, team1, team2, classify=False):
     date = pd.to_datetime(date)
     suffix = get_game_suffix(date, team1, team2).replace("/boxscores", "")
     df = get_pbp_helper(suffix)
     df = format_df(df)
+    if classify:
+        df = classify_events(df)
+    return df
+
+
+def get_pbp_by_id(game_id, classify=False):
+    """Play-by-play of a game by its ID, without looking the game up on the scoreboard.
+
+    Args:
+        game_id (str): The game ID, e.g. '202001060DEN' from the GAME_ID column of get_schedule.
+        classify (bool, optional): Add the columns of classify_events. Defaults to False.
+
+    Returns:
+        DataFrame: the play-by-play, shaped as get_pbp returns it.
+    """
+    parse_game_id(game_id)
+    df = format_df(get_pbp_helper(f"/{game_id}.html"))
+    if classify:
+        df = classify_events(df)
     return df
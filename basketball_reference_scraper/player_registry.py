@@ -0,0 +1,188 @@
+import os
+import re
+import string
+import threading
+import unicodedata
+
+import pandas as pd
+import unidecode
+from bs4 import SoupStrainer
+
+try:
+    from cache import default_cache_path
+    from page import parse_html
+    from request_utils import get_wrapper
+except:
+    from basketball_reference_scraper.cache import default_cache_path
+    from basketball_reference_scraper.page import parse_html
+    from basketball_reference_scraper.request_utils import get_wrapper
+
+"""
+    Offline registry of Basketball Reference player IDs.
+
+    The registry maps normalized player names (and their active years) to BR
+    IDs such as 'jamesle01', so a name can be turned into a player page URL
+    without probing guessed URLs over the network. It is built from the
+    /players/{letter}/ index pages: the copy shipped with the package is
+    regenerated with `make registry`, and update_player_registry() refreshes
+    some or all letters into a per-user copy that takes precedence over it.
+"""
+
+REGISTRY_COLUMNS = ["PLAYER_ID", "NAME", "FROM", "TO"]
+REGISTRY_PATH = os.path.join(os.path.dirname(__file__), "br_players.csv")
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def user_registry_path():
+    return os.path.join(os.path.dirname(default_cache_path()), "br_players.csv")
+
+
+def normalize_name(name):
+    name = unidecode.unidecode(unicodedata.normalize("NFD", str(name)))
+    name = name.replace("(TW)", "").replace("*", "").lower()
+    name = re.sub(r"[.'\-,]", "", name)
+    return " ".join(name.split())
+
+
+def _strip_suffix(normalized_name):
+    parts = normalized_name.split(" ")
+    while len(parts) > 2 and parts[-1] in NAME_SUFFIXES:
+        parts.pop()
+    return " ".join(parts)
+
+
+def parse_player_index(content):
+    """Parse a /players/{letter}/ index page into registry rows."""
+    soup = parse_html(content, SoupStrainer("table", attrs={"id": "players"}))
+    table = soup.find("table", {"id": "players"})
+    rows = []
+    if table is None:
+        return pd.DataFrame(columns=REGISTRY_COLUMNS)
+    for tr in table.find("tbody").find_all("tr"):
+        cell = tr.find("th", {"data-stat": "player"})
+        anchor = cell.find("a") if cell else None
+        if anchor is None:
+            continue
+        year_min = tr.find("td", {"data-stat": "year_min"})
+        year_max = tr.find("td", {"data-stat": "year_max"})
+        rows.append(
+            {
+                "PLAYER_ID": anchor["href"].split("/")[-1].replace(".html", ""),
+                "NAME": anchor.text.strip(),
+                "FROM": int(year_min.text) if year_min and year_min.text else None,
+                "TO": int(year_max.text) if year_max and year_max.text else None,
+            }
+        )
+    return pd.DataFrame(rows, columns=REGISTRY_COLUMNS)
+
+
+def _read(path):
+    if os.path.exists(path):
+        return pd.read_csv(path, dtype={"PLAYER_ID": str, "NAME": str})
+    return pd.DataFrame(columns=REGISTRY_COLUMNS)
+
+
+def _merge(old, new):
+    df = pd.concat([old, new])
+    df = df.drop_duplicates(subset="PLAYER_ID", keep="last")
+    return df.sort_values("PLAYER_ID").reset_index(drop=True)
+
+
+def _build_lookup(df):
+    lookup = {}
+    for player_id, name, year_from, year_to in df[REGISTRY_COLUMNS].itertuples(
+        index=False
+    ):
+        entry = (player_id, year_from, year_to)
+        normalized = normalize_name(name)
+        lookup.setdefault(normalized, []).append(entry)
+        stripped = _strip_suffix(normalized)
+        if stripped != normalized:
+            lookup.setdefault(stripped, []).append(entry)
+    return lookup
+
+
+def load_player_registry(reload=False):
+    """Return the registry as a DataFrame, merging the shipped and per-user copies."""
+    global _registry
+    with _registry_lock:
+        if _registry is None or reload:
+            df = _merge(_read(REGISTRY_PATH), _read(user_registry_path()))
+            _registry = (df, _build_lookup(df))
+        return _registry[0]
+
+
+def _get_lookup():
+    load_player_registry()
+    return _registry[1]
+
+
+def resolve_player_id(name, season=None):
+    """Resolve a player name to a BR player ID without any network request.
+
+    Args:
+        name (str): The player name, accents and suffixes allowed.
+        season (int, optional): A season end year the player was active in, used to tell namesakes apart.
+
+    Returns:
+        str: the player ID (e.g. 'jamesle01'), or None if the name is not in the registry.
+    """
+    normalized = normalize_name(name)
+    lookup = _get_lookup()
+    candidates = lookup.get(normalized) or lookup.get(_strip_suffix(normalized))
+    if not candidates:
+        return None
+    if season is not None and len(candidates) > 1:
+        active = [
+            c
+            for c in candidates
+            if pd.notna(c[1]) and pd.notna(c[2]) and c[1] <= season <= c[2]
+        ]
+        candidates = active or candidates
+    # without a hint, prefer the lowest numbered ID like the URL probing did
+    return sorted(candidates, key=lambda c: c[0][-2:])[0][0]
+
+
+def register_player(name, player_id, year_from=None, year_to=None):
+    """Add a single resolved player to the per-user registry."""
+    row = pd.DataFrame(
+        [{"PLAYER_ID": player_id, "NAME": name, "FROM": year_from, "TO": year_to}],
+        columns=REGISTRY_COLUMNS,
+    )
+    path = user_registry_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _merge(_read(path), row).to_csv(path, index=False)
+    load_player_registry(reload=True)
+
+
+def update_player_registry(letters=None, path=None):
+    """Fetch /players/{letter}/ index pages and merge them into a registry file.
+
+    Args:
+        letters (str | list, optional): Letters to refresh. Defaults to the whole alphabet.
+        path (str, optional): Registry file to update. Defaults to the per-user registry.
+
+    Returns:
+        DataFrame: the updated registry.
+    """
+    path = path or user_registry_path()
+    letters = letters or string.ascii_lowercase
+    df = _read(path)
+    for letter in letters:
+        r = get_wrapper(f"https://www.basketball-reference.com/players/{letter}/")
+        if r.status_code == 200:
+            df = _merge(df, parse_player_index(r.content))
+        else:
+            raise ConnectionError("Request to basketball reference failed")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    df.to_csv(path, index=False)
+    load_player_registry(reload=True)
+    return df
+
+
+def build_player_registry():
+    """Regenerate the registry shipped with the package."""
+    return update_player_registry(path=REGISTRY_PATH)
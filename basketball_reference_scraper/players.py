@@ -1,15 +1,15 @@
 import pandas as pd
-from bs4 import BeautifulSoup
-from requests import get
 
 try:
     from lookup import lookup
-    from request_utils import get_selenium_wrapper, get_wrapper
+    from page import get_first_table, get_table, table_to_df
+    from request_utils import get_wrapper
     from utils import format_html, get_player_suffix
 except:
     from basketball_reference_scraper.lookup import lookup
-    from basketball_reference_scraper.request_utils import (
-        get_selenium_wrapper, get_wrapper)
+    from basketball_reference_scraper.page import (get_first_table, get_table,
+                                                   table_to_df)
+    from basketball_reference_scraper.request_utils import get_wrapper
     from basketball_reference_scraper.utils import (format_html,
                                                     get_player_suffix)
 
@@ -44,23 +44,12 @@ def _get_stats_internal(
     if not suffix:
         return pd.DataFrame()
     stat_type = stat_type.lower()
-    table = None
-    if stat_type in ["per_game", "totals", "advanced"] and not playoffs:
-        r = get_wrapper(f"https://www.basketball-reference.com/{suffix}")
-        if r.status_code == 200:
-            soup = BeautifulSoup(r.content, "html.parser")
-            table = soup.find("table", {"id": stat_type})
-            table = str(table)
-        else:
-            raise ConnectionError("Request to basketball reference failed")
-    elif stat_type in ["per_minute", "per_poss"] or playoffs:
-        if playoffs:
-            xpath = f"//table[@id='playoffs_{stat_type}']"
-        else:
-            xpath = f"//table[@id='{stat_type}']"
-        table = get_selenium_wrapper(
-            f"https://www.basketball-reference.com/{suffix}", xpath
-        )
+    table_id = f"playoffs_{stat_type}" if playoffs else stat_type
+    r = get_wrapper(f"https://www.basketball-reference.com/{suffix}")
+    if r.status_code == 200:
+        table = get_table(r.content, table_id)
+    else:
+        raise ConnectionError("Request to basketball reference failed")
     if table is None:
         return pd.DataFrame()
     df = pd.read_html(format_html(table))[0]
@@ -94,7 +83,7 @@ def _get_stats_internal(
 
 def get_game_logs(_name, year, playoffs=False, ask_matches=True):
     name = lookup(_name, ask_matches)
-    suffix = get_player_suffix(name).replace(".html", "")
+    suffix = get_player_suffix(name, year).replace(".html", "")
     return _get_game_logs_internal(suffix=suffix, year=year, playoffs=playoffs)
 
 
@@ -104,44 +93,45 @@ def get_game_logs_by_br_id(_id, year, playoffs=False):
 
 
 def _get_game_logs_internal(suffix, year, playoffs=False):
-    if playoffs:
-        selector = "pgl_basic_playoffs"
-        url = f"https://www.basketball-reference.com/{suffix}/gamelog-playoffs"
-    else:
-        selector = "pgl_basic"
-        url = f"https://www.basketball-reference.com/{suffix}/gamelog/{year}"
-    r = get_wrapper(url)
+    r = get_wrapper(_get_game_logs_url(suffix, year, playoffs))
     if r.status_code == 200:
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table", {"id": selector})
-        if table is None:
-            return pd.DataFrame()
-        df = pd.read_html(format_html(table))[0]
-        df.rename(
-            columns={
-                "Date": "DATE",
-                "Age": "AGE",
-                "Tm": "TEAM",
-                "Unnamed: 5": "HOME/AWAY",
-                "Opp": "OPPONENT",
-                "Unnamed: 7": "RESULT",
-                "GmSc": "GAME_SCORE",
-                "Series": "SERIES",
-            },
-            inplace=True,
-        )
-        df["HOME/AWAY"] = df["HOME/AWAY"].apply(
-            lambda x: "AWAY" if x == "@" else "HOME"
-        )
-        df = df[df["Rk"] != "Rk"]
-        df = df.drop(["Rk", "G"], axis=1).reset_index(drop=True)
-        if not playoffs:
-            df["DATE"] = pd.to_datetime(df["DATE"])
-        return df
+        return _parse_game_logs(r.content, playoffs)
     else:
         raise ConnectionError("Request to basketball reference failed")
 
 
+def _get_game_logs_url(suffix, year, playoffs=False):
+    if playoffs:
+        return f"https://www.basketball-reference.com/{suffix}/gamelog-playoffs"
+    return f"https://www.basketball-reference.com/{suffix}/gamelog/{year}"
+
+
+def _parse_game_logs(content, playoffs=False):
+    selector = "pgl_basic_playoffs" if playoffs else "pgl_basic"
+    table = get_table(content, selector)
+    if table is None:
+        return pd.DataFrame()
+    df = table_to_df(table)
+    df.rename(
+        columns={
+            "Date": "DATE",
+            "Age": "AGE",
+            "Tm": "TEAM",
+            "Unnamed: 5": "HOME/AWAY",
+            "Opp": "OPPONENT",
+            "Unnamed: 7": "RESULT",
+            "GmSc": "GAME_SCORE",
+            "Series": "SERIES",
+        },
+        inplace=True,
+    )
+    df["HOME/AWAY"] = df["HOME/AWAY"].apply(lambda x: "AWAY" if x == "@" else "HOME")
+    df = df.drop(["Rk", "G"], axis=1).reset_index(drop=True)
+    if not playoffs:
+        df["DATE"] = pd.to_datetime(df["DATE"])
+    return df
+
+
 def get_player_headshot(_name, ask_matches=True):
     name = lookup(_name, ask_matches)
     suffix = get_player_suffix(name)
@@ -152,13 +142,12 @@ def get_player_headshot(_name, ask_matches=True):
 
 def get_player_splits(_name, season_end_year, stat_type="PER_GAME", ask_matches=True):
     name = lookup(_name, ask_matches)
-    suffix = get_player_suffix(name)[:-5]
+    suffix = get_player_suffix(name, season_end_year)[:-5]
     r = get_wrapper(
         f"https://www.basketball-reference.com/{suffix}/splits/{season_end_year}"
     )
     if r.status_code == 200:
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table")
+        table = get_first_table(r.content)
         if table:
             df = pd.read_html(format_html(table))[0]
             for i in range(1, len(df["Unnamed: 0_level_0", "Split"])):
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import os
+import threading
+from contextlib import contextmanager
+from time import monotonic, sleep, time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+"""
+    Token-bucket rate limiter shared by every fetch path.
+
+    Sports Reference blocks clients making more than 20 requests a minute, so
+    the default bucket refills at that rate and holds a single token. Callers
+    reserve a token under a lock and then sleep outside of it for exactly the
+    time left until their token is available, which keeps the limiter fair
+    between threads and lets asyncio callers wait without blocking the loop.
+    Passing a lock_file shares the bucket between processes on the same host.
+"""
+
+DEFAULT_REQUESTS = 20
+DEFAULT_WINDOW = 60.0
+DEFAULT_BURST = 1
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        requests=DEFAULT_REQUESTS,
+        window=DEFAULT_WINDOW,
+        burst=DEFAULT_BURST,
+        lock_file=None,
+    ):
+        """
+        Args:
+            requests (int): Number of requests allowed per window.
+            window (float): Window length in seconds.
+            burst (int): Maximum number of requests that may be made back to back.
+            lock_file (str, optional): Path of a file used to share the bucket between processes.
+        """
+        if requests <= 0 or window <= 0 or burst < 1:
+            raise ValueError(
+                "requests and window must be positive and burst at least 1"
+            )
+        if lock_file is not None and fcntl is None:
+            raise ValueError("Cross-process rate limiting requires fcntl (POSIX only)")
+        self.rate = requests / window
+        self.burst = burst
+        self.lock_file = lock_file
+        self.calls = 0
+        self.total_wait = 0.0
+        self.last_wait = 0.0
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self, tokens, updated, now):
+        tokens = min(self.burst, tokens + (now - updated) * self.rate) - 1
+        return tokens, max(0.0, -tokens / self.rate)
+
+    @contextmanager
+    def _shared_state(self):
+        with open(self.lock_file, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read())
+                except ValueError:
+                    state = {"tokens": float(self.burst), "updated": time()}
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _reserve(self):
+        """Take one token and return how long the caller has to wait for it."""
+        with self._lock:
+            if self.lock_file is None:
+                now = monotonic()
+                self._tokens, wait = self._take(self._tokens, self._updated, now)
+                self._updated = now
+            else:
+                with self._shared_state() as state:
+                    now = time()
+                    state["tokens"], wait = self._take(
+                        state["tokens"], state["updated"], now
+                    )
+                    state["updated"] = now
+            self.calls += 1
+            self.total_wait += wait
+            self.last_wait = wait
+        return wait
+
+    def acquire(self):
+        """Block until a request may be made.
+
+        Returns:
+            float: seconds spent waiting.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            sleep(wait)
+        return wait
+
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be made.
+
+        Returns:
+            float: seconds spent waiting.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self):
+        return {
+            "calls": self.calls,
+            "total_wait": self.total_wait,
+            "last_wait": self.last_wait,
+        }
+
+
+_limiter = RateLimiter(
+    lock_file=os.environ.get("BASKETBALL_REFERENCE_RATE_LIMIT_LOCK") or None
+)
+
+
+def get_rate_limiter():
+    """Return the RateLimiter shared by every request made by the package."""
+    return _limiter
+
+
+def configure_rate_limiter(
+    requests=DEFAULT_REQUESTS,
+    window=DEFAULT_WINDOW,
+    burst=DEFAULT_BURST,
+    lock_file=None,
+):
+    """Replace the shared rate limiter.
+
+    Args:
+        requests (int, optional): Number of requests allowed per window. Defaults to 20.
+        window (float, optional): Window length in seconds. Defaults to 60.
+        burst (int, optional): Maximum back to back requests. Defaults to 1.
+        lock_file (str, optional): File used to share the limit between processes. Defaults to None.
+
+    Returns:
+        RateLimiter: the new shared limiter.
+    """
+    global _limiter
+    _limiter = RateLimiter(requests, window, burst, lock_file)
+    return _limiter
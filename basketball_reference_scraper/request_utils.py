@@ -1,44 +1,380 @@
-from time import sleep, time
+import asyncio
+import atexit
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from queue import Empty, LifoQueue
+from time import monotonic, sleep
 
-from requests import get
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
+from lxml import html as lxml_html
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 
-options = Options()
-options.add_argument("--headless=new")
-driver = webdriver.Chrome(options=options)
-last_request = time()
+try:
+    from cache import get_cache, get_ttl
+    from rate_limit import get_rate_limiter
+    from retry import get_circuit_breaker, get_retry_policy, parse_retry_after
+except:
+    from basketball_reference_scraper.cache import get_cache, get_ttl
+    from basketball_reference_scraper.rate_limit import get_rate_limiter
+    from basketball_reference_scraper.retry import (get_circuit_breaker,
+                                                    get_retry_policy,
+                                                    parse_retry_after)
 
+"""
+    Selenium drivers are expensive to start, so none is created until a page
+    actually has to be rendered. Drivers are kept in a bounded pool and reused
+    by later calls; rendered pages are kept in a small in-memory LRU (and the
+    persistent response cache) so several XPath extractions against the same
+    URL cost a single page load.
+"""
 
-def get_selenium_wrapper(url, xpath):
-    global last_request
-    # Verify last request was 3 seconds ago
-    if 0 < time() - last_request < 3:
-        sleep(3)
-    last_request = time()
+MAX_DRIVERS = 1
+MAX_RENDERED_PAGES = 32
+
+_idle_drivers = LifoQueue()
+_all_drivers = []
+_driver_lock = threading.Lock()
+_rendered_pages = OrderedDict()
+_rendered_lock = threading.Lock()
+
+
+def _create_driver():
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--headless=new")
+    return webdriver.Chrome(options=options)
+
+
+def _acquire_driver():
+    try:
+        return _idle_drivers.get_nowait()
+    except Empty:
+        pass
+    with _driver_lock:
+        if len(_all_drivers) < MAX_DRIVERS:
+            driver = _create_driver()
+            _all_drivers.append(driver)
+            return driver
+    return _idle_drivers.get()
+
+
+def _release_driver(driver):
+    _idle_drivers.put(driver)
+
+
+def set_driver_pool_size(size):
+    """Set the maximum number of headless Chrome drivers kept alive at once."""
+    global MAX_DRIVERS
+    if size < 1:
+        raise ValueError("Driver pool size must be at least 1")
+    MAX_DRIVERS = size
+
+
+@atexit.register
+def close_drivers():
+    """Quit every pooled driver; a new one is started lazily on the next render."""
+    with _driver_lock:
+        while _all_drivers:
+            driver = _all_drivers.pop()
+            try:
+                driver.quit()
+            except:
+                pass
+        while not _idle_drivers.empty():
+            _idle_drivers.get_nowait()
+
+
+def _remember_rendered(url, page_source):
+    with _rendered_lock:
+        _rendered_pages[url] = page_source
+        _rendered_pages.move_to_end(url)
+        while len(_rendered_pages) > MAX_RENDERED_PAGES:
+            _rendered_pages.popitem(last=False)
+
+
+"""
+    Concurrent requests for the same page are coalesced: the first caller
+    performs the fetch and every caller that asks for the same key while it is
+    in flight waits for, and shares, that result. Threads and coroutines share
+    the same table of in-flight fetches.
+"""
+
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _join_or_lead(key):
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future, False
+        future = Future()
+        _inflight[key] = future
+        return future, True
+
+
+def _finish(key, future, result=None, error=None):
+    with _inflight_lock:
+        _inflight.pop(key, None)
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def _single_flight(key, fetch):
+    future, leader = _join_or_lead(key)
+    if not leader:
+        return future.result()
+    try:
+        result = fetch()
+    except BaseException as e:
+        _finish(key, future, error=e)
+        raise
+    _finish(key, future, result)
+    return result
+
+
+async def _single_flight_async(key, fetch):
+    future, leader = _join_or_lead(key)
+    if not leader:
+        return await asyncio.wrap_future(future)
+    try:
+        result = await fetch()
+    except BaseException as e:
+        _finish(key, future, error=e)
+        raise
+    _finish(key, future, result)
+    return result
+
+
+def _render_page(url):
+    with _rendered_lock:
+        if url in _rendered_pages:
+            _rendered_pages.move_to_end(url)
+            return _rendered_pages[url]
+    cache = get_cache()
+    key = f"rendered:{url}"
+    if cache is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            page_source = entry[2].decode("utf-8")
+            _remember_rendered(url, page_source)
+            return page_source
+    return _single_flight(key, lambda: _render_uncached(url, key, cache))
+
+
+def _render_uncached(url, key, cache):
+    get_circuit_breaker().check()
+    get_rate_limiter().acquire()
+    driver = _acquire_driver()
     try:
         driver.get(url)
-        element = driver.find_element(By.XPATH, xpath)
-        return f'<table>{element.get_attribute("innerHTML")}</table>'
+        page_source = driver.page_source
+    finally:
+        _release_driver(driver)
+    _remember_rendered(url, page_source)
+    if cache is not None:
+        cache.set(key, 200, {}, page_source.encode("utf-8"), get_ttl(url))
+    return page_source
+
+
+"""
+    Plain HTTP requests share a single requests.Session so that connections to
+    basketball-reference.com are pooled and kept alive between calls instead of
+    paying a TCP and TLS handshake per page.
+"""
+
+POOL_SIZE = 10
+DEFAULT_TIMEOUT = (10, 30)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _accept_encoding():
+    try:
+        import brotli
+    except ImportError:
+        try:
+            import brotlicffi
+        except ImportError:
+            return "gzip, deflate"
+    return "gzip, deflate, br"
+
+
+def _mount_adapter(session):
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    old = session.adapters.get("https://")
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if old is not None:
+        old.close()
+
+
+def get_session():
+    """Return the pooled keep-alive Session used by get_wrapper, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = Session()
+            _mount_adapter(session)
+            session.headers.update(
+                {"Accept-Encoding": _accept_encoding(), "Connection": "keep-alive"}
+            )
+            _session = session
+        return _session
+
+
+def configure_session(pool_size=None, timeout=None, headers=None):
+    """Change the connection pool size, default timeout or headers of the shared Session.
+
+    Args:
+        pool_size (int, optional): Number of pooled connections. Defaults to 10.
+        timeout (float | tuple, optional): (connect, read) timeout in seconds. Defaults to (10, 30).
+        headers (dict, optional): Extra headers sent with every request.
+    """
+    global POOL_SIZE, DEFAULT_TIMEOUT
+    if timeout is not None:
+        DEFAULT_TIMEOUT = timeout
+    with _session_lock:
+        if pool_size is not None:
+            POOL_SIZE = pool_size
+            # resize the pool in place so headers and cookies set earlier are kept
+            if _session is not None:
+                _mount_adapter(_session)
+    if headers:
+        get_session().headers.update(headers)
+
+
+def _cached_response(url, entry):
+    status_code, headers, content = entry
+    r = Response()
+    r.url = url
+    r.status_code = status_code
+    r.headers = CaseInsensitiveDict(headers)
+    r.encoding = get_encoding_from_headers(r.headers)
+    r._content = content
+    return r
+
+
+def get_selenium_wrapper(url, xpath):
+    try:
+        page = lxml_html.fromstring(_render_page(url))
+        element = page.xpath(xpath)[0]
+        inner_html = (element.text or "") + "".join(
+            lxml_html.tostring(child, encoding="unicode") for child in element
+        )
+        return f"<table>{inner_html}</table>"
     except:
         print("Error obtaining data table.")
         return None
 
 
+def _store(cache, url, r):
+    if cache is not None and r.status_code == 200:
+        headers = {"Content-Type": r.headers.get("Content-Type", "text/html")}
+        cache.set(url, r.status_code, headers, r.content, get_ttl(url))
+
+
+def _handle_failure(url, attempt, started, r, error):
+    """Return the delay before retrying a failed attempt, or None to give up.
+
+    Only a call that gives up counts as a failure for the circuit breaker, so one
+    call working through its retries cannot open the circuit on its own.
+    """
+    policy = get_retry_policy()
+    if error is not None and not policy.is_retryable(error=error):
+        raise error
+    delay = policy.next_delay(attempt, started, r)
+    if delay is None:
+        retry_after = None
+        if r is not None:
+            retry_after = parse_retry_after(r.headers.get("Retry-After"))
+        get_circuit_breaker().record_failure(retry_after)
+        if error is not None:
+            raise error
+        return None
+    reason = r.status_code if r is not None else type(error).__name__
+    print(f"Request to {url} failed ({reason}), retrying after {delay:.1f} sec...")
+    return delay
+
+
 def get_wrapper(url):
-    global last_request
-    # Verify last request was 3 seconds ago
-    if 0 < time() - last_request < 3:
-        sleep(3)
-    last_request = time()
-    r = get(url)
+    cache = get_cache()
+    if cache is not None:
+        entry = cache.get(url)
+        if entry is not None:
+            return _cached_response(url, entry)
+    return _single_flight(url, lambda: _fetch(url, cache))
+
+
+def _fetch(url, cache):
+    policy = get_retry_policy()
+    started = monotonic()
+    attempt = 0
+    while True:
+        get_circuit_breaker().check()
+        attempt += 1
+        get_rate_limiter().acquire()
+        r, error = None, None
+        try:
+            r = get_session().get(
+                url, timeout=policy.request_timeout(DEFAULT_TIMEOUT, started)
+            )
+        except Exception as e:
+            error = e
+        if error is None and not policy.is_retryable(response=r):
+            get_circuit_breaker().record_success()
+            _store(cache, url, r)
+            return r
+        delay = _handle_failure(url, attempt, started, r, error)
+        if delay is None:
+            return r
+        sleep(delay)
+
+
+async def get_wrapper_async(url):
+    """Awaitable get_wrapper sharing the same cache, rate limiter, retry policy and Session.
+
+    Waiting for the rate limiter and between retries happens on the event loop;
+    the blocking request itself runs in the default executor.
+    """
+    cache = get_cache()
+    if cache is not None:
+        entry = cache.get(url)
+        if entry is not None:
+            return _cached_response(url, entry)
+    return await _single_flight_async(url, lambda: _fetch_async(url, cache))
+
+
+async def _fetch_async(url, cache):
+    policy = get_retry_policy()
+    started = monotonic()
+    attempt = 0
     while True:
-        if r.status_code == 200:
+        get_circuit_breaker().check()
+        attempt += 1
+        await get_rate_limiter().acquire_async()
+        r, error = None, None
+        try:
+            r = await asyncio.to_thread(
+                get_session().get,
+                url,
+                timeout=policy.request_timeout(DEFAULT_TIMEOUT, started),
+            )
+        except Exception as e:
+            error = e
+        if error is None and not policy.is_retryable(response=r):
+            get_circuit_breaker().record_success()
+            _store(cache, url, r)
             return r
-        elif r.status_code == 429:
-            retry_time = int(r.headers["Retry-After"])
-            print(f"Retrying after {retry_time} sec...")
-            sleep(retry_time)
-        else:
+        delay = _handle_failure(url, attempt, started, r, error)
+        if delay is None:
             return r
+        await asyncio.sleep(delay)
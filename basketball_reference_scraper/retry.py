@@ -0,0 +1,182 @@
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from time import monotonic, time
+
+from requests.exceptions import ChunkedEncodingError
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+
+"""
+    Retry and circuit-breaker policy shared by every fetch path.
+
+    Throttled (429) and server error responses as well as connection errors and
+    timeouts are retried with exponential backoff and jitter, honouring the
+    Retry-After header when the site sends one. Each call has an overall
+    deadline so a crawl has a predictable worst-case latency, and a circuit
+    breaker stops a bulk crawl outright once the site keeps refusing requests
+    instead of letting every remaining call wait out its own retries.
+"""
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_ERRORS = (RequestsConnectionError, Timeout, ChunkedEncodingError)
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of making a request while the circuit breaker is open."""
+
+
+def parse_retry_after(value):
+    """Seconds to wait according to a Retry-After header (delta-seconds or HTTP date)."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts=4,
+        backoff_base=2.0,
+        backoff_max=60.0,
+        jitter=0.25,
+        deadline=300.0,
+        retry_statuses=RETRY_STATUSES,
+    ):
+        """
+        Args:
+            max_attempts (int): Total number of attempts per call, including the first.
+            backoff_base (float): Delay before the first retry; doubled on every further retry.
+            backoff_max (float): Upper bound of a single backoff delay.
+            jitter (float): Fraction of each backoff delay that is randomised.
+            deadline (float): Overall budget in seconds for one call, retries included.
+            retry_statuses (tuple): HTTP status codes that are retried.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_statuses = retry_statuses
+
+    def is_retryable(self, response=None, error=None):
+        if error is not None:
+            return isinstance(error, RETRY_ERRORS)
+        return response.status_code in self.retry_statuses
+
+    def remaining(self, started):
+        return self.deadline - (monotonic() - started)
+
+    def request_timeout(self, timeout, started):
+        """Clamp a (connect, read) timeout so a single request cannot overrun the deadline."""
+        remaining = max(0.1, self.remaining(started))
+        if isinstance(timeout, tuple):
+            return tuple(min(t, remaining) for t in timeout)
+        return min(timeout, remaining)
+
+    def next_delay(self, attempt, started, response=None):
+        """Delay before the next attempt, or None when attempts or the deadline are exhausted."""
+        if attempt >= self.max_attempts:
+            return None
+        retry_after = None
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+            delay *= 1 - self.jitter * random.random()
+        if delay > self.remaining(started):
+            return None
+        return delay
+
+
+class CircuitBreaker:
+    def __init__(self, threshold=5, cooldown=300.0):
+        """
+        Args:
+            threshold (int): Consecutive calls that failed after all their retries before the circuit opens.
+            cooldown (float): Seconds the circuit stays open before a trial request is let through.
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return monotonic() < self.open_until
+
+    def check(self):
+        """Raise CircuitOpenError if requests are currently suspended."""
+        with self._lock:
+            remaining = self.open_until - monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(
+                f"Basketball reference is throttling requests; circuit open for another {remaining:.0f} sec"
+            )
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.open_until = 0.0
+
+    def record_failure(self, retry_after=None):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.open_until = monotonic() + max(self.cooldown, retry_after or 0)
+
+    def reset(self):
+        self.record_success()
+
+
+_policy = RetryPolicy()
+_breaker = CircuitBreaker()
+
+
+def get_retry_policy():
+    return _policy
+
+
+def get_circuit_breaker():
+    return _breaker
+
+
+def configure_retry(
+    max_attempts=4,
+    backoff_base=2.0,
+    backoff_max=60.0,
+    jitter=0.25,
+    deadline=300.0,
+    retry_statuses=RETRY_STATUSES,
+    breaker_threshold=5,
+    breaker_cooldown=300.0,
+):
+    """Replace the shared retry policy and circuit breaker.
+
+    Args:
+        max_attempts (int, optional): Attempts per call, including the first. Defaults to 4.
+        backoff_base (float, optional): First backoff delay in seconds. Defaults to 2.
+        backoff_max (float, optional): Largest backoff delay in seconds. Defaults to 60.
+        jitter (float, optional): Randomised fraction of each delay. Defaults to 0.25.
+        deadline (float, optional): Overall budget for one call in seconds. Defaults to 300.
+        retry_statuses (tuple, optional): Status codes to retry. Defaults to 429 and 5xx gateway errors.
+        breaker_threshold (int, optional): Consecutive calls failing after their retries that open the circuit. Defaults to 5.
+        breaker_cooldown (float, optional): Seconds the circuit stays open. Defaults to 300.
+    """
+    global _policy, _breaker
+    _policy = RetryPolicy(
+        max_attempts, backoff_base, backoff_max, jitter, deadline, retry_statuses
+    )
+    _breaker = CircuitBreaker(breaker_threshold, breaker_cooldown)
@@ -1,17 +1,45 @@
 from datetime import datetime
 
 import pandas as pd
-from bs4 import BeautifulSoup
 
 try:
+    from page import get_table, link_ids, table_to_df
     from request_utils import get_wrapper
-    from utils import format_html
 except:
+    from basketball_reference_scraper.page import (get_table, link_ids,
+                                                   table_to_df)
     from basketball_reference_scraper.request_utils import get_wrapper
-    from basketball_reference_scraper.utils import format_html
+
+
+SCHEDULE_COLUMNS = [
+    "DATE",
+    "VISITOR",
+    "VISITOR_PTS",
+    "HOME",
+    "HOME_PTS",
+    "OT?",
+    "LOG",
+    "GAME_ID",
+]
 
 
 def get_schedule(season, playoffs=False):
+    return _format_schedule(_get_schedule_months(season), season, playoffs)
+
+
+def _get_schedule_months(season):
+    # regular season and playoffs share the month pages; split them with _format_schedule
+    df = pd.DataFrame()
+    for url in _get_schedule_urls(season):
+        r = get_wrapper(url)
+        if r.status_code == 200:
+            month_df = _parse_schedule_month(r.content)
+            if month_df is not None:
+                df = pd.concat([df, month_df])
+    return df
+
+
+def _get_schedule_urls(season):
     months = [
         "October",
         "November",
@@ -36,18 +64,25 @@ def get_schedule(season, playoffs=False):
             "September",
             "October-2020",
         ]
-    df = pd.DataFrame()
-    for month in months:
-        r = get_wrapper(
-            f"https://www.basketball-reference.com/leagues/NBA_{season}_games-{month.lower()}.html"
-        )
-        if r.status_code == 200:
-            soup = BeautifulSoup(r.content, "html.parser")
-            table = soup.find("table", attrs={"id": "schedule"})
-            if table:
-                month_df = pd.read_html(format_html(table))[0]
-                df = pd.concat([df, month_df])
+    return [
+        f"https://www.basketball-reference.com/leagues/NBA_{season}_games-{month.lower()}.html"
+        for month in months
+    ]
+
+
+def _parse_schedule_month(content):
+    table = get_table(content, "schedule")
+    if table:
+        # the 'Playoffs' header row is kept, it is where the playoffs start
+        df = table_to_df(table, links={"box_score_text": "GAME_ID"}, skip_headers=False)
+        df["GAME_ID"] = link_ids(df["GAME_ID"])
+        return df
+
 
+def _format_schedule(df, season, playoffs):
+    # seasons that have not been published yet have no schedule pages
+    if df.empty:
+        return pd.DataFrame(columns=SCHEDULE_COLUMNS)
     df = df.reset_index()
 
     cols_to_remove = [i for i in df.columns if "Unnamed: 6" in i]
@@ -58,7 +93,7 @@ def get_schedule(season, playoffs=False):
     cols_to_remove += ["index"]
     df = df.drop(cols_to_remove, axis=1)
 
-    df.columns = ["DATE", "VISITOR", "VISITOR_PTS", "HOME", "HOME_PTS", "OT?", "LOG"]
+    df.columns = SCHEDULE_COLUMNS
     df["OT?"] = df["OT?"].fillna("N").apply(lambda x: "Y" if x == "OT" else "N")
 
     if season == 2020:
@@ -102,9 +137,8 @@ def get_standings(date=None):
         f"https://www.basketball-reference.com/friv/standings.fcgi?month={date.month}&day={date.day}&year={date.year}"
     )
     if r.status_code == 200:
-        soup = BeautifulSoup(r.content, "html.parser")
-        e_table = soup.find("table", attrs={"id": "standings_e"})
-        w_table = soup.find("table", attrs={"id": "standings_w"})
+        e_table = get_table(r.content, "standings_e")
+        w_table = get_table(r.content, "standings_w")
         e_df = pd.DataFrame(
             columns=["TEAM", "W", "L", "W/L%", "GB", "PW", "PL", "PS/G", "PA/G"]
         )
@@ -112,8 +146,8 @@ def get_standings(date=None):
             columns=["TEAM", "W", "L", "W/L%", "GB", "PW", "PL", "PS/G", "PA/G"]
         )
         if e_table and w_table:
-            e_df = pd.read_html(format_html(e_table))[0]
-            w_df = pd.read_html(format_html(w_table))[0]
+            e_df = table_to_df(e_table)
+            w_df = table_to_df(w_table)
             e_df.rename(columns={"Eastern Conference": "TEAM"}, inplace=True)
             w_df.rename(columns={"Western Conference": "TEAM"}, inplace=True)
         d["EASTERN_CONF"] = e_df
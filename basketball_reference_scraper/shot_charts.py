@@ -1,43 +1,48 @@
 import re
 from datetime import datetime
-from typing import List
 
 import pandas as pd
-from bs4 import BeautifulSoup
-from requests import get
+from bs4 import SoupStrainer
 
 try:
+    from page import parse_html
     from request_utils import get_wrapper
-    from utils import get_game_suffix
+    from utils import game_teams, get_game_suffix, parse_game_id
 except:
+    from basketball_reference_scraper.page import parse_html
     from basketball_reference_scraper.request_utils import get_wrapper
-    from basketball_reference_scraper.utils import get_game_suffix
+    from basketball_reference_scraper.utils import (game_teams,
+                                                    get_game_suffix,
+                                                    parse_game_id)
 
 
-def get_location(s):
-    l = s.split(";")
-    top = float(l[0][l[0].index(":") + 1 : l[0].index("px")])
-    left = float(l[1][l[1].index(":") + 1 : l[1].index("px")])
-    x = left / 500.0 * 50
-    y = top / 472.0 * (94 / 2)
-    return {"x": str(x)[:4] + " ft", "y": str(y)[:4] + " ft"}
+"""
+    Shots are read from the style (position) and tip (description) attributes
+    of the markers in each team's chart. The attributes of a whole chart are
+    parsed at once with precompiled patterns, and positions are converted from
+    pixels to feet on a half court (500px x 472px for 50ft x 47ft).
+"""
 
-
-def get_description(s):
-    match = re.match(
-        r"(\d)[a-z]{2} quarter, (\S*) remaining<br>(.*) \b(missed|made) (\d)-pointer from (\d*) ft",
-        s,
-    )
-    d = {}
-    if match:
-        groups = match.groups()
-        d["QUARTER"] = int(groups[0])
-        d["TIME_REMAINING"] = groups[1]
-        d["PLAYER"] = groups[2]
-        d["MAKE_MISS"] = "MAKE" if groups[3] == "made" else "MISS"
-        d["VALUE"] = int(groups[4])
-        d["DISTANCE"] = groups[5] + " ft"
-    return d
+STYLE_RE = re.compile(r"top:\s*(?P<top>-?[\d.]+)px;\s*left:\s*(?P<left>-?[\d.]+)px")
+TIP_RE = re.compile(
+    r"(?P<period>\d)[a-z]{2} (?P<period_type>quarter|overtime|OT), (?P<time>\S*) remaining<br>"
+    r"(?P<player>.*) \b(?P<result>missed|made) (?P<value>\d)-pointer from (?P<distance>\d*) ft"
+)
+SHOTS_DIV_RE = re.compile(r'id="shots-([A-Z]{3})"')
+COURT_WIDTH_PX, COURT_WIDTH_FT = 500.0, 50
+COURT_LENGTH_PX, COURT_LENGTH_FT = 472.0, 94 / 2
+SHOT_COLUMNS = [
+    "x",
+    "y",
+    "QUARTER",
+    "TIME_REMAINING",
+    "SECONDS_REMAINING",
+    "PLAYER",
+    "MAKE_MISS",
+    "MAKE",
+    "VALUE",
+    "DISTANCE",
+]
 
 
 def get_shot_chart(date, team1, team2):
@@ -47,29 +52,77 @@ def get_shot_chart(date, team1, team2):
         f"https://www.basketball-reference.com/boxscores/shot-chart{suffix}"
     )
     if r.status_code == 200:
-        soup = BeautifulSoup(r.content, "html.parser")
-        shot_chart1_div = soup.find("div", attrs={"id": f"shots-{team1}"})
-        shot_chart2_div = soup.find("div", attrs={"id": f"shots-{team2}"})
-        items1: List = []
-        for div in shot_chart1_div.find_all("div"):
-            if "style" not in div.attrs or "tip" not in div.attrs:
-                continue
-            location = get_location(div.attrs["style"])
-            description = get_description(div.attrs["tip"])
-            shot_d = {**location, **description}
-            items1.append(shot_d)
-
-        df1 = pd.DataFrame(items1)
-        items2: List = []
-        for div in shot_chart2_div.find_all("div"):
-            if "style" not in div.attrs or "tip" not in div.attrs:
-                continue
-            location = get_location(div.attrs["style"])
-            description = get_description(div.attrs["tip"])
-            shot_d = {**location, **description}
-            items2.append(shot_d)
-        df2 = pd.DataFrame(items2)
-
-        return {f"{team1}": df1, f"{team2}": df2}
+        return _parse_shot_chart(r.content, team1, team2)
     else:
         raise ConnectionError("Request to basketball reference failed")
+
+
+def get_shot_chart_by_id(game_id):
+    """Shot charts of a game by its ID, without looking the game up on the scoreboard.
+
+    Args:
+        game_id (str): The game ID, e.g. '202001060DEN' from the GAME_ID column of get_schedule.
+
+    Returns:
+        dict: the shot charts of the visitor and the home team, shaped as get_shot_chart returns them.
+    """
+    parse_game_id(game_id)
+    r = get_wrapper(
+        f"https://www.basketball-reference.com/boxscores/shot-chart/{game_id}.html"
+    )
+    if r.status_code == 200:
+        away, home = game_teams(_shot_chart_teams(r.content), game_id)
+        return _parse_shot_chart(r.content, away, home)
+    else:
+        raise ConnectionError("Request to basketball reference failed")
+
+
+def _shot_chart_teams(content):
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", errors="replace")
+    # the visitor's chart comes first
+    return list(dict.fromkeys(SHOTS_DIV_RE.findall(content)))
+
+
+def _parse_shots(chart_div):
+    styles, tips = [], []
+    if chart_div is not None:
+        for div in chart_div.find_all("div", attrs={"style": True, "tip": True}):
+            styles.append(div.attrs["style"])
+            tips.append(div.attrs["tip"])
+    position = pd.Series(styles, dtype="object").str.extract(STYLE_RE)
+    shot = pd.Series(tips, dtype="object").str.extract(TIP_RE)
+    valid = position.notna().all(axis=1) & shot["player"].notna()
+    position, shot = position[valid], shot[valid]
+
+    period = shot["period"].astype("int8")
+    period = period.where(shot["period_type"] == "quarter", period + 4)
+    clock = shot["time"].str.split(":", n=1, expand=True).reindex(columns=[0, 1])
+    make = shot["result"] == "made"
+    df = pd.DataFrame(
+        {
+            "x": position["left"].astype("float64") / COURT_WIDTH_PX * COURT_WIDTH_FT,
+            "y": position["top"].astype("float64") / COURT_LENGTH_PX * COURT_LENGTH_FT,
+            "QUARTER": period.astype("int8"),
+            "TIME_REMAINING": shot["time"],
+            "SECONDS_REMAINING": (
+                pd.to_numeric(clock[0]) * 60 + pd.to_numeric(clock[1])
+            ).astype("float32"),
+            "PLAYER": shot["player"],
+            "MAKE_MISS": make.map({True: "MAKE", False: "MISS"}),
+            "MAKE": make.astype("bool"),
+            "VALUE": shot["value"].astype("int8"),
+            "DISTANCE": pd.to_numeric(shot["distance"]).astype("float32"),
+        },
+        columns=SHOT_COLUMNS,
+    )
+    return df.astype({"x": "float32", "y": "float32"}).reset_index(drop=True)
+
+
+def _parse_shot_chart(content, team1, team2):
+    strainer = SoupStrainer("div", attrs={"id": re.compile(r"^shots-")})
+    soup = parse_html(content, strainer)
+    return {
+        team: _parse_shots(soup.find("div", attrs={"id": f"shots-{team}"}))
+        for team in (team1, team2)
+    }
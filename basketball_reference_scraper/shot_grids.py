@@ -0,0 +1,352 @@
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    from bulk import BASE_URL, _fetch_game, iter_games
+    from shot_charts import _parse_shot_chart, _shot_chart_teams
+    from utils import game_teams
+except:
+    from basketball_reference_scraper.bulk import (BASE_URL, _fetch_game,
+                                                   iter_games)
+    from basketball_reference_scraper.shot_charts import (_parse_shot_chart,
+                                                          _shot_chart_teams)
+    from basketball_reference_scraper.utils import game_teams
+
+"""
+    Season shot grids: shots binned into fixed-size numpy grids per
+    (team, player, period), with attempts and makes per court zone alongside.
+    Grids are kept in a single .npz file together with the ids of the games
+    they contain, so harvesting a season again only fetches the new games and
+    adds them to the existing counts.
+
+    Coordinates are the shot chart's half-court feet: x runs 0-50 across the
+    court, y 0-47 from the baseline, with the basket at (25, 5.25).
+"""
+
+COURT_WIDTH = 50.0
+HALF_COURT_LENGTH = 47.0
+BASKET_X = 25.0
+BASKET_Y = 5.25
+RESTRICTED_AREA_RADIUS = 4.0
+LANE_HALF_WIDTH = 8.0
+FREE_THROW_LINE_Y = 19.0
+THREE_POINT_RADIUS = 23.75
+CORNER_THREE_X = 22.0
+CORNER_THREE_Y = 14.0
+
+ZONES = [
+    "RESTRICTED_AREA",
+    "PAINT",
+    "MID_RANGE",
+    "CORNER_3",
+    "ABOVE_BREAK_3",
+    "BACKCOURT",
+]
+BINNINGS = ("rect", "hex")
+SAVE_EVERY = 25
+
+
+def classify_zones(x, y):
+    """Court zone index (into ZONES) of every shot.
+
+    Args:
+        x (array-like): Shot x coordinates in feet.
+        y (array-like): Shot y coordinates in feet.
+
+    Returns:
+        ndarray: int8 zone indices.
+    """
+    x = np.asarray(x, dtype="float32")
+    y = np.asarray(y, dtype="float32")
+    distance = np.hypot(x - BASKET_X, y - BASKET_Y)
+    corner = (np.abs(x - BASKET_X) >= CORNER_THREE_X) & (y <= CORNER_THREE_Y)
+    paint = (np.abs(x - BASKET_X) <= LANE_HALF_WIDTH) & (y <= FREE_THROW_LINE_Y)
+    return np.select(
+        [
+            y > HALF_COURT_LENGTH,
+            corner,
+            distance >= THREE_POINT_RADIUS,
+            distance <= RESTRICTED_AREA_RADIUS,
+            paint,
+        ],
+        [
+            ZONES.index("BACKCOURT"),
+            ZONES.index("CORNER_3"),
+            ZONES.index("ABOVE_BREAK_3"),
+            ZONES.index("RESTRICTED_AREA"),
+            ZONES.index("PAINT"),
+        ],
+        ZONES.index("MID_RANGE"),
+    ).astype("int8")
+
+
+def grid_shape(binning="rect", bin_size=1.0):
+    if binning == "rect":
+        return (
+            math.ceil(HALF_COURT_LENGTH / bin_size),
+            math.ceil(COURT_WIDTH / bin_size),
+        )
+    if binning == "hex":
+        return (
+            math.ceil(HALF_COURT_LENGTH / (1.5 * bin_size)) + 1,
+            math.ceil(COURT_WIDTH / (math.sqrt(3) * bin_size)) + 2,
+        )
+    raise ValueError(f"binning must be one of {list(BINNINGS)}")
+
+
+def bin_index(x, y, binning="rect", bin_size=1.0):
+    """(row, column) grid cell of every shot; cells outside the grid are -1.
+
+    Rectangular cells are bin_size feet wide. Hexagonal cells are pointy-top
+    hexagons with a bin_size circumradius in odd-row offset layout, shifted by
+    half a cell so the left sideline falls inside column 0.
+    """
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    rows, cols = grid_shape(binning, bin_size)
+    if binning == "rect":
+        row = np.floor(y / bin_size)
+        col = np.floor(x / bin_size)
+    else:
+        x = x + math.sqrt(3) * bin_size / 2
+        # axial coordinates, rounded through cube coordinates
+        q = (math.sqrt(3) / 3 * x - y / 3) / bin_size
+        r = (2 / 3 * y) / bin_size
+        s = -q - r
+        rq, rr, rs = np.round(q), np.round(r), np.round(s)
+        dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+        fix_q = (dq > dr) & (dq > ds)
+        fix_r = ~fix_q & (dr > ds)
+        rq = np.where(fix_q, -rr - rs, rq)
+        rr = np.where(fix_r, -rq - rs, rr)
+        row = rr
+        col = rq + (rr - np.mod(rr, 2)) / 2
+    inside = (row >= 0) & (row < rows) & (col >= 0) & (col < cols)
+    row = np.where(inside, row, -1).astype("int32")
+    col = np.where(inside, col, -1).astype("int32")
+    return row, col
+
+
+def bin_centers(binning="rect", bin_size=1.0):
+    """x and y coordinates in feet of the center of every grid cell, each shaped like the grid."""
+    rows, cols = grid_shape(binning, bin_size)
+    row, col = np.indices((rows, cols), dtype="float64")
+    if binning == "rect":
+        return (col + 0.5) * bin_size, (row + 0.5) * bin_size
+    width = math.sqrt(3) * bin_size
+    return width * (col + 0.5 * np.mod(row, 2)) - width / 2, 1.5 * bin_size * row
+
+
+class ShotGrids:
+    def __init__(self, binning="rect", bin_size=1.0):
+        """
+        Args:
+            binning (str): 'rect' or 'hex'.
+            bin_size (float): Cell width (rect) or circumradius (hex) in feet.
+        """
+        self.binning = binning
+        self.bin_size = float(bin_size)
+        self.shape = grid_shape(binning, bin_size)
+        self.groups = []
+        self.games = set()
+        self._group_index = {}
+        # arrays are over-allocated and grown by doubling as groups are added
+        self._attempts = np.zeros((0,) + self.shape, dtype="int32")
+        self._makes = np.zeros((0,) + self.shape, dtype="int32")
+        self._zone_attempts = np.zeros((0, len(ZONES)), dtype="int32")
+        self._zone_makes = np.zeros((0, len(ZONES)), dtype="int32")
+
+    @property
+    def attempts(self):
+        return self._attempts[: len(self.groups)]
+
+    @property
+    def makes(self):
+        return self._makes[: len(self.groups)]
+
+    @property
+    def zone_attempts(self):
+        return self._zone_attempts[: len(self.groups)]
+
+    @property
+    def zone_makes(self):
+        return self._zone_makes[: len(self.groups)]
+
+    def _reserve(self, size):
+        capacity = len(self._attempts)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 16)
+        for name in ("_attempts", "_makes", "_zone_attempts", "_zone_makes"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def _group_ids(self, keys):
+        for key in dict.fromkeys(keys):
+            if key not in self._group_index:
+                self._group_index[key] = len(self.groups)
+                self.groups.append(key)
+        self._reserve(len(self.groups))
+        return np.array([self._group_index[key] for key in keys], dtype="int64")
+
+    def add(self, shots, game_id=None):
+        """Add shots to the grids.
+
+        Args:
+            shots (DataFrame): Shots with TEAM, PLAYER, QUARTER, x, y and MAKE columns.
+            game_id (str, optional): Game the shots come from; recorded so it is not added twice.
+        """
+        if game_id is not None and game_id in self.games:
+            return
+        if len(shots):
+            keys = list(
+                zip(
+                    shots["TEAM"].astype(str),
+                    shots["PLAYER"].astype(str),
+                    shots["QUARTER"].astype(int),
+                )
+            )
+            group = self._group_ids(keys)
+            make = shots["MAKE"].to_numpy(dtype=bool)
+            zone = classify_zones(shots["x"], shots["y"])
+            np.add.at(self._zone_attempts, (group, zone), 1)
+            np.add.at(self._zone_makes, (group[make], zone[make]), 1)
+            row, col = bin_index(shots["x"], shots["y"], self.binning, self.bin_size)
+            on_grid = row >= 0
+            cells = (group[on_grid], row[on_grid], col[on_grid])
+            np.add.at(self._attempts, cells, 1)
+            on_grid &= make
+            np.add.at(self._makes, (group[on_grid], row[on_grid], col[on_grid]), 1)
+        if game_id is not None:
+            self.games.add(game_id)
+
+    def _select(self, team=None, player=None, quarter=None):
+        return [
+            i
+            for i, (g_team, g_player, g_quarter) in enumerate(self.groups)
+            if (team is None or g_team == team)
+            and (player is None or g_player == player)
+            and (quarter is None or g_quarter == quarter)
+        ]
+
+    def grid(self, team=None, player=None, quarter=None, makes=False):
+        """Attempts (or makes) summed over the groups matching the filters."""
+        grids = self.makes if makes else self.attempts
+        return grids[self._select(team, player, quarter)].sum(axis=0)
+
+    def zones(self, team=None, player=None, quarter=None):
+        """Attempts, makes and percentage per court zone for the matching groups."""
+        selected = self._select(team, player, quarter)
+        attempts = self.zone_attempts[selected].sum(axis=0)
+        makes = self.zone_makes[selected].sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = np.where(attempts > 0, makes / attempts, np.nan)
+        return pd.DataFrame({"ZONE": ZONES, "FGA": attempts, "FG": makes, "FG%": pct})
+
+    def save(self, path):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.tmp.npz"
+        np.savez_compressed(
+            tmp,
+            binning=np.array(self.binning),
+            bin_size=np.array(self.bin_size),
+            groups=np.array(
+                [(t, p, str(q)) for t, p, q in self.groups], dtype="str"
+            ).reshape(-1, 3),
+            games=np.array(sorted(self.games), dtype="str"),
+            attempts=self.attempts,
+            makes=self.makes,
+            zone_attempts=self.zone_attempts,
+            zone_makes=self.zone_makes,
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            grids = cls(str(data["binning"]), float(data["bin_size"]))
+            grids.groups = [(str(t), str(p), int(q)) for t, p, q in data["groups"]]
+            grids._group_index = {key: i for i, key in enumerate(grids.groups)}
+            grids.games = set(data["games"].tolist())
+            grids._attempts = data["attempts"]
+            grids._makes = data["makes"]
+            grids._zone_attempts = data["zone_attempts"]
+            grids._zone_makes = data["zone_makes"]
+        return grids
+
+
+def _get_shot_chart_url(game):
+    return f"{BASE_URL}/boxscores/shot-chart/{game['GAME_ID']}.html"
+
+
+def _parse_game_shots(content, game_id):
+    away, home = game_teams(_shot_chart_teams(content), game_id)
+    charts = _parse_shot_chart(content, away, home)
+    return pd.concat(
+        [df.assign(TEAM=team) for team, df in charts.items()], ignore_index=True
+    )
+
+
+def harvest_shot_grids(
+    path,
+    season=None,
+    start_date=None,
+    end_date=None,
+    playoffs=False,
+    binning="rect",
+    bin_size=1.0,
+):
+    """Bin the shots of every game in a season or date range into a .npz file.
+
+    Games already in the file are skipped, so running this again after new games
+    were played only fetches those games.
+
+    Args:
+        path (str): The .npz file to create or update.
+        season (int, optional): Season end year. Either season or start_date is required.
+        start_date (str | datetime, optional): First date of the range.
+        end_date (str | datetime, optional): Last date of the range (inclusive). Defaults to start_date.
+        playoffs (bool, optional): With season, harvest the playoffs instead of the regular season. Defaults to False.
+        binning (str, optional): 'rect' or 'hex'. Defaults to 'rect'.
+        bin_size (float, optional): Cell width (rect) or circumradius (hex) in feet. Defaults to 1.
+
+    Returns:
+        ShotGrids: the updated grids.
+    """
+    if os.path.exists(path):
+        grids = ShotGrids.load(path)
+        if (grids.binning, grids.bin_size) != (binning, float(bin_size)):
+            raise ValueError(
+                f"{path} holds {grids.binning} grids of size {grids.bin_size}"
+            )
+    else:
+        grids = ShotGrids(binning, bin_size)
+    added = 0
+    try:
+        for game in iter_games(season, start_date, end_date, playoffs):
+            if game["GAME_ID"] in grids.games:
+                continue
+            # the same failures bulk.harvest checkpoints are skipped here
+            content, error = _fetch_game(_get_shot_chart_url(game))
+            if error is not None:
+                print(f"Skipping {game['GAME_ID']}: {error}")
+                continue
+            try:
+                shots = _parse_game_shots(content, game["GAME_ID"])
+            except ValueError as error:
+                print(f"Skipping {game['GAME_ID']}: {error}")
+                continue
+            grids.add(shots, game["GAME_ID"])
+            added += 1
+            if added % SAVE_EVERY == 0:
+                grids.save(path)
+    finally:
+        if added:
+            grids.save(path)
+    return grids
@@ -1,179 +1,150 @@
 import re
 
 import pandas as pd
-from bs4 import BeautifulSoup
 
 try:
     from constants import TEAM_SETS, TEAM_TO_TEAM_ABBR
-    from request_utils import get_selenium_wrapper, get_wrapper
-    from utils import format_html, remove_accents
+    from page import PLAYER_LINKS, get_page, get_table, link_ids, table_to_df
+    from request_utils import get_wrapper
+    from utils import normalize_player_names
 except:
     from basketball_reference_scraper.constants import (TEAM_SETS,
                                                         TEAM_TO_TEAM_ABBR)
-    from basketball_reference_scraper.request_utils import (
-        get_selenium_wrapper, get_wrapper)
-    from basketball_reference_scraper.utils import format_html, remove_accents
+    from basketball_reference_scraper.page import (PLAYER_LINKS, get_page,
+                                                   get_table, link_ids,
+                                                   table_to_df)
+    from basketball_reference_scraper.request_utils import get_wrapper
+    from basketball_reference_scraper.utils import normalize_player_names
+
+
+def get_team_url(team, season_end_year):
+    return f"https://www.basketball-reference.com/teams/{team}/{season_end_year}.html"
+
+
+def get_league_url(season_end_year):
+    return f"https://www.basketball-reference.com/leagues/NBA_{season_end_year}.html"
 
 
 def get_roster(team, season_end_year):
-    r = get_wrapper(
-        f"https://www.basketball-reference.com/teams/{team}/{season_end_year}.html"
-    )
+    page = get_page(get_team_url(team, season_end_year))
     df = None
-    if r.status_code == 200:
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table", {"id": "roster"})
-        # get all player page urls
-        player_links = table.find_all("a", href=re.compile("/players/"))
-        player_id_map = {}
-        # build lookup of player ids
-        for item in player_links:
-            key = str(item.next)
-            value = str(item["href"]).replace(".html", "").replace("/players/", "")[2:]
-            player_id_map[key] = value
-
-        df = pd.read_html(format_html(table))[0]
-        df.columns = [
-            "NUMBER",
-            "PLAYER",
-            "POS",
-            "HEIGHT",
-            "WEIGHT",
-            "BIRTH_DATE",
-            "NATIONALITY",
-            "EXPERIENCE",
-            "COLLEGE",
-        ]
-
-        # remove (TW) suffix from player name
-        df["PLAYER"] = df["PLAYER"].apply(lambda x: str(x).replace("(TW)", "").strip())
-        # map player id using player name
-        df["PLAYER_ID"] = df["PLAYER"].map(player_id_map)
-
-        # remove rows with no player name (this was the issue above)
-        df = df[df["PLAYER"].notna()]
-        df["PLAYER"] = df["PLAYER"].apply(
-            lambda name: remove_accents(name, team, season_end_year)
-        )
-        # handle rows with empty fields but with a player name.
-        df["BIRTH_DATE"] = df["BIRTH_DATE"].apply(
-            lambda x: pd.to_datetime(x) if pd.notna(x) else pd.NaT
-        )
-        df["NATIONALITY"] = df["NATIONALITY"].apply(
-            lambda x: x.upper() if pd.notna(x) else ""
-        )
+    if page.ok:
+        df = _parse_roster(page, team, season_end_year)
 
     return df
 
 
-def get_team_stats(team, season_end_year, data_format="TOTALS"):
-    xpath = '//table[@id="team_and_opponent"]'
-    table = get_selenium_wrapper(
-        f"https://www.basketball-reference.com/teams/{team}/{season_end_year}.html",
-        xpath,
+def _parse_roster(page, team, season_end_year):
+    df = page.get_df("roster", links=PLAYER_LINKS)
+    player_ids = link_ids(df.pop("PLAYER_HREF"))
+    df.columns = [
+        "NUMBER",
+        "PLAYER",
+        "POS",
+        "HEIGHT",
+        "WEIGHT",
+        "BIRTH_DATE",
+        "NATIONALITY",
+        "EXPERIENCE",
+        "COLLEGE",
+    ]
+
+    # remove (TW) suffix from player name
+    df["PLAYER"] = df["PLAYER"].apply(lambda x: str(x).replace("(TW)", "").strip())
+    df["PLAYER_ID"] = player_ids
+
+    # remove rows with no player name (this was the issue above)
+    df = df[df["PLAYER"].notna()]
+    df["PLAYER"] = normalize_player_names(
+        df["PLAYER"], team, season_end_year, df["PLAYER_ID"]
     )
-    if not table:
+    # handle rows with empty fields but with a player name.
+    df["BIRTH_DATE"] = df["BIRTH_DATE"].apply(
+        lambda x: pd.to_datetime(x) if pd.notna(x) else pd.NaT
+    )
+    df["NATIONALITY"] = df["NATIONALITY"].apply(
+        lambda x: x.upper() if pd.notna(x) else ""
+    )
+
+    return df
+
+
+def _get_team_df(team, season_end_year, table_id, **kwargs):
+    page = get_page(get_team_url(team, season_end_year))
+    df = None
+    if page.ok:
+        df = page.get_df(table_id, **kwargs)
+    if df is None:
         raise ConnectionError("Request to basketball reference failed")
-    df = pd.read_html(format_html(table))[0]
-    opp_idx = df[df["Unnamed: 0"] == "Opponent"].index[0]
-    df = df[:opp_idx]
-    if data_format == "TOTALS":
-        row_idx = "Team"
-    elif data_format == "PER_GAME":
-        row_idx = "Team/G"
-    elif data_format == "RANK":
-        row_idx = "Lg Rank"
-    elif data_format == "YEAR/YEAR":
-        row_idx = "Year/Year"
-    else:
-        print("Invalid data format")
-        return pd.DataFrame()
+    return df
+
 
+TEAM_STATS_ROWS = {
+    "TOTALS": "Team",
+    "PER_GAME": "Team/G",
+    "RANK": "Lg Rank",
+    "YEAR/YEAR": "Year/Year",
+}
+OPP_STATS_ROWS = {
+    "TOTALS": "Opponent",
+    "PER_GAME": "Opponent/G",
+    "RANK": "Lg Rank",
+    "YEAR/YEAR": "Year/Year",
+}
+TEAM_MISC_ROWS = {"TOTALS": "Team", "RANK": "Lg Rank"}
+
+
+def _stats_row(df, row_idx):
     s = df[df["Unnamed: 0"] == row_idx]
     s = s.drop(columns=["Unnamed: 0"]).reindex()
     return pd.Series(index=list(s.columns), data=s.values.tolist()[0])
 
 
-def get_opp_stats(team, season_end_year, data_format="PER_GAME"):
-    xpath = '//table[@id="team_and_opponent"]'
-    table = get_selenium_wrapper(
-        f"https://www.basketball-reference.com/teams/{team}/{season_end_year}.html",
-        xpath,
-    )
-    if not table:
-        raise ConnectionError("Request to basketball reference failed")
-    df = pd.read_html(format_html(table))[0]
+def _parse_team_stats(df, data_format, opponent=False):
     opp_idx = df[df["Unnamed: 0"] == "Opponent"].index[0]
-    df = df[opp_idx:]
-    if data_format == "TOTALS":
-        row_idx = "Opponent"
-    elif data_format == "PER_GAME":
-        row_idx = "Opponent/G"
-    elif data_format == "RANK":
-        row_idx = "Lg Rank"
-    elif data_format == "YEAR/YEAR":
-        row_idx = "Year/Year"
-    else:
+    if opponent:
+        return _stats_row(df[opp_idx:], OPP_STATS_ROWS[data_format])
+    return _stats_row(df[:opp_idx], TEAM_STATS_ROWS[data_format])
+
+
+def _parse_team_misc(df, data_format):
+    df = df.rename(columns={"Arena": "ARENA", "Attendance": "ATTENDANCE"})
+    return _stats_row(df, TEAM_MISC_ROWS[data_format])
+
+
+def get_team_stats(team, season_end_year, data_format="TOTALS"):
+    if data_format not in TEAM_STATS_ROWS:
         print("Invalid data format")
         return pd.DataFrame()
+    df = _get_team_df(team, season_end_year, "team_and_opponent")
+    return _parse_team_stats(df, data_format)
 
-    s = df[df["Unnamed: 0"] == row_idx]
-    s = s.drop(columns=["Unnamed: 0"]).reindex()
-    return pd.Series(index=list(s.columns), data=s.values.tolist()[0])
+
+def get_opp_stats(team, season_end_year, data_format="PER_GAME"):
+    if data_format not in OPP_STATS_ROWS:
+        print("Invalid data format")
+        return pd.DataFrame()
+    df = _get_team_df(team, season_end_year, "team_and_opponent")
+    return _parse_team_stats(df, data_format, opponent=True)
 
 
 def get_team_misc(team, season_end_year, data_format="TOTALS"):
-    xpath = '//table[@id="team_misc"]'
-    table = get_selenium_wrapper(
-        f"https://www.basketball-reference.com/teams/{team}/{season_end_year}.html",
-        xpath,
-    )
-    if not table:
-        raise ConnectionError("Request to basketball reference failed")
-    df = pd.read_html(format_html(table))[0]
-    if data_format == "TOTALS":
-        row_idx = "Team"
-    elif data_format == "RANK":
-        row_idx = "Lg Rank"
-    else:
+    if data_format not in TEAM_MISC_ROWS:
         print("Invalid data format")
         return pd.DataFrame()
-    df.columns = df.columns.droplevel()
-    df.rename(columns={"Arena": "ARENA", "Attendance": "ATTENDANCE"}, inplace=True)
-    s = df[df["Unnamed: 0_level_1"] == row_idx]
-    s = s.drop(columns=["Unnamed: 0_level_1"]).reindex()
-    return pd.Series(index=list(s.columns), data=s.values.tolist()[0])
+    # offense and defense four factors share their names, as they did before
+    df = _get_team_df(team, season_end_year, "team_misc", unique=False)
+    return _parse_team_misc(df, data_format)
 
 
-def get_roster_stats(
-    team: str, season_end_year: int, data_format="PER_GAME", playoffs=False
-):
+def _roster_stats_table_id(data_format, playoffs=False):
     if playoffs:
-        xpath = f'//table[@id="playoffs_{data_format.lower()}"]'
-    else:
-        xpath = f'//table[@id="{data_format.lower()}"]'
-    table = get_selenium_wrapper(
-        f"https://www.basketball-reference.com/teams/{team}/{season_end_year}.html",
-        xpath,
-    )
-    if not table:
-        raise ConnectionError("Request to basketball reference failed")
+        return f"playoffs_{data_format.lower()}"
+    return data_format.lower()
+
 
-    # get all player page urls
-    soup = BeautifulSoup(table, "html.parser")
-    # roster_table = soup.find("table", {"id": f"{data_format.lower()}"})
-    player_links = soup.find_all("a", href=re.compile("/players/"))
-    player_id_map = {}
-    # build lookup of player ids
-    for item in player_links:
-        href = str(item["href"])
-        if "/gamelog/" in href:
-            continue
-        key = str(item.next)
-        value = str(item["href"]).replace(".html", "").replace("/players/", "")[2:]
-        player_id_map[key] = value
-
-    df = pd.read_html(format_html(table))[0]
+def _parse_roster_stats(df, team, season_end_year):
+    player_ids = link_ids(df.pop("PLAYER_HREF"))
     df.rename(
         columns={"Player": "PLAYER", "Age": "AGE", "Tm": "TEAM", "Pos": "POS"},
         inplace=True,
@@ -181,33 +152,142 @@ def get_roster_stats(
     # remove (TW) suffix from player name
     df["PLAYER"] = df["PLAYER"].apply(lambda x: str(x).replace("(TW)", "").strip())
 
-    # map player id using player name
-    df["PLAYER_ID"] = df["PLAYER"].map(player_id_map)
+    df["PLAYER_ID"] = player_ids
 
-    df["PLAYER"] = df["PLAYER"].apply(
-        lambda name: remove_accents(name, team, season_end_year)
+    df["PLAYER"] = normalize_player_names(
+        df["PLAYER"], team, season_end_year, df["PLAYER_ID"]
     )
 
     df = df.reset_index().drop(["Rk", "index"], axis=1)
     return df
 
 
+def get_roster_stats(
+    team: str, season_end_year: int, data_format="PER_GAME", playoffs=False
+):
+    table_id = _roster_stats_table_id(data_format, playoffs)
+    df = _get_team_df(team, season_end_year, table_id, links=PLAYER_LINKS)
+    return _parse_roster_stats(df, team, season_end_year)
+
+
+"""
+    Team-season bundles. Everything the single-table getters above read from a
+    team page is parsed out of one fetch of that page, so a whole team season
+    costs one request and a whole league season one request per team (plus
+    the league page listing the teams), all under the shared rate limiter.
+"""
+
+ROSTER_STATS_FORMATS = [
+    "PER_GAME",
+    "TOTALS",
+    "PER_MINUTE",
+    "PER_POSS",
+    "ADVANCED",
+    "SHOOTING",
+    "ADJ_SHOOTING",
+    "PBP",
+]
+
+
+def _try_parse(parse, *args):
+    try:
+        return parse(*args)
+    except (IndexError, KeyError):
+        # the row or column is missing on this page (e.g. no Year/Year row in a first season)
+        return None
+
+
+def get_team_season(team, season_end_year):
+    """Every table of a team page, in every data_format, from a single fetch.
+
+    Args:
+        team (str): The team abbreviation.
+        season_end_year (int): The season end year.
+
+    Raises:
+        ConnectionError: when the team page cannot be fetched.
+
+    Returns:
+        dict: 'ROSTER' (as get_roster), 'TEAM_STATS' and 'OPP_STATS' (data_format -> Series,
+        as get_team_stats/get_opp_stats), 'TEAM_MISC' (data_format -> Series, as get_team_misc),
+        and 'ROSTER_STATS' and 'PLAYOFFS_ROSTER_STATS' (data_format -> DataFrame, as
+        get_roster_stats). Tables and rows the page does not have are left out.
+    """
+    page = get_page(get_team_url(team, season_end_year))
+    if not page.ok:
+        raise ConnectionError("Request to basketball reference failed")
+    season = {
+        "ROSTER": None,
+        "TEAM_STATS": {},
+        "OPP_STATS": {},
+        "TEAM_MISC": {},
+        "ROSTER_STATS": {},
+        "PLAYOFFS_ROSTER_STATS": {},
+    }
+    if page.get_table("roster") is not None:
+        season["ROSTER"] = _parse_roster(page, team, season_end_year)
+
+    df = page.get_df("team_and_opponent")
+    if df is not None:
+        for key, opponent in (("TEAM_STATS", False), ("OPP_STATS", True)):
+            for data_format in TEAM_STATS_ROWS:
+                s = _try_parse(_parse_team_stats, df, data_format, opponent)
+                if s is not None:
+                    season[key][data_format] = s
+
+    df = page.get_df("team_misc", unique=False)
+    if df is not None:
+        for data_format in TEAM_MISC_ROWS:
+            s = _try_parse(_parse_team_misc, df, data_format)
+            if s is not None:
+                season["TEAM_MISC"][data_format] = s
+
+    for key, playoffs in (("ROSTER_STATS", False), ("PLAYOFFS_ROSTER_STATS", True)):
+        for data_format in ROSTER_STATS_FORMATS:
+            table_id = _roster_stats_table_id(data_format, playoffs)
+            df = page.get_df(table_id, links=PLAYER_LINKS)
+            if df is not None and "PLAYER_HREF" in df:
+                df = _try_parse(_parse_roster_stats, df, team, season_end_year)
+                if df is not None:
+                    season[key][data_format] = df
+    return season
+
+
+def get_season_teams(season_end_year):
+    """Abbreviations of the teams that played in a season, from the league season page."""
+    page = get_page(get_league_url(season_end_year))
+    if not page.ok:
+        raise ConnectionError("Request to basketball reference failed")
+    teams = re.findall(rf'href="/teams/(\w+)/{season_end_year}\.html"', page.text)
+    return sorted(set(teams))
+
+
+def get_league_season(season_end_year, teams=None):
+    """get_team_season for every team of a season.
+
+    Args:
+        season_end_year (int): The season end year.
+        teams (list, optional): Team abbreviations. Defaults to every team of the season.
+
+    Returns:
+        dict: team abbreviation -> the dict returned by get_team_season.
+    """
+    if teams is None:
+        teams = get_season_teams(season_end_year)
+    return {team: get_team_season(team, season_end_year) for team in teams}
+
+
 def get_team_ratings(season_end_year: int, team=[]):
     r = get_wrapper(
         f"https://www.basketball-reference.com/leagues/NBA_{season_end_year}_ratings.html"
     )
     if r.status_code == 200:
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table", {"id": "ratings"})
-
-        df = pd.read_html(format_html(table))[0]
-        # Clean columns and indexes
-        df = df.droplevel(level=0, axis=1)
+        table = get_table(r.content, "ratings")
 
+        df = table_to_df(table)
         upper_cols = list(pd.Series(df.columns).apply(lambda x: x.upper()))
         df.columns = upper_cols
         df.dropna(inplace=True)
-        df = df[df["RK"] != "Rk"]
         df["TEAM"] = df["TEAM"].apply(lambda x: x.upper())
         df["TEAM"] = df["TEAM"].apply(lambda x: TEAM_TO_TEAM_ABBR[x])
 
@@ -232,15 +312,10 @@ def get_team_ratings(season_end_year: int, team=[]):
 
 
 def get_teams(season_end_year):
-    r = get_wrapper(
-        f"https://www.basketball-reference.com/leagues/NBA_{season_end_year}.html"
-    )
+    page = get_page(get_league_url(season_end_year))
     df = None
-    if r.status_code == 200:
-        soup = BeautifulSoup(r.content, "html.parser")
-
-        east_conf_table = soup.find("table", {"id": "confs_standings_E"})
-        east_df = pd.read_html(format_html(east_conf_table))[0]
+    if page.ok:
+        east_df = page.get_df("confs_standings_E")
         east_df.columns = [
             "TEAM_NAME",
             "WINS",
@@ -252,8 +327,7 @@ def get_teams(season_end_year):
             "SRS",
         ]
 
-        west_conf_table = soup.find("table", {"id": "confs_standings_W"})
-        west_df = pd.read_html(format_html(west_conf_table))[0]
+        west_df = page.get_df("confs_standings_W")
         west_df.columns = [
             "TEAM_NAME",
             "WINS",
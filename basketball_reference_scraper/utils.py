@@ -1,31 +1,176 @@
+import json
+import re
+import threading
 import unicodedata
 from io import StringIO
 
 import pandas as pd
 import unidecode
-from bs4 import BeautifulSoup
-from requests import get
+from bs4 import SoupStrainer
 
 try:
+    from cache import NEVER_EXPIRES, get_cache, get_ttl
+    from lookup import MAX_DISTANCE, levenshtein, search
+    from page import PLAYER_LINKS, get_page, link_ids, parse_html
+    from player_registry import (normalize_name, register_player,
+                                 resolve_player_id)
     from request_utils import get_wrapper
 except:
+    from basketball_reference_scraper.cache import (NEVER_EXPIRES, get_cache,
+                                                    get_ttl)
+    from basketball_reference_scraper.lookup import (MAX_DISTANCE, levenshtein,
+                                                     search)
+    from basketball_reference_scraper.page import (PLAYER_LINKS, get_page,
+                                                   link_ids, parse_html)
+    from basketball_reference_scraper.player_registry import (
+        normalize_name, register_player, resolve_player_id)
     from basketball_reference_scraper.request_utils import get_wrapper
 
 
+def get_scoreboard_url(date):
+    return f"https://www.basketball-reference.com/boxscores/?month={date.month}&year={date.year}&day={date.day}"
+
+
+"""
+    Scoreboard index: every team playing on a given date mapped to the box
+    score suffix of its game. An index is built from a single scoreboard fetch
+    and kept in memory and in the persistent cache, so resolving any game on an
+    already indexed date is a dictionary lookup.
+"""
+
+TEAM_LINK_RE = re.compile(r"/teams/(\w+)/\d{4}\.html")
+
+_scoreboard_indexes = {}
+
+
+def parse_scoreboard_index(content):
+    index = {}
+    soup = parse_html(content, SoupStrainer("table", attrs={"class": "teams"}))
+    for table in soup.find_all("table", attrs={"class": "teams"}):
+        suffix = None
+        teams = []
+        for anchor in table.find_all("a", href=True):
+            href = anchor.attrs["href"]
+            match = TEAM_LINK_RE.search(href)
+            if match:
+                teams.append(match.group(1))
+            elif "boxscores" in href and suffix is None:
+                suffix = href
+        if suffix:
+            # the home team is always part of the suffix, e.g. /boxscores/202001060DEN.html
+            for team in teams + [suffix[-8:-5]]:
+                index.setdefault(team, suffix)
+    return index
+
+
+def find_game_suffix(index, team1, team2):
+    if index:
+        return index.get(team1) or index.get(team2)
+
+
+def parse_game_suffix(content, team1, team2):
+    return find_game_suffix(parse_scoreboard_index(content), team1, team2)
+
+
+def _get_stored_scoreboard_index(date):
+    key = date.date()
+    if key in _scoreboard_indexes:
+        return _scoreboard_indexes[key]
+    cache = get_cache()
+    if cache is not None:
+        entry = cache.get(f"index:{get_scoreboard_url(date)}")
+        if entry is not None:
+            index = json.loads(entry[2])
+            _remember_scoreboard_index(date, index)
+            return index
+
+
+def _remember_scoreboard_index(date, index, persist=False):
+    url = get_scoreboard_url(date)
+    ttl = get_ttl(url)
+    # only indexes of past dates are final; today's scoreboard still changes
+    if ttl is NEVER_EXPIRES:
+        _scoreboard_indexes[date.date()] = index
+    cache = get_cache()
+    if persist and cache is not None:
+        cache.set(f"index:{url}", 200, {}, json.dumps(index).encode("utf-8"), ttl)
+
+
+def get_scoreboard_index(date):
+    """Map every team playing on a date to the box score suffix of its game.
+
+    Args:
+        date (str | datetime): The date of the games.
+
+    Returns:
+        dict: team abbreviation to box score suffix (e.g. '/boxscores/202001060DEN.html').
+    """
+    date = pd.to_datetime(date)
+    index = _get_stored_scoreboard_index(date)
+    if index is not None:
+        return index
+    r = get_wrapper(get_scoreboard_url(date))
+    if r.status_code != 200:
+        return {}
+    index = parse_scoreboard_index(r.content)
+    _remember_scoreboard_index(date, index, persist=True)
+    return index
+
+
+def build_scoreboard_index(start_date, end_date):
+    """Index every date in a range, fetching only dates that are not indexed yet.
+
+    Args:
+        start_date (str | datetime): First date of the range.
+        end_date (str | datetime): Last date of the range (inclusive).
+
+    Returns:
+        dict: date to scoreboard index (see get_scoreboard_index).
+    """
+    return {
+        date.date(): get_scoreboard_index(date)
+        for date in pd.date_range(start_date, end_date)
+    }
+
+
 def get_game_suffix(date, team1, team2):
-    r = get_wrapper(
-        f"https://www.basketball-reference.com/boxscores/?month={date.month}&year={date.year}&day={date.day}"
-    )
-    if r.status_code == 200:
-        soup = BeautifulSoup(r.content, "html.parser")
-        for table in soup.find_all("table", attrs={"class": "teams"}):
-            for anchor in table.find_all("a"):
-                if "boxscores" in anchor.attrs["href"]:
-                    if team1 in str(anchor.attrs["href"]) or team2 in str(
-                        anchor.attrs["href"]
-                    ):
-                        suffix = anchor.attrs["href"]
-                        return suffix
+    return find_game_suffix(get_scoreboard_index(date), team1, team2)
+
+
+GAME_ID_RE = re.compile(r"^(\d{8})\d([A-Z]{3})$")
+
+
+def parse_game_id(game_id):
+    """Split a game ID such as '202001060DEN' into the game date and the home team.
+
+    Args:
+        game_id (str): The game ID, as in the GAME_ID column of get_schedule.
+
+    Returns:
+        tuple: the date (Timestamp) and the home team abbreviation.
+    """
+    match = GAME_ID_RE.match(str(game_id))
+    if match is None:
+        raise ValueError(f"{game_id!r} is not a game ID like '202001060DEN'")
+    return pd.to_datetime(match.group(1), format="%Y%m%d"), match.group(2)
+
+
+def game_teams(teams, game_id):
+    """Check that a game page shows exactly two teams and return them.
+
+    Args:
+        teams (list): The team abbreviations found on the page, visitor first.
+        game_id (str): The game ID the page belongs to, for the error message.
+
+    Returns:
+        tuple: the visitor and the home team abbreviations.
+    """
+    if len(teams) != 2:
+        raise ValueError(
+            f"Expected 2 teams on the page of game {game_id}, found {teams}"
+        )
+    away, home = teams
+    return away, home
 
 
 """
@@ -91,7 +236,7 @@ HTML_SUFFIX = ".html"
 FIRST_SUFFIX = "01"
 
 
-def get_player_suffix(name):
+def get_player_suffix(name, season=None):
     normalized_name = unidecode.unidecode(
         unicodedata.normalize("NFD", name).encode("ascii", "ignore").decode("utf-8")
     )
@@ -100,24 +245,36 @@ def get_player_suffix(name):
 
     if normalized_name in name_route_mappings.keys():
         return f"{PLAYERS_PREFIX}{name_route_mappings[normalized_name]}{HTML_SUFFIX}"
-    else:
-        split_normalized_name = normalized_name.split(" ")
-        if len(split_normalized_name) < 2:
-            return None
-        initial = normalized_name.split(" ")[1][0].lower()
-        all_names = normalized_name.split(" ")
-        first_name_part = unidecode.unidecode(
-            all_names[0].replace(".", "").replace("'", "")[:2].lower()
-        )
-        first_name = all_names[0]
-        other_names = all_names[1:]
-        had_suffix = False
-        for suffix_to_remove in suffixes_to_remove:
-            if suffix_to_remove in other_names:
-                had_suffix = True
-                other_names.remove(suffix_to_remove)
-        other_names_search = other_names
-        last_name_part = create_last_name_part_of_suffix(other_names)
+
+    # resolve from the offline registry before falling back to probing URLs
+    player_id = resolve_player_id(normalized_name, season)
+    if player_id:
+        return f"{PLAYERS_PREFIX}{player_id[0]}/{player_id}{HTML_SUFFIX}"
+
+    suffix = _probe_player_suffix(normalized_name)
+    if suffix:
+        register_player(normalized_name, suffix.split("/")[-1][: -len(HTML_SUFFIX)])
+    return suffix
+
+
+def _probe_player_suffix(normalized_name):
+    split_normalized_name = normalized_name.split(" ")
+    if len(split_normalized_name) < 2:
+        return None
+    initial = normalized_name.split(" ")[1][0].lower()
+    all_names = normalized_name.split(" ")
+    first_name_part = unidecode.unidecode(
+        all_names[0].replace(".", "").replace("'", "")[:2].lower()
+    )
+    first_name = all_names[0]
+    other_names = all_names[1:]
+    had_suffix = False
+    for suffix_to_remove in suffixes_to_remove:
+        if suffix_to_remove in other_names:
+            had_suffix = True
+            other_names.remove(suffix_to_remove)
+    other_names_search = other_names
+    last_name_part = create_last_name_part_of_suffix(other_names)
     suffix = f"{PLAYERS_PREFIX}{initial}/{last_name_part}{first_name_part}{FIRST_SUFFIX}{HTML_SUFFIX}"
     player_r = get_wrapper(f"https://www.basketball-reference.com{suffix}")
     while player_r.status_code == 404:
@@ -131,7 +288,7 @@ def get_player_suffix(name):
         suffix = f"{PLAYERS_PREFIX}{initial}/{last_name_part}{first_name_part}{FIRST_SUFFIX}{HTML_SUFFIX}"
         player_r = get_wrapper(f"https://www.basketball-reference.com{suffix}")
     while player_r.status_code == 200:
-        player_soup = BeautifulSoup(player_r.content, "html.parser")
+        player_soup = parse_html(player_r.content, SoupStrainer("h1"))
         h1 = player_soup.find("h1")
         if h1:
             page_name = h1.find("span").text
@@ -166,27 +323,229 @@ def get_player_suffix(name):
     return None
 
 
-def remove_accents(name, team, season_end_year):
-    alphabet = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXZY ")
-    if len(set(name).difference(alphabet)) == 0:
-        return name
-    r = get_wrapper(
+# roster names are memoized per (team, season) so normalizing a whole box
+# score or roster costs at most one fetch of the team page
+ALPHABET = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXZY ")
+
+_roster_names = {}
+_roster_names_lock = threading.Lock()
+
+
+def get_roster_names(team, season_end_year):
+    """(name, player_id) pairs of a team's roster, fetched once per (team, season).
+
+    Args:
+        team (str): The team abbreviation.
+        season_end_year (int): The season end year.
+
+    Returns:
+        list: (name, player_id) tuples; empty if the team page could not be fetched.
+    """
+    key = (team, int(season_end_year))
+    with _roster_names_lock:
+        if key in _roster_names:
+            return _roster_names[key]
+    page = get_page(
         f"https://www.basketball-reference.com/teams/{team}/{season_end_year}.html"
     )
-    team_df = None
+    if not page.ok:
+        return []
+    df = page.get_df("roster", links=PLAYER_LINKS)
+    names = []
+    if df is not None:
+        for name, player_id in zip(df["Player"], link_ids(df["PLAYER_HREF"])):
+            names.append((name, player_id if pd.notna(player_id) else None))
+    with _roster_names_lock:
+        _roster_names[key] = names
+    return names
+
+
+def _best_match(name, candidates):
     best_match = name
-    if r.status_code == 200:
-        soup = BeautifulSoup(r.content, "html.parser")
-        table = soup.find("table")
-        team_df = pd.read_html(format_html(table))[0]
-        max_matches = 0
-        for p in team_df["Player"]:
-            matches = sum(l1 == l2 for l1, l2 in zip(p, name))
-            if matches > max_matches:
-                max_matches = matches
-                best_match = p
+    max_matches = 0
+    for p in candidates:
+        matches = sum(l1 == l2 for l1, l2 in zip(p, name))
+        if matches > max_matches:
+            max_matches = matches
+            best_match = p
     return best_match
 
 
+def normalize_player_names(names, team, season_end_year, player_ids=None):
+    """Batch version of remove_accents for a whole column of names.
+
+    Names made only of plain letters are returned unchanged. The others are
+    replaced by the roster name with the same player ID when player_ids is
+    given, or else by the closest roster name.
+
+    Args:
+        names (iterable): Player names.
+        team (str): The team abbreviation.
+        season_end_year (int): The season end year.
+        player_ids (iterable, optional): BR player IDs aligned with names.
+
+    Returns:
+        list: the normalized names, in the same order.
+    """
+    names = list(names)
+    ids = list(player_ids) if player_ids is not None else [None] * len(names)
+    pending = [
+        i for i, name in enumerate(names) if len(set(str(name)).difference(ALPHABET))
+    ]
+    if not pending:
+        return names
+    roster = get_roster_names(team, season_end_year)
+    if not roster:
+        return names
+    by_id = {player_id: name for name, player_id in roster if player_id}
+    roster_names = [name for name, _ in roster]
+    matched = {}
+    for i in pending:
+        if ids[i] in by_id:
+            names[i] = by_id[ids[i]]
+        else:
+            if names[i] not in matched:
+                matched[names[i]] = _best_match(str(names[i]), roster_names)
+            names[i] = matched[names[i]]
+    return names
+
+
+def remove_accents(name, team, season_end_year):
+    return normalize_player_names([name], team, season_end_year)[0]
+
+
+"""
+    Batch name resolution. Each distinct (name, team, season) is resolved
+    once: overrides in name_route_mappings first, then the offline registry,
+    then the closest known name. Only names still unresolved go over the
+    network, to the team roster when team and season hints are given and to
+    URL probing otherwise. Resolved names are kept in the persistent cache.
+"""
+
+RESOLVE_COLUMNS = ["NAME", "TEAM", "SEASON", "MATCH", "SCORE", "PLAYER_ID"]
+
+_resolved_players = {}
+
+
+def _ascii_name(name):
+    name = unicodedata.normalize("NFD", str(name)).encode("ascii", "ignore")
+    return unidecode.unidecode(name.decode("utf-8")).replace("(TW)", "").strip()
+
+
+def _route_mapping(name):
+    for key in (str(name).replace("(TW)", "").strip(), _ascii_name(name)):
+        if key in name_route_mappings:
+            return name_route_mappings[key].split("/")[-1]
+
+
+def _resolve_locally(raw_name, season):
+    name = _ascii_name(raw_name)
+    player_id = _route_mapping(raw_name)
+    if player_id:
+        return name, 0, player_id
+    player_id = resolve_player_id(name, season)
+    if player_id:
+        return name, 0, player_id
+    matches = search(name, k=1)
+    if matches:
+        match, score = matches[0]
+        return match, score, resolve_player_id(match, season)
+    return None, None, None
+
+
+def _resolve_from_roster(name, team, season):
+    best = (None, None, None)
+    normalized = normalize_name(name)
+    for roster_name, player_id in get_roster_names(team, season):
+        if not player_id:
+            continue
+        score = levenshtein(normalized, normalize_name(roster_name), MAX_DISTANCE + 1)
+        if 0 <= score <= MAX_DISTANCE and (best[1] is None or score < best[1]):
+            best = (roster_name, score, player_id)
+    return best
+
+
+def _resolve_remotely(name, local, team, season):
+    if team is not None and season is not None:
+        resolved = _resolve_from_roster(name, team, season)
+        if resolved[2]:
+            return resolved
+    match, score = (local[0], local[1]) if local[0] else (name, 0)
+    try:
+        suffix = _probe_player_suffix(match)
+    except Exception:
+        suffix = None
+    if suffix:
+        player_id = suffix.split("/")[-1][: -len(HTML_SUFFIX)]
+        register_player(match, player_id)
+        return match, score, player_id
+    return local
+
+
+def _get_stored_resolution(key):
+    if key in _resolved_players:
+        return _resolved_players[key]
+    cache = get_cache()
+    if cache is not None:
+        entry = cache.get(f"player:{json.dumps(key)}")
+        if entry is not None:
+            _resolved_players[key] = tuple(json.loads(entry[2]))
+            return _resolved_players[key]
+
+
+def _remember_resolution(key, resolved):
+    _resolved_players[key] = resolved
+    cache = get_cache()
+    if cache is not None:
+        content = json.dumps(list(resolved)).encode("utf-8")
+        cache.set(f"player:{json.dumps(key)}", 200, {}, content, NEVER_EXPIRES)
+
+
+def _hints(values, n):
+    # numpy integers (e.g. from a SEASON column) count as a single value too
+    if values is None or pd.api.types.is_scalar(values):
+        values = [values] * n
+    values = list(values)
+    if len(values) != n:
+        raise ValueError("teams and seasons must be a single value or one per name")
+    # missing hints (NaN from a DataFrame column) mean no hint
+    return [None if pd.isna(value) else value for value in values]
+
+
+def resolve_players(names, teams=None, seasons=None, network=True):
+    """Resolve many player names to BR player IDs at once.
+
+    Args:
+        names (iterable): Player names, accents and typos allowed.
+        teams (str | iterable, optional): Team abbreviation hint, one for all names or one per name.
+        seasons (int | iterable, optional): Season end year hint, one for all names or one per name.
+        network (bool, optional): Whether names not resolved locally may be looked up online. Defaults to True.
+
+    Returns:
+        DataFrame: one row per distinct (NAME, TEAM, SEASON) with the matched name, its edit distance
+        to the input as SCORE (0 is exact) and the PLAYER_ID, which is missing for unresolved names.
+    """
+    names = list(names)
+    keys = list(
+        dict.fromkeys(
+            zip(names, _hints(teams, len(names)), _hints(seasons, len(names)))
+        )
+    )
+    rows = []
+    for name, team, season in keys:
+        key = (_ascii_name(name), team, None if season is None else int(season))
+        resolved = _get_stored_resolution(key)
+        if resolved is None:
+            resolved = _resolve_locally(name, key[2])
+            if resolved[2] is None and network:
+                resolved = _resolve_remotely(key[0], resolved, team, key[2])
+            if resolved[2] is not None:
+                _remember_resolution(key, resolved)
+        rows.append((name, team, season) + tuple(resolved))
+    df = pd.DataFrame(rows, columns=RESOLVE_COLUMNS)
+    df["SCORE"] = df["SCORE"].astype("Int64")
+    return df
+
+
 def format_html(html):
     return StringIO(str(html))
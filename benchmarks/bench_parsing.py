@@ -0,0 +1,96 @@
+"""
+    Compare the old full-page html.parser path with the lxml parsing layer,
+    and pd.read_html with table_to_df for turning the table into a DataFrame.
+
+    Usage:
+        python benchmarks/bench_parsing.py [page.html:table_id ...]
+
+    Pages can be saved from a browser or taken from the response cache, e.g.
+    ResponseCache().get(url)[2]. Without arguments a synthetic page shaped like
+    a team page (one table in the DOM, the rest inside HTML comments) is used.
+"""
+
+import sys
+from timeit import Timer
+
+import pandas as pd
+from bs4 import BeautifulSoup, Comment
+
+from basketball_reference_scraper.page import get_table, table_to_df
+from basketball_reference_scraper.utils import format_html
+
+REPEAT = 5
+
+
+def old_get_table(content, table_id):
+    soup = BeautifulSoup(content, "html.parser")
+    table = soup.find("table", {"id": table_id})
+    if table is not None:
+        return table
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        if f'id="{table_id}"' in comment:
+            return BeautifulSoup(comment, "html.parser").find("table", {"id": table_id})
+
+
+def synthetic_page(rows=40, tables=12):
+    def table(table_id):
+        body = "".join(
+            f'<tr><th data-stat="ranker">{i}</th><td data-stat="player"><a href="/players/p/player{i:02d}.html">Player {i}</a></td>'
+            + "".join(f'<td data-stat="s{j}">{i * j}</td>' for j in range(20))
+            + "</tr>"
+            for i in range(rows)
+        )
+        head = (
+            '<th data-stat="ranker">Rk</th><th data-stat="player">Player</th>'
+            + "".join(f'<th data-stat="s{j}">S{j}</th>' for j in range(20))
+        )
+        return f'<table id="{table_id}"><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>'
+
+    filler = (
+        "<div class='filler'>" + "<p>text <a href='#'>link</a></p>" * 500 + "</div>"
+    )
+    commented = "".join(
+        f"<div><!-- {table(f't{i}')} --></div>" for i in range(1, tables)
+    )
+    html = f"<html><body>{filler}{table('t0')}{commented}{filler}</body></html>"
+    return html.encode("utf-8"), [
+        ("synthetic (DOM table)", "t0"),
+        ("synthetic (commented table)", f"t{tables - 1}"),
+    ]
+
+
+def best_time(func):
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(REPEAT, number)) / number
+
+
+def report(label, old, new):
+    print(f"{label:48s} {old * 1000:9.2f} ms {new * 1000:9.2f} ms {old / new:6.1f}x")
+
+
+def bench(label, content, table_id):
+    old = best_time(lambda: pd.read_html(format_html(old_get_table(content, table_id))))
+    new = best_time(lambda: table_to_df(get_table(content, table_id)))
+    report(label, old, new)
+    table = get_table(content, table_id)
+    old = best_time(lambda: pd.read_html(format_html(table)))
+    new = best_time(lambda: table_to_df(table))
+    report("  table to DataFrame only", old, new)
+
+
+def main(args):
+    print(f"{'page (table)':48s} {'old':>12s} {'new':>12s} {'speedup':>7s}")
+    if not args:
+        content, targets = synthetic_page()
+        for label, table_id in targets:
+            bench(label, content, table_id)
+        return
+    for arg in args:
+        path, table_id = arg.rsplit(":", 1)
+        with open(path, "rb") as f:
+            bench(f"{path} ({table_id})", f.read(), table_id)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,24 @@
+import asyncio
+import unittest
+
+from basketball_reference_scraper.async_api import (get_box_scores,
+                                                    get_draft_class,
+                                                    get_schedule)
+
+
+class TestAsyncApi(unittest.TestCase):
+    def test_get_box_scores(self):
+        d = asyncio.run(get_box_scores("2020-01-06", "DEN", "ATL"))
+        self.assertListEqual(list(d.keys()), ["DEN", "ATL"])
+
+    def test_gather(self):
+        async def run():
+            return await asyncio.gather(get_schedule(1999), get_draft_class(2003))
+
+        schedule, draft = asyncio.run(run())
+        self.assertIn("HOME", schedule.columns)
+        self.assertEqual("LeBron James", draft.iloc[0]["PLAYER"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,70 @@
 import unittest
+from unittest import mock
 
-from basketball_reference_scraper.box_scores import (get_all_star_box_score,
-                                                     get_box_scores)
+import pandas as pd
+
+from basketball_reference_scraper import page as page_module
+from basketball_reference_scraper.box_scores import (_parse_all_star_table,
+                                                     _parse_box_scores,
+                                                     _parse_game_box_scores,
+                                                     get_all_star_box_score,
+                                                     get_box_scores,
+                                                     get_box_scores_by_id,
+                                                     get_game_id_url)
+from basketball_reference_scraper.page import (Page, clear_pages, parse_html,
+                                               remember_page)
+
+
+def box_table(team, period, stat_type, players):
+    rows = "".join(
+        f'<tr><th data-stat="player"><a href="/players/{p[0]}/{p}01.html">{p}</a></th>'
+        f'<td data-stat="mp">{i + 10}:00</td><td data-stat="pts">{i}</td></tr>'
+        for i, p in enumerate(players)
+    )
+    return (
+        f'<table id="box-{team}-{period}-{stat_type}"><thead>'
+        '<tr class="over_header"><th colspan="3"></th></tr>'
+        '<tr><th data-stat="player">Starters</th><th data-stat="mp">MP</th>'
+        '<th data-stat="pts">PTS</th></tr></thead><tbody>'
+        f"{rows}</tbody></table>"
+    )
+
+
+LINE_SCORE = """<table id="line_score"><thead>
+<tr class="over_header"><th colspan="3">Scoring</th></tr>
+<tr><th data-stat="team"></th><th data-stat="1">1</th><th data-stat="T">T</th></tr></thead>
+<tbody><tr><th data-stat="team"><a href="/teams/ATL/2020.html">ATL</a></th>
+<td data-stat="1">20</td><td data-stat="T">96</td></tr>
+<tr><th data-stat="team"><a href="/teams/DEN/2020.html">DEN</a></th>
+<td data-stat="1">31</td><td data-stat="T">123</td></tr></tbody></table>"""
+
+BOX_SCORE_PAGE = (
+    "<html><body>"
+    + "".join(
+        box_table(team, period, stat_type, players)
+        for team, players in (("ATL", ["young", "hunter"]), ("DEN", ["jokic"]))
+        for period, stat_type in (
+            ("game", "basic"),
+            ("game", "advanced"),
+            ("q1", "basic"),
+            ("h1", "basic"),
+        )
+    )
+    + f"<div><!--{LINE_SCORE}--></div></body></html>"
+)
+
+ALL_STAR_TABLE = """<table><thead>
+<tr class="over_header"><th colspan="4"></th></tr>
+<tr><th data-stat="player">Starters</th><th data-stat="team_id">Tm</th>
+<th data-stat="mp">MP</th><th data-stat="pts">PTS</th></tr></thead><tbody>
+<tr><th data-stat="player"><a href="/players/d/doncilu01.html">Luka Dončić</a></th>
+<td data-stat="team_id">DAL</td><td data-stat="mp">14</td><td data-stat="pts">8</td></tr>
+<tr class="thead"><th colspan="4">Reserves</th></tr>
+<tr><th data-stat="player"><a href="/players/y/youngtr01.html">Trae Young</a></th>
+<td data-stat="team_id">ATL</td><td data-stat="mp">22</td><td data-stat="pts">10</td></tr>
+<tr class="thead"><th colspan="3">Totals</th><td data-stat="pts">18</td></tr>
+</tbody><tfoot><tr><th data-stat="player">Team Totals</th><td data-stat="team_id"></td>
+<td data-stat="mp">240</td><td data-stat="pts">157</td></tr></tfoot></table>"""
 
 
 class TestBoxScores(unittest.TestCase):
@@ -36,6 +99,66 @@ class TestBoxScores(unittest.TestCase):
         ]
         self.assertListEqual(list(df.columns), expected_columns)
 
+    def test_parse_box_scores(self):
+        page = Page("https://www.basketball-reference.com/boxscores/", BOX_SCORE_PAGE)
+        date = pd.to_datetime("2020-01-06")
+        d = _parse_box_scores(page, date, "DEN", "ATL", "Q1", "BASIC")
+        self.assertListEqual(list(d["ATL"]["PLAYER"]), ["young", "hunter"])
+        self.assertListEqual(list(d["DEN"]["PLAYER"]), ["jokic"])
+
+        bundle = _parse_game_box_scores(page, date)
+        self.assertListEqual(list(bundle["BASIC"]), ["GAME", "Q1", "H1"])
+        self.assertListEqual(list(bundle["ADVANCED"]), ["GAME"])
+        self.assertListEqual(list(bundle["BASIC"]["GAME"]), ["ATL", "DEN"])
+        self.assertListEqual(
+            list(bundle["ADVANCED"]["GAME"]["ATL"].columns),
+            ["PLAYER_ID", "PLAYER", "MP", "PTS"],
+        )
+        self.assertListEqual(
+            list(bundle["BASIC"]["GAME"]["ATL"]["PLAYER_ID"]), ["young01", "hunter01"]
+        )
+        self.assertListEqual(list(bundle["LINE_SCORE"].columns), ["TEAM", "1", "T"])
+        self.assertListEqual(list(bundle["LINE_SCORE"]["T"]), [96, 123])
+        self.assertIsNone(bundle["FOUR_FACTORS"])
+
+    def test_game_box_scores_do_not_fetch_rosters(self):
+        page = Page(
+            "https://www.basketball-reference.com/boxscores/",
+            box_table("DEN", "game", "basic", ["jokić"])
+            + box_table("ATL", "game", "basic", ["young"]),
+        )
+        with mock.patch.object(page_module, "get_wrapper") as get_wrapper:
+            bundle = _parse_game_box_scores(page, pd.to_datetime("2020-01-06"))
+        get_wrapper.assert_not_called()
+        self.assertListEqual(list(bundle["BASIC"]["GAME"]["DEN"]["PLAYER"]), ["jokić"])
+
+    def test_get_box_scores_by_id(self):
+        url = get_game_id_url("202001060DEN")
+        remember_page(Page(url, BOX_SCORE_PAGE))
+        try:
+            d = get_box_scores_by_id("202001060DEN", period="H1")
+        finally:
+            clear_pages()
+        self.assertListEqual(list(d.keys()), ["ATL", "DEN"])
+        self.assertListEqual(list(d["ATL"]["PLAYER"]), ["young", "hunter"])
+        with self.assertRaises(ValueError):
+            get_box_scores_by_id("2020-01-06 DEN")
+
+    def test_get_box_scores_by_id_needs_two_teams(self):
+        url = get_game_id_url("202001060DEN")
+        remember_page(Page(url, box_table("DEN", "game", "basic", ["jokić"])))
+        try:
+            with self.assertRaisesRegex(ValueError, "202001060DEN"):
+                get_box_scores_by_id("202001060DEN")
+        finally:
+            clear_pages()
+
+    def test_parse_all_star_table(self):
+        df = _parse_all_star_table(parse_html(ALL_STAR_TABLE).find("table"))
+        self.assertListEqual(list(df["PLAYER"]), ["Luka Doncic", "Trae Young"])
+        self.assertListEqual(list(df["TEAM"]), ["DAL", "ATL"])
+        self.assertListEqual(list(df["PTS"]), [8, 10])
+
     def test_get_all_star_box_score(self):
         d = get_all_star_box_score(2020)
         df = d["Team LeBron"]
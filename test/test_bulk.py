@@ -0,0 +1,235 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+import requests
+
+from basketball_reference_scraper import bulk, seasons
+from basketball_reference_scraper.bulk import (Checkpoint, _get_games,
+                                               _parse_box_score_game,
+                                               _schedule_games, _write_game,
+                                               harvest, harvest_box_scores,
+                                               harvest_pbp, load_dataset)
+from basketball_reference_scraper.retry import CircuitOpenError
+
+
+def box_table(team, stat_type):
+    if stat_type == "basic":
+        head = '<th data-stat="pts">PTS</th><th data-stat="plus_minus">+/-</th>'
+        cells = '<td data-stat="pts">8</td><td data-stat="plus_minus">+4</td>'
+    else:
+        head = '<th data-stat="ts_pct">TS%</th>'
+        cells = '<td data-stat="ts_pct">.550</td>'
+    width = head.count("<th") + 1
+    return (
+        f'<table id="box-{team}-game-{stat_type}"><thead><tr>'
+        '<th data-stat="player">Starters</th><th data-stat="mp">MP</th>'
+        f"{head}</tr></thead><tbody>"
+        f'<tr><th data-stat="player"><a href="/players/a/{team.lower()}01.html">A</a></th>'
+        f'<td data-stat="mp">30:30</td>{cells}</tr>'
+        '<tr class="thead"><th data-stat="player">Reserves</th></tr>'
+        f'<tr><th data-stat="player"><a href="/players/b/{team.lower()}02.html">B</a></th>'
+        f'<td data-stat="reason" colspan="{width}">Did Not Play</td></tr>'
+        '</tbody><tfoot><tr><th data-stat="player">Team Totals</th></tr></tfoot></table>'
+    )
+
+
+BOX_SCORE_PAGE = "".join(
+    box_table(team, stat_type)
+    for team in ("ATL", "DEN")
+    for stat_type in ("basic", "advanced")
+)
+GAME = {
+    "GAME_ID": "202001060DEN",
+    "DATE": pd.Timestamp("2020-01-06"),
+    "VISITOR": "ATL",
+    "HOME": "DEN",
+}
+
+# pyarrow comes with the optional 'bulk' extra
+SCHEDULE_HEAD = "".join(
+    f'<th data-stat="{stat}">{name}</th>'
+    for stat, name in [
+        ("date_game", "Date"),
+        ("game_start_time", "Start (ET)"),
+        ("visitor_team_name", "Visitor/Neutral"),
+        ("visitor_pts", "PTS"),
+        ("home_team_name", "Home/Neutral"),
+        ("home_pts", "PTS"),
+        ("box_score_text", "&nbsp;"),
+        ("overtimes", "&nbsp;"),
+        ("attendance", "Attend."),
+        ("game_duration", "LOG"),
+        ("arena_name", "Arena"),
+        ("game_remarks", "Notes"),
+    ]
+)
+
+
+def schedule_row(date, visitor, home, game_id):
+    return (
+        f'<tr><th data-stat="date_game">{date}</th><td>7:30p</td><td>{visitor}</td>'
+        f"<td>100</td><td>{home}</td><td>99</td>"
+        f'<td data-stat="box_score_text"><a href="/boxscores/{game_id}.html">Box Score</a></td>'
+        "<td></td><td>19,520</td><td>2:14</td><td>Arena</td><td></td></tr>"
+    )
+
+
+SCHEDULE_APRIL = (
+    f'<table id="schedule"><thead><tr>{SCHEDULE_HEAD}</tr></thead><tbody>'
+    + schedule_row("Wed, Apr 10, 2019", "Utah Jazz", "Denver Nuggets", "201904100DEN")
+    + '<tr class="thead"><th colspan="12">Playoffs</th></tr>'
+    + schedule_row(
+        "Sat, Apr 13, 2019", "San Antonio Spurs", "Denver Nuggets", "201904130DEN"
+    )
+    + "</tbody></table>"
+)
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+requires_pyarrow = unittest.skipUnless(HAS_PYARROW, "requires pyarrow (bulk extra)")
+
+
+class TestBulk(unittest.TestCase):
+    def test_checkpoint(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "_checkpoint.json")
+            checkpoint = Checkpoint(path)
+            checkpoint.mark_failed("202001060DEN", "timeout")
+            checkpoint.mark_done("202001060DEN")
+            checkpoint = Checkpoint(path)
+            self.assertTrue(checkpoint.is_done("202001060DEN"))
+            self.assertDictEqual(checkpoint.failed, {})
+
+    def test_schedule_games(self):
+        schedule = pd.DataFrame(
+            {
+                "DATE": pd.to_datetime(["2020-01-06", "2020-01-08", "2020-01-10"]),
+                "VISITOR": ["Atlanta Hawks", "Denver Nuggets", "Atlanta Hawks"],
+                "HOME": ["Denver Nuggets", "Atlanta Hawks", "Denver Nuggets"],
+                "HOME_PTS": [123, 110, None],
+                "GAME_ID": ["202001060DEN", "202001080ATL", None],
+            }
+        )
+        games = _schedule_games(schedule).to_dict("records")
+        self.assertDictEqual(games[0], GAME)
+        self.assertListEqual([game["VISITOR"] for game in games], ["ATL", "DEN"])
+
+    def test_get_games_fetches_each_schedule_page_once(self):
+        def get_wrapper(url):
+            if url.endswith("NBA_2019_games-april.html"):
+                return mock.Mock(status_code=200, content=SCHEDULE_APRIL)
+            return mock.Mock(status_code=404, content=b"")
+
+        with mock.patch.object(
+            seasons, "get_wrapper", side_effect=get_wrapper
+        ) as fetch:
+            games = _get_games(start_date="2019-04-01", end_date="2019-04-30")
+        self.assertEqual(fetch.call_count, len(seasons._get_schedule_urls(2019)))
+        self.assertListEqual(list(games["GAME_ID"]), ["201904100DEN", "201904130DEN"])
+        self.assertListEqual(list(games["VISITOR"]), ["UTA", "SAS"])
+
+    def test_get_games_unpublished_season(self):
+        with mock.patch.object(
+            seasons, "get_wrapper", return_value=mock.Mock(status_code=404)
+        ):
+            self.assertEqual(len(_get_games(season=2099)), 0)
+            games = _get_games(start_date="2099-01-01", end_date="2099-01-31")
+        self.assertEqual(len(games), 0)
+        self.assertListEqual(list(games.columns), list(bulk.KEY_COLUMNS))
+
+    @requires_pyarrow
+    def test_harvest_records_request_errors(self):
+        games = [GAME, dict(GAME, GAME_ID="202001060LAL", HOME="LAL")]
+        errors = [
+            requests.exceptions.ConnectionError("Connection reset by peer"),
+            requests.exceptions.Timeout("Read timed out"),
+        ]
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            bulk, "get_wrapper", side_effect=errors
+        ):
+            summary = harvest(games, bulk._get_pbp_url, bulk._parse_pbp, tmp)
+            self.assertEqual(summary["written"], 0)
+            self.assertListEqual(
+                list(summary["failed"]), ["202001060DEN", "202001060LAL"]
+            )
+            checkpoint = Checkpoint(os.path.join(tmp, "_checkpoint.json"))
+            self.assertIn("Read timed out", checkpoint.failed["202001060LAL"])
+
+        # an open circuit still stops the harvest
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            bulk, "get_wrapper", side_effect=CircuitOpenError("open")
+        ):
+            with self.assertRaises(CircuitOpenError):
+                harvest([GAME], bulk._get_pbp_url, bulk._parse_pbp, tmp)
+
+    @requires_pyarrow
+    def test_harvest_box_scores_records_request_errors(self):
+        other = dict(GAME, GAME_ID="202001060LAL", HOME="LAL")
+        response = mock.Mock(status_code=200, content=BOX_SCORE_PAGE)
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            bulk, "iter_games", return_value=[GAME, other]
+        ), mock.patch.object(
+            bulk,
+            "get_wrapper",
+            side_effect=[requests.exceptions.Timeout("Read timed out"), response],
+        ):
+            summary = harvest_box_scores(tmp, season=2020)
+            self.assertEqual(summary["written"], 1)
+            self.assertListEqual(list(summary["failed"]), ["202001060DEN"])
+            self.assertListEqual(
+                list(load_dataset(tmp)["GAME_ID"].unique()), ["202001060LAL"]
+            )
+
+    def test_harvest_requires_pyarrow(self):
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(
+            sys.modules, {"pyarrow": None}
+        ), mock.patch.object(bulk, "get_wrapper") as get_wrapper:
+            with self.assertRaisesRegex(ImportError, r"\[bulk\]"):
+                harvest([GAME], bulk._get_pbp_url, bulk._parse_pbp, tmp)
+            get_wrapper.assert_not_called()
+
+    @requires_pyarrow
+    def test_harvest_pbp(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            summary = harvest_pbp(tmp, start_date="2020-01-06")
+            self.assertGreater(summary["written"], 0)
+            df = load_dataset(tmp, filters=[("HOME", "=", "DEN")])
+            self.assertListEqual(list(df["GAME_ID"].unique()), ["202001060DEN"])
+            self.assertEqual(harvest_pbp(tmp, start_date="2020-01-06")["written"], 0)
+
+    @requires_pyarrow
+    def test_parse_box_score_game(self):
+        df = _parse_box_score_game(BOX_SCORE_PAGE, GAME)
+        self.assertListEqual(list(df["TEAM"]), ["ATL", "ATL", "DEN", "DEN"])
+        self.assertListEqual(list(df["OPPONENT"]), ["DEN", "DEN", "ATL", "ATL"])
+        self.assertListEqual(
+            list(df["PLAYER_ID"]), ["atl01", "atl02", "den01", "den02"]
+        )
+        self.assertListEqual(list(df["STARTER"]), [True, False, True, False])
+        self.assertEqual(df.iloc[1]["STATUS"], "Did Not Play")
+        self.assertEqual(df.iloc[0]["MP"], 30.5)
+        self.assertEqual(str(df["PTS"].dtype), "Int16")
+        self.assertTrue(df["PTS"].isna().iloc[1])
+        self.assertAlmostEqual(df.iloc[2]["TS%"], 0.55)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            _write_game(df, GAME, tmp, "parquet")
+            df = load_dataset(tmp)
+            self.assertEqual(len(df), 4)
+            self.assertListEqual(list(df["GAME_ID"].unique()), ["202001060DEN"])
+
+    @requires_pyarrow
+    def test_harvest_box_scores(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            summary = harvest_box_scores(tmp, start_date="2020-01-06")
+            self.assertGreater(summary["written"], 0)
+            df = load_dataset(tmp, filters=[("TEAM", "=", "DEN")])
+            self.assertIn("jokicni01", set(df["PLAYER_ID"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from datetime import datetime
+
+from basketball_reference_scraper.cache import (NEVER_EXPIRES, SHORT_TTL,
+                                                ResponseCache, get_ttl)
+
+
+class TestCache(unittest.TestCase):
+    def test_get_ttl(self):
+        now = datetime(2024, 1, 15)
+        base = "https://www.basketball-reference.com"
+        self.assertEqual(
+            get_ttl(f"{base}/boxscores/202001060DEN.html", now), NEVER_EXPIRES
+        )
+        self.assertEqual(
+            get_ttl(f"{base}/boxscores/?month=1&year=2020&day=6", now), NEVER_EXPIRES
+        )
+        self.assertEqual(get_ttl(f"{base}/draft/NBA_2003.html", now), NEVER_EXPIRES)
+        self.assertEqual(get_ttl(f"{base}/teams/GSW/2019.html", now), NEVER_EXPIRES)
+        self.assertEqual(get_ttl(f"{base}/teams/GSW/2024.html", now), SHORT_TTL)
+        self.assertEqual(get_ttl(f"{base}/friv/injuries.fcgi", now), SHORT_TTL)
+        self.assertEqual(get_ttl(f"{base}/boxscores/202401150DEN.html", now), SHORT_TTL)
+
+    def test_response_cache(self):
+        cache = ResponseCache(":memory:")
+        url = "https://www.basketball-reference.com/draft/NBA_2003.html"
+        self.assertIsNone(cache.get(url))
+        cache.set(url, 200, {"Content-Type": "text/html"}, b"<html></html>", None)
+        self.assertEqual(
+            cache.get(url), (200, {"Content-Type": "text/html"}, b"<html></html>")
+        )
+        cache.set(url, 200, {}, b"stale", -1)
+        self.assertIsNone(cache.get(url))
+        self.assertEqual(cache.info()["hits"], 1)
+        self.assertEqual(cache.info()["misses"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from basketball_reference_scraper.lookup import lookup, search
+
+
+class TestLookup(unittest.TestCase):
+    def test_exact_match(self):
+        self.assertEqual(lookup("Luka Dončić", ask_matches=False), "Luka Doncic")
+        self.assertEqual(search("lebron james", max_distance=0), [("LeBron James", 0)])
+
+    def test_misspelling(self):
+        self.assertEqual(
+            lookup("Giannis Antetokounpo", ask_matches=False), "Giannis Antetokounmpo"
+        )
+        matches = search("Lebron Jamse", k=3)
+        self.assertEqual(matches[0], ("LeBron James", 2))
+        self.assertLessEqual(len(matches), 3)
+
+    def test_ties_keep_file_order(self):
+        matches = search("Chris Smith", k=None)
+        self.assertEqual(matches[:2], [("Chris Smith", 0), ("Chris Smith", 0)])
+        self.assertEqual([d for _, d in matches], sorted(d for _, d in matches))
+
+    def test_duplicate_exact_names(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(lookup("Chris Smith"), "Chris Smith")
+        self.assertNotIn("1 result found", output.getvalue())
+        self.assertIn(
+            f"{len(search('Chris Smith', k=None))} results found", output.getvalue()
+        )
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            lookup("LeBron James")
+        self.assertIn("1 result found", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
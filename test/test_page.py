@@ -0,0 +1,104 @@
+import unittest
+
+from basketball_reference_scraper.page import (Page, clear_pages, get_page,
+                                               link_ids, parse_html,
+                                               remember_page, table_to_df)
+
+TEAM_PAGE = """
+<html><body>
+<table id="roster"><thead><tr><th data-stat="number">No.</th>
+<th data-stat="player">Player</th></tr></thead>
+<tbody><tr><th data-stat="number">30</th>
+<td data-stat="player"><a href="/players/c/curryst01.html">Stephen Curry</a></td></tr>
+</tbody></table>
+<div id="all_team_misc"><!--
+<table id="team_misc"><thead><tr><th data-stat="player"></th><th data-stat="wins">W</th>
+<th data-stat="arena_name">Arena</th></tr></thead>
+<tbody><tr><th data-stat="player">Team</th><td data-stat="wins">57</td>
+<td data-stat="arena_name">Oracle Arena</td></tr></tbody></table>
+--></div>
+</body></html>
+"""
+BOX_SCORE = """
+<table id="box-LAL-game-basic"><thead>
+<tr class="over_header"><th colspan="2"></th><th colspan="3">Basic Box Score Stats</th></tr>
+<tr><th data-stat="player">Starters</th><th data-stat="mp">MP</th><th data-stat="fg">FG</th>
+<th data-stat="fg_pct">FG%</th><th data-stat="plus_minus">+/-</th></tr></thead>
+<tbody>
+<tr><th data-stat="player"><a href="/players/j/jamesle01.html">LeBron James</a></th>
+<td data-stat="mp">36:12</td><td data-stat="fg">10</td><td data-stat="fg_pct">.500</td>
+<td data-stat="plus_minus">+5</td></tr>
+<tr class="thead"><th data-stat="player">Reserves</th><th>MP</th><th>FG</th><th>FG%</th><th>+/-</th></tr>
+<tr><th data-stat="player"><a href="/players/d/davisan02.html">Anthony Davis</a></th>
+<td data-stat="mp">30:00</td><td data-stat="fg">1,000</td><td data-stat="fg_pct"></td>
+<td data-stat="plus_minus">-3</td></tr>
+<tr><th data-stat="player"><a href="/players/h/howardw01.html">Dwight Howard</a></th>
+<td data-stat="reason" colspan="4">Did Not Play</td></tr>
+</tbody>
+<tfoot><tr><th data-stat="player">Team Totals</th><td data-stat="mp">240</td>
+<td data-stat="fg">40</td><td data-stat="fg_pct">.444</td><td data-stat="plus_minus"></td></tr></tfoot>
+</table>
+"""
+
+
+URL = "https://www.basketball-reference.com/teams/GSW/2019.html"
+
+
+class TestPage(unittest.TestCase):
+    def tearDown(self):
+        clear_pages()
+
+    def test_tables(self):
+        page = Page(URL, TEAM_PAGE.encode("utf-8"))
+        self.assertListEqual(page.table_ids(), ["roster", "team_misc"])
+        self.assertIsNone(page.get_table("per_game"))
+        self.assertIs(page.get_table("roster"), page.get_table("roster"))
+
+        df = page.get_df("roster", links={"player": "PLAYER_HREF"})
+        self.assertListEqual(list(df.columns), ["No.", "Player", "PLAYER_HREF"])
+        self.assertEqual(df.iloc[0]["PLAYER_HREF"], "/players/c/curryst01.html")
+        # callers get their own copy
+        df.drop(columns=["PLAYER_HREF"], inplace=True)
+        self.assertIn("PLAYER_HREF", page.get_df("roster", {"player": "PLAYER_HREF"}))
+
+        df = page.get_df("team_misc")
+        self.assertListEqual(list(df.columns), ["Unnamed: 0", "W", "Arena"])
+        self.assertEqual(df.iloc[0]["W"], 57)
+        # the commented table is found without parsing the whole page
+        self.assertIsNone(page._soup)
+
+    def test_table_to_df(self):
+        table = parse_html(BOX_SCORE).find("table")
+        df = table_to_df(table, links={"player": "PLAYER_HREF"})
+        self.assertListEqual(
+            list(df.columns), ["Starters", "MP", "FG", "FG%", "+/-", "PLAYER_HREF"]
+        )
+        self.assertListEqual(
+            list(df["Starters"]),
+            ["LeBron James", "Anthony Davis", "Dwight Howard", "Team Totals"],
+        )
+        self.assertEqual(df.iloc[2]["MP"], "Did Not Play")
+        self.assertEqual(df.iloc[2]["+/-"], "Did Not Play")
+        self.assertListEqual(
+            list(link_ids(df["PLAYER_HREF"])[:3]),
+            ["jamesle01", "davisan02", "howardw01"],
+        )
+
+        # without the note spanning them, the stat columns are numeric
+        table.find(string="Did Not Play").find_parent("tr").decompose()
+        df = table_to_df(table, use_data_stat=True)
+        self.assertListEqual(
+            list(df.columns), ["player", "mp", "fg", "fg_pct", "plus_minus"]
+        )
+        self.assertListEqual(list(df["fg"]), [10, 1000, 40])
+        self.assertListEqual(list(df["plus_minus"][:2]), [5, -3])
+        self.assertTrue(df["fg_pct"].isna().iloc[1])
+
+    def test_get_page_reuses_pages(self):
+        page = remember_page(Page(URL, TEAM_PAGE))
+        self.assertIs(get_page(URL), page)
+        self.assertIsNone(remember_page(Page(URL + "?x", "", 404)).get_df("roster"))
+
+
+if __name__ == "__main__":
+    unittest.main()
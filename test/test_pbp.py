@@ -1,14 +1,73 @@
 import unittest
 
-from basketball_reference_scraper.pbp import get_pbp
+from basketball_reference_scraper.pbp import (_parse_pbp_table,
+                                              classify_events, format_df,
+                                              get_pbp)
+
+PBP = """
+<table id="pbp"><thead><tr><th colspan="6">1st Quarter</th></tr>
+<tr><th>Time</th><th>Atlanta</th><th></th><th>Score</th><th></th><th>Denver</th></tr></thead>
+<tbody>
+<tr><td>12:00.0</td><td colspan="5">Jump ball: N. Jokic vs. J. Collins</td></tr>
+<tr><td>11:46.0</td><td>T. Young makes 2-pt jump shot</td><td>+2</td><td>2-0</td><td></td><td></td></tr>
+<tr><th colspan="6">2nd Q</th></tr>
+<tr><td>11:00.0</td><td></td><td></td><td>2-3</td><td>+3</td><td>J. Murray makes 3-pt jump shot</td></tr>
+<tr><td>6:59.0</td><td></td><td></td><td>2-3</td><td></td><td>Official timeout</td></tr>
+<tr><td>5:30.0</td><td>Flagrant foul type 1 by J. Collins (drawn by N. Jokic)</td><td></td><td>2-3</td><td></td><td></td></tr>
+<tr><td>5:10.0</td><td></td><td></td><td>2-3</td><td></td><td>Flagrant foul type 2 by A. Gordon (drawn by T. Young)</td></tr>
+<tr><th colspan="6">1st OT</th></tr>
+<tr><td>4:10.0</td><td></td><td></td><td>120-122</td><td>+2</td><td>N. Jokic makes 2-pt layup</td></tr>
+</tbody></table>
+"""
 
 
 class TestPbp(unittest.TestCase):
+    def test_format_df(self):
+        df = format_df(_parse_pbp_table(PBP))
+        self.assertListEqual(list(df["QUARTER"]), [1, 2, 2, 2, 2, 5])
+        self.assertListEqual(
+            list(df["SECONDS_REMAINING"]), [706.0, 660.0, 419.0, 330.0, 310.0, 250.0]
+        )
+        self.assertListEqual(
+            list(df["SECONDS_ELAPSED"]), [14.0, 780.0, 1021.0, 1110.0, 1130.0, 2930.0]
+        )
+        self.assertListEqual(list(df["ATLANTA_SCORE"]), [2, 2, 2, 2, 2, 120])
+        self.assertListEqual(list(df["DENVER_SCORE"]), [0, 3, 3, 3, 3, 122])
+        self.assertEqual(df["DENVER_SCORE"].dtype, "int16")
+
+    def test_classify_events(self):
+        df = classify_events(format_df(_parse_pbp_table(PBP)))
+        self.assertListEqual(
+            list(df["EVENT_TEAM"]),
+            ["ATLANTA", "DENVER", "DENVER", "ATLANTA", "DENVER", "DENVER"],
+        )
+        self.assertListEqual(
+            list(df["EVENT_TYPE"]),
+            ["MADE_SHOT", "MADE_SHOT", "TIMEOUT", "FOUL", "FOUL", "MADE_SHOT"],
+        )
+        self.assertListEqual(
+            list(df["PLAYER"]),
+            [
+                "T. Young",
+                "J. Murray",
+                "Official",
+                "J. Collins",
+                "A. Gordon",
+                "N. Jokic",
+            ],
+        )
+        self.assertListEqual(list(df["POINTS"]), [2, 3, 0, 0, 0, 2])
+        self.assertListEqual(
+            list(df["SECONDARY_PLAYER"])[3:5], ["N. Jokic", "T. Young"]
+        )
+
     def test_pbp(self):
         df = get_pbp("2020-01-06", "DEN", "ATL")
         expected_columns = [
             "QUARTER",
             "TIME_REMAINING",
+            "SECONDS_REMAINING",
+            "SECONDS_ELAPSED",
             "DENVER_ACTION",
             "ATLANTA_ACTION",
             "DENVER_SCORE",
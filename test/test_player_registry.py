@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from basketball_reference_scraper import player_registry
+from basketball_reference_scraper.player_registry import (load_player_registry,
+                                                          normalize_name,
+                                                          parse_player_index,
+                                                          resolve_player_id)
+
+PLAYER_INDEX = """
+<table id="players"><tbody>
+<tr><th data-stat="player"><strong><a href="/players/j/jamesle01.html">LeBron James</a></strong></th>
+<td data-stat="year_min">2004</td><td data-stat="year_max">2025</td></tr>
+<tr><th data-stat="player"><a href="/players/j/jamesmi02.html">Mike James</a></th>
+<td data-stat="year_min">2018</td><td data-stat="year_max">2018</td></tr>
+</tbody></table>
+"""
+
+
+class TestPlayerRegistry(unittest.TestCase):
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name("Nikola Jokić"), "nikola jokic")
+        self.assertEqual(normalize_name("D'Angelo Russell (TW)"), "dangelo russell")
+
+    def test_parse_player_index(self):
+        df = parse_player_index(PLAYER_INDEX)
+        self.assertListEqual(list(df["PLAYER_ID"]), ["jamesle01", "jamesmi02"])
+        self.assertListEqual(list(df["FROM"]), [2004, 2018])
+
+    def test_resolve_player_id(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "br_players.csv")
+            parse_player_index(PLAYER_INDEX).to_csv(path, index=False)
+            user_path = os.path.join(tmp, "user", "br_players.csv")
+            with mock.patch.object(
+                player_registry, "REGISTRY_PATH", path
+            ), mock.patch.object(
+                player_registry, "user_registry_path", return_value=user_path
+            ):
+                try:
+                    load_player_registry(reload=True)
+                    self.assertEqual(resolve_player_id("LeBron James"), "jamesle01")
+                    self.assertEqual(resolve_player_id("Mike James", 2018), "jamesmi02")
+                    self.assertIsNone(resolve_player_id("Wilt Chamberlain"))
+                finally:
+                    player_registry._registry = None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from time import monotonic
+
+from basketball_reference_scraper.rate_limit import RateLimiter
+
+
+class TestRateLimit(unittest.TestCase):
+    def test_burst_then_spacing(self):
+        limiter = RateLimiter(requests=10, window=1, burst=2)
+        self.assertEqual(limiter.acquire(), 0)
+        self.assertEqual(limiter.acquire(), 0)
+        start = monotonic()
+        wait = limiter.acquire()
+        self.assertAlmostEqual(wait, 0.1, delta=0.02)
+        self.assertGreaterEqual(monotonic() - start, 0.09)
+        self.assertEqual(limiter.stats()["calls"], 3)
+
+    def test_acquire_async(self):
+        limiter = RateLimiter(requests=20, window=1, burst=1)
+
+        async def run():
+            return await asyncio.gather(*[limiter.acquire_async() for _ in range(3)])
+
+        waits = sorted(asyncio.run(run()))
+        self.assertEqual(waits[0], 0)
+        self.assertAlmostEqual(waits[2], 0.1, delta=0.02)
+
+    def test_lock_file_is_shared(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            lock_file = os.path.join(tmp, "limit.lock")
+            first = RateLimiter(requests=10, window=1, burst=1, lock_file=lock_file)
+            second = RateLimiter(requests=10, window=1, burst=1, lock_file=lock_file)
+            self.assertEqual(first.acquire(), 0)
+            self.assertGreater(second.acquire(), 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
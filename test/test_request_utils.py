@@ -0,0 +1,80 @@
+import asyncio
+import threading
+import unittest
+from time import sleep
+from unittest import mock
+
+from requests import Response
+
+from basketball_reference_scraper import cache, rate_limit, request_utils
+
+
+def _slow_get(url, timeout=None):
+    sleep(0.2)
+    r = Response()
+    r.status_code = 200
+    r._content = url.encode()
+    return r
+
+
+class TestRequestUtils(unittest.TestCase):
+    def setUp(self):
+        cache.configure_cache(enabled=False)
+        rate_limit.configure_rate_limiter(requests=1000, window=1, burst=1000)
+
+    def tearDown(self):
+        cache.configure_cache(enabled=True)
+        rate_limit.configure_rate_limiter()
+
+    def test_configure_session_keeps_headers(self):
+        session = request_utils.get_session()
+        user_agent = session.headers["User-Agent"]
+        request_utils.configure_session(headers={"User-Agent": "brscraper-test"})
+        try:
+            request_utils.configure_session(pool_size=4)
+            self.assertIs(request_utils.get_session(), session)
+            self.assertEqual(session.headers["User-Agent"], "brscraper-test")
+            adapter = session.get_adapter("https://www.basketball-reference.com/")
+            self.assertEqual(adapter._pool_maxsize, 4)
+        finally:
+            session.headers["User-Agent"] = user_agent
+            request_utils.configure_session(pool_size=10)
+
+    def test_concurrent_calls_share_one_fetch(self):
+        session = mock.Mock()
+        session.get.side_effect = _slow_get
+        url = "https://www.basketball-reference.com/teams/DEN/2020.html"
+        results = []
+        with mock.patch.object(request_utils, "get_session", return_value=session):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(request_utils.get_wrapper(url))
+                )
+                for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(r is results[0] for r in results))
+
+    def test_concurrent_async_calls_share_one_fetch(self):
+        session = mock.Mock()
+        session.get.side_effect = _slow_get
+        url = "https://www.basketball-reference.com/teams/DEN/2020.html"
+
+        async def run():
+            return await asyncio.gather(
+                *[request_utils.get_wrapper_async(url) for _ in range(3)]
+            )
+
+        with mock.patch.object(request_utils, "get_session", return_value=session):
+            results = asyncio.run(run())
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual({r.content for r in results}, {url.encode()})
+
+
+if __name__ == "__main__":
+    unittest.main()
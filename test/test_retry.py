@@ -0,0 +1,78 @@
+import unittest
+from time import monotonic
+from unittest import mock
+
+from requests import Response
+
+from basketball_reference_scraper import (cache, rate_limit, request_utils,
+                                          retry)
+
+
+def _response(status_code, headers=None):
+    r = Response()
+    r.status_code = status_code
+    r.headers.update(headers or {})
+    r._content = b""
+    return r
+
+
+class TestRetry(unittest.TestCase):
+    def setUp(self):
+        cache.configure_cache(enabled=False)
+        rate_limit.configure_rate_limiter(requests=1000, window=1, burst=1000)
+        retry.configure_retry(backoff_base=0.01, jitter=0, breaker_threshold=3)
+
+    def tearDown(self):
+        cache.configure_cache(enabled=True)
+        rate_limit.configure_rate_limiter()
+        retry.configure_retry()
+
+    def test_next_delay(self):
+        policy = retry.RetryPolicy(max_attempts=3, backoff_base=1, jitter=0)
+        started = monotonic()
+        self.assertEqual(policy.next_delay(1, started), 1)
+        self.assertEqual(policy.next_delay(2, started), 2)
+        self.assertIsNone(policy.next_delay(3, started))
+        throttled = _response(429, {"Retry-After": "7"})
+        self.assertEqual(policy.next_delay(1, started, throttled), 7)
+        self.assertIsNone(
+            retry.RetryPolicy(deadline=5).next_delay(1, started, throttled)
+        )
+
+    def test_get_wrapper_requests_again_after_429(self):
+        session = mock.Mock()
+        session.get.side_effect = [
+            _response(429, {"Retry-After": "0"}),
+            _response(503),
+            _response(200),
+        ]
+        with mock.patch.object(request_utils, "get_session", return_value=session):
+            r = request_utils.get_wrapper("https://www.basketball-reference.com/")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(session.get.call_count, 3)
+
+    def test_exhausted_call_does_not_open_circuit(self):
+        session = mock.Mock()
+        session.get.return_value = _response(429, {"Retry-After": "0"})
+        with mock.patch.object(request_utils, "get_session", return_value=session):
+            r = request_utils.get_wrapper("https://www.basketball-reference.com/")
+        self.assertEqual(r.status_code, 429)
+        # four attempts, but only one failed call
+        self.assertEqual(session.get.call_count, 4)
+        self.assertEqual(retry.get_circuit_breaker().failures, 1)
+        self.assertFalse(retry.get_circuit_breaker().is_open)
+
+    def test_circuit_breaker_opens(self):
+        session = mock.Mock()
+        session.get.return_value = _response(429, {"Retry-After": "0"})
+        url = "https://www.basketball-reference.com/"
+        with mock.patch.object(request_utils, "get_session", return_value=session):
+            for _ in range(3):
+                request_utils.get_wrapper(url)
+            with self.assertRaises(retry.CircuitOpenError):
+                request_utils.get_wrapper(url)
+        self.assertEqual(session.get.call_count, 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,53 @@
 import unittest
 from typing import List
 
-from basketball_reference_scraper.seasons import get_schedule, get_standings
+from basketball_reference_scraper.seasons import (_format_schedule,
+                                                  _parse_schedule_month,
+                                                  get_schedule, get_standings)
+
+
+def schedule_row(date, visitor, visitor_pts, home, home_pts, game_id):
+    box_score = f'<a href="/boxscores/{game_id}.html">Box Score</a>' if game_id else ""
+    return (
+        f'<tr><th data-stat="date_game">{date}</th>'
+        '<td data-stat="game_start_time">7:30p</td>'
+        f'<td data-stat="visitor_team_name">{visitor}</td>'
+        f'<td data-stat="visitor_pts">{visitor_pts}</td>'
+        f'<td data-stat="home_team_name">{home}</td>'
+        f'<td data-stat="home_pts">{home_pts}</td>'
+        f'<td data-stat="box_score_text">{box_score}</td>'
+        '<td data-stat="overtimes"></td><td data-stat="attendance">19,520</td>'
+        '<td data-stat="game_duration">2:14</td><td data-stat="arena_name">Arena</td>'
+        '<td data-stat="game_remarks"></td></tr>'
+    )
+
+
+SCHEDULE_MONTH = (
+    '<table id="schedule"><thead><tr><th data-stat="date_game">Date</th>'
+    '<th data-stat="game_start_time">Start (ET)</th>'
+    '<th data-stat="visitor_team_name">Visitor/Neutral</th>'
+    '<th data-stat="visitor_pts">PTS</th><th data-stat="home_team_name">Home/Neutral</th>'
+    '<th data-stat="home_pts">PTS</th><th data-stat="box_score_text">&nbsp;</th>'
+    '<th data-stat="overtimes">&nbsp;</th><th data-stat="attendance">Attend.</th>'
+    '<th data-stat="game_duration">LOG</th><th data-stat="arena_name">Arena</th>'
+    '<th data-stat="game_remarks">Notes</th></tr></thead><tbody>'
+    + schedule_row(
+        "Wed, Apr 10, 2019", "Utah Jazz", 137, "Denver Nuggets", 116, "201904100DEN"
+    )
+    + '<tr class="thead"><th colspan="12">Playoffs</th></tr>'
+    + schedule_row(
+        "Sat, Apr 13, 2019",
+        "San Antonio Spurs",
+        101,
+        "Denver Nuggets",
+        96,
+        "201904130DEN",
+    )
+    + schedule_row(
+        "Tue, Apr 16, 2019", "San Antonio Spurs", "", "Denver Nuggets", "", None
+    )
+    + "</tbody></table>"
+)
 
 
 class TestSeason(unittest.TestCase):
@@ -14,6 +60,7 @@ class TestSeason(unittest.TestCase):
         "HOME_PTS",
         "OT?",
         "LOG",
+        "GAME_ID",
     ]
 
     _expected_standings_columns: List[str] = [
@@ -30,6 +77,17 @@ class TestSeason(unittest.TestCase):
 
     _conferences: List[str] = ["EASTERN_CONF", "WESTERN_CONF"]
 
+    def test_parse_schedule(self):
+        df = _parse_schedule_month(SCHEDULE_MONTH)
+        season = _format_schedule(df, 2019, playoffs=False)
+        self.assertListEqual(list(season.columns), self._expected_schedule_columns)
+        self.assertListEqual(list(season["GAME_ID"]), ["201904100DEN"])
+
+        playoffs = _format_schedule(df, 2019, playoffs=True)
+        self.assertEqual(playoffs.iloc[0]["GAME_ID"], "201904130DEN")
+        # games not played yet have no box score
+        self.assertTrue(playoffs["GAME_ID"].isna().iloc[1])
+
     def test_get_schedule(self):
         df = get_schedule(1999)
 
@@ -1,9 +1,32 @@
 import unittest
 
-from basketball_reference_scraper.shot_charts import get_shot_chart
+from basketball_reference_scraper.shot_charts import (_parse_shot_chart,
+                                                      _shot_chart_teams,
+                                                      get_shot_chart)
+
+SHOT_CHART = """
+<div class="shot-area" id="shots-TOR">
+<div style="top:90px;left:270px;" tip="1st quarter, 11:03.0 remaining<br>Serge Ibaka missed 2-pointer from 7 ft<br>Toronto trails 0-2" class="tooltip miss">&#215;</div>
+<div style="top:300px;left:25px;" tip="4th quarter, 0:01.5 remaining<br>Kyle Lowry made 3-pointer from 25 ft<br>Toronto leads 100-98" class="tooltip make">&#9679;</div>
+</div>
+<div class="shot-area" id="shots-BOS"></div>
+"""
 
 
 class TestShotCharts(unittest.TestCase):
+    def test_parse_shot_chart(self):
+        d = _parse_shot_chart(SHOT_CHART, "TOR", "BOS")
+        df = d["TOR"]
+        self.assertListEqual(list(df["x"]), [27.0, 2.5])
+        self.assertListEqual(list(df["QUARTER"]), [1, 4])
+        self.assertListEqual(list(df["SECONDS_REMAINING"]), [663.0, 1.5])
+        self.assertListEqual(list(df["MAKE"]), [False, True])
+        self.assertListEqual(list(df["VALUE"]), [2, 3])
+        self.assertListEqual(list(df["DISTANCE"]), [7.0, 25.0])
+        self.assertEqual(df["x"].dtype, "float32")
+        self.assertEqual(len(d["BOS"]), 0)
+        self.assertListEqual(_shot_chart_teams(SHOT_CHART), ["TOR", "BOS"])
+
     def test_get_shot_chart(self):
         d = get_shot_chart("2019-12-28", "TOR", "BOS")
         self.assertListEqual(list(d.keys()), ["TOR", "BOS"])
@@ -14,8 +37,10 @@ class TestShotCharts(unittest.TestCase):
                 "y",
                 "QUARTER",
                 "TIME_REMAINING",
+                "SECONDS_REMAINING",
                 "PLAYER",
                 "MAKE_MISS",
+                "MAKE",
                 "VALUE",
                 "DISTANCE",
             ],
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import requests
+
+from basketball_reference_scraper import bulk, shot_grids
+from basketball_reference_scraper.shot_grids import (ZONES, ShotGrids,
+                                                     bin_centers, bin_index,
+                                                     classify_zones,
+                                                     harvest_shot_grids)
+
+SHOTS = pd.DataFrame(
+    {
+        "TEAM": ["TOR", "TOR", "BOS"],
+        "PLAYER": ["Kyle Lowry", "Kyle Lowry", "Kemba Walker"],
+        "QUARTER": [1, 4, 2],
+        "x": [25.0, 1.0, 25.0],
+        "y": [5.0, 3.0, 40.0],
+        "MAKE": [True, False, True],
+    }
+)
+
+SHOT_CHART = """
+<div class="shot-area" id="shots-TOR">
+<div style="top:90px;left:270px;" tip="1st quarter, 11:03.0 remaining<br>Serge Ibaka missed 2-pointer from 7 ft<br>Toronto trails 0-2" class="tooltip miss">&#215;</div>
+</div>
+<div class="shot-area" id="shots-BOS"></div>
+"""
+
+
+class TestShotGrids(unittest.TestCase):
+    def test_classify_zones(self):
+        zones = classify_zones(SHOTS["x"], SHOTS["y"])
+        self.assertListEqual(
+            [ZONES[z] for z in zones], ["RESTRICTED_AREA", "CORNER_3", "ABOVE_BREAK_3"]
+        )
+
+    def test_hex_centers_map_to_their_cells(self):
+        x, y = bin_centers("hex", 1.0)
+        inside = (x >= 0) & (x <= 50) & (y <= 47)
+        row, col = bin_index(x[inside], y[inside], "hex", 1.0)
+        rows, cols = np.indices(x.shape)
+        self.assertTrue((row == rows[inside]).all())
+        self.assertTrue((col == cols[inside]).all())
+
+    def test_incremental_save(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "grids.npz")
+            grids = ShotGrids()
+            grids.add(SHOTS, "201912280TOR")
+            grids.save(path)
+            grids = ShotGrids.load(path)
+            grids.add(SHOTS, "201912280TOR")
+            grids.add(SHOTS, "201912300TOR")
+            self.assertEqual(grids.grid().sum(), 6)
+            self.assertEqual(grids.grid(player="Kyle Lowry", makes=True).sum(), 2)
+            self.assertEqual(grids.grid(team="TOR", quarter=4).sum(), 2)
+            zones = grids.zones(team="BOS")
+            self.assertEqual(zones.set_index("ZONE").loc["ABOVE_BREAK_3", "FGA"], 2)
+
+    def test_harvest_skips_request_errors(self):
+        games = [{"GAME_ID": "201912270BOS"}, {"GAME_ID": "201912280BOS"}]
+        response = mock.Mock(status_code=200, content=SHOT_CHART)
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            shot_grids, "iter_games", return_value=games
+        ), mock.patch.object(
+            bulk,
+            "get_wrapper",
+            side_effect=[requests.exceptions.Timeout("Read timed out"), response],
+        ):
+            grids = harvest_shot_grids(os.path.join(tmp, "grids.npz"), season=2020)
+        self.assertListEqual(sorted(grids.games), ["201912280BOS"])
+        self.assertEqual(grids.grid(team="TOR").sum(), 1)
+
+    def test_harvest_skips_games_without_two_teams(self):
+        games = [{"GAME_ID": "201912270BOS"}, {"GAME_ID": "201912280BOS"}]
+        one_team = SHOT_CHART.split('<div class="shot-area" id="shots-BOS">')[0]
+        responses = [
+            mock.Mock(status_code=200, content=one_team),
+            mock.Mock(status_code=200, content=SHOT_CHART),
+        ]
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            shot_grids, "iter_games", return_value=games
+        ), mock.patch.object(bulk, "get_wrapper", side_effect=responses):
+            grids = harvest_shot_grids(os.path.join(tmp, "grids.npz"), season=2020)
+        self.assertListEqual(sorted(grids.games), ["201912280BOS"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ from basketball_reference_scraper.teams import (get_opp_stats, get_roster,
                                                 get_roster_stats,
                                                 get_team_misc,
                                                 get_team_ratings,
+                                                get_team_season,
                                                 get_team_stats, get_teams)
 
 
@@ -216,6 +217,20 @@ class TestTeams(unittest.TestCase):
         self.assertCountEqual(list(df.columns), expected_columns)
         self.assertEqual(len(df), 30)
 
+    def test_get_team_season(self):
+        season = get_team_season("GSW", 2019)
+        self.assertListEqual(
+            list(season["ROSTER"].columns), list(get_roster("GSW", 2019).columns)
+        )
+        self.assertListEqual(
+            list(season["TEAM_STATS"]), ["TOTALS", "PER_GAME", "RANK", "YEAR/YEAR"]
+        )
+        self.assertTrue(
+            season["OPP_STATS"]["PER_GAME"].equals(get_opp_stats("GSW", 2019))
+        )
+        self.assertIn("ADVANCED", season["ROSTER_STATS"])
+        self.assertIn("PER_GAME", season["PLAYOFFS_ROSTER_STATS"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+from basketball_reference_scraper import page as page_module
+from basketball_reference_scraper import utils
+from basketball_reference_scraper.page import clear_pages
+from basketball_reference_scraper.utils import (
+    get_roster_names,
+    get_scoreboard_index,
+    normalize_player_names,
+    parse_scoreboard_index,
+    resolve_players,
+)
+
+SCOREBOARD = """
+<div class="game_summary"><table class="teams"><tbody>
+<tr class="loser"><td><a href="/teams/ATL/2020.html">Atlanta</a></td><td>96</td>
+<td class="gamelink"><a href="/boxscores/202001060DEN.html">Final</a></td></tr>
+<tr class="winner"><td><a href="/teams/DEN/2020.html">Denver</a></td><td>123</td><td></td></tr>
+</tbody></table></div>
+"""
+
+ROSTER = """
+<table id="roster"><thead><tr><th>No.</th><th>Player</th><th>Pos</th></tr></thead><tbody>
+<tr><th>15</th><td data-stat="player"><a href="/players/j/jokicni01.html">Nikola Jokic</a></td><td>C</td></tr>
+<tr><th>27</th><td data-stat="player"><a href="/players/m/murraja01.html">Jamal Murray</a></td><td>PG</td></tr>
+</tbody></table>
+"""
+
+
+class TestUtils(unittest.TestCase):
+    def test_parse_scoreboard_index(self):
+        index = parse_scoreboard_index(SCOREBOARD)
+        self.assertDictEqual(
+            index,
+            {
+                "ATL": "/boxscores/202001060DEN.html",
+                "DEN": "/boxscores/202001060DEN.html",
+            },
+        )
+
+    def test_get_scoreboard_index(self):
+        index = get_scoreboard_index("2020-01-06")
+        self.assertEqual(index["ATL"], "/boxscores/202001060DEN.html")
+        self.assertEqual(index["DEN"], "/boxscores/202001060DEN.html")
+
+    def test_resolve_players(self):
+        df = resolve_players(
+            ["Nikola Vučević", "Nikola Vucevic", "Nikola Vučević"], network=False
+        )
+        self.assertListEqual(list(df["NAME"]), ["Nikola Vučević", "Nikola Vucevic"])
+        self.assertListEqual(list(df["PLAYER_ID"]), ["vucevni01", "vucevni01"])
+        self.assertListEqual(list(df["SCORE"]), [0, 0])
+
+        df = resolve_players(["LeBron James"], teams="LAL", seasons=2020)
+        self.assertEqual(df.iloc[0]["PLAYER_ID"], "jamesle01")
+
+    def test_resolve_players_scalar_hints(self):
+        df = resolve_players(
+            ["Nikola Vučević"], teams="ORL", seasons=np.int64(2020), network=False
+        )
+        self.assertEqual(df.iloc[0]["PLAYER_ID"], "vucevni01")
+        with self.assertRaises(ValueError):
+            resolve_players(["Nikola Vucevic"], seasons=[2019, 2020], network=False)
+
+    def test_resolve_players_missing_hints(self):
+        df = resolve_players(
+            ["Nikola Vučević", "Nikola Vučević"],
+            teams=[np.nan, "ORL"],
+            seasons=[float("nan"), np.int64(2020)],
+            network=False,
+        )
+        self.assertListEqual(list(df["PLAYER_ID"]), ["vucevni01", "vucevni01"])
+        self.assertTrue(df.iloc[0][["TEAM", "SEASON"]].isna().all())
+        df = resolve_players(["Nikola Vučević"], seasons=np.nan, network=False)
+        self.assertEqual(df.iloc[0]["PLAYER_ID"], "vucevni01")
+
+    def test_normalize_player_names(self):
+        response = SimpleNamespace(status_code=200, content=ROSTER)
+        utils._roster_names.clear()
+        clear_pages()
+        try:
+            with mock.patch.object(
+                page_module, "get_wrapper", return_value=response
+            ) as get_wrapper:
+                names = normalize_player_names(
+                    ["Nikola Jokić", "Jokić N.", "Jamál Murray", "Aaron Gordon"],
+                    "DEN",
+                    2020,
+                    player_ids=[None, "jokicni01", None, "gordoaa01"],
+                )
+                self.assertListEqual(
+                    names,
+                    ["Nikola Jokic", "Nikola Jokic", "Jamal Murray", "Aaron Gordon"],
+                )
+                self.assertListEqual(
+                    normalize_player_names(["Jamál Murray"], "DEN", 2020),
+                    ["Jamal Murray"],
+                )
+                self.assertListEqual(
+                    get_roster_names("DEN", 2020),
+                    [("Nikola Jokic", "jokicni01"), ("Jamal Murray", "murraja01")],
+                )
+            get_wrapper.assert_called_once_with(
+                "https://www.basketball-reference.com/teams/DEN/2020.html"
+            )
+        finally:
+            utils._roster_names.clear()
+            clear_pages()
+
+
+if __name__ == "__main__":
+    unittest.main()